@@ -0,0 +1,91 @@
+"""
+In-process caching
+Bounded TTL cache and per-key async locks for memoizing external lookups (NTSB)
+"""
+
+import asyncio
+import contextlib
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    LRU cache with a per-entry time to live. Holds at most `maxsize` entries;
+    the least recently used entry is evicted first, expired entries are
+    dropped when they are read.
+    """
+
+    def __init__(
+        self, maxsize: int, timer: Callable[[], float] = time.monotonic
+    ):
+        self.maxsize = maxsize
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return the cached value for key, or None if missing or expired.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The cached value, or None
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= self._timer():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: float) -> None:
+        """
+        Cache value under key for ttl seconds, evicting the least recently
+        used entry if the cache is full.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Seconds until the entry expires
+        """
+        self._data[key] = (self._timer() + ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class KeyedLocks:
+    """
+    One asyncio.Lock per key, created on first use and removed once no task
+    holds or waits for it. Use as `async with locks.hold(key):`.
+    """
+
+    def __init__(self):
+        # key -> [lock, number of tasks holding or waiting for it]
+        self._locks: Dict[Hashable, List[Any]] = {}
+
+    @contextlib.asynccontextmanager
+    async def hold(self, key: Hashable) -> AsyncIterator[None]:
+        """Hold the lock for key for the duration of the block."""
+        entry = self._locks.get(key)
+        if entry is None:
+            entry = self._locks[key] = [asyncio.Lock(), 0]
+        entry[1] += 1
+        try:
+            async with entry[0]:
+                yield
+        finally:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del self._locks[key]
+
+    def __len__(self) -> int:
+        return len(self._locks)
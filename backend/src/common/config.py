@@ -1,4 +1,5 @@
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 import os
@@ -40,6 +41,26 @@ engine = create_engine(
 # Create a sessionmaker
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine (asyncpg) for use inside async request handlers and workflows,
+# so database round-trips don't block the event loop
+ASYNC_DATABASE_URL = DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    connect_args={
+        "ssl": "require",
+        "timeout": 10,
+    },
+    pool_pre_ping=True,
+    pool_recycle=300,
+    pool_timeout=30,
+    pool_size=20,
+    max_overflow=10,
+)
+
+# Create an async sessionmaker
+AsyncSessionLocal = async_sessionmaker(async_engine, expire_on_commit=False)
+
 # LOAD THE JWT SECRET
 JWT_SECRET = os.getenv("SUPABASE_JWT_SECRET")
 JWT_ALGORITHM = "HS256"
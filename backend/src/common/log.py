@@ -0,0 +1,52 @@
+"""
+Logging configuration
+Routes application log records through a queue so request handlers only
+enqueue records; a background listener thread does the actual stream I/O.
+"""
+
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+_listener: Optional[QueueListener] = None
+
+
+def start_logging() -> QueueListener:
+    """
+    Configure the root logger with a QueueHandler and start the listener.
+    Safe to call more than once - the listener is only started the first time.
+
+    Returns:
+        The running QueueListener
+    """
+    global _listener
+
+    if _listener is not None:
+        return _listener
+
+    log_queue: queue.Queue = queue.Queue(-1)
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(LOG_LEVEL)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def stop_logging() -> None:
+    """Flush pending records and stop the background listener."""
+    global _listener
+
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
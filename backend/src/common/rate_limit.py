@@ -0,0 +1,57 @@
+"""
+Rate limiting
+Token-bucket limiter for outbound calls to external providers (NTSB, state UCC sites)
+"""
+
+import asyncio
+import time
+import weakref
+
+
+class AsyncTokenBucket:
+    """
+    Async token bucket: allows bursts up to `rate` calls, refilling at
+    `rate` tokens per `period` seconds. Use as `async with limiter:`.
+
+    Buckets are module-level singletons used from several event loops (the
+    API, the Hatchet worker, verify_ucc_filings_sync), so the lock is created
+    per loop - an asyncio.Lock is bound to the first loop that waits on it.
+    """
+
+    def __init__(self, rate: float, period: float = 1.0):
+        self.capacity = rate
+        self._tokens = rate
+        self._fill_rate = rate / period
+        self._last = time.monotonic()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def _lock(self) -> asyncio.Lock:
+        """Return the lock for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        lock = self._locks.get(loop)
+        if lock is None:
+            lock = self._locks[loop] = asyncio.Lock()
+        return lock
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock():
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._last) * self._fill_rate
+                )
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+
+    async def __aenter__(self) -> "AsyncTokenBucket":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
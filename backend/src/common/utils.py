@@ -1,8 +1,49 @@
 # utils
+from decimal import Decimal
+import gzip
+import orjson
 from supabase import create_client, Client
 import os
+import re
+
+# Default score for components without data yet (e.g. AOG)
+DEC_100 = Decimal(100)
+
+# Any character that is not a letter or digit (matches str.isalnum semantics)
+_SAFE_NAME_RE = re.compile(r"[\W_]")
 
 def get_supabase_client() -> Client:
     url: str = os.getenv("SUPABASE_URL")
     key: str = os.getenv("SUPABASE_KEY")
-    return create_client(url, key)
\ No newline at end of file
+    return create_client(url, key)
+
+def safe_name(name: str) -> str:
+    """Replace every non-alphanumeric character with an underscore for use in paths."""
+    return _SAFE_NAME_RE.sub("_", name)
+
+def ensure_dir(path: str) -> str:
+    """
+    Create a directory if it is missing and return its path. Not cached, so a
+    directory removed at runtime (cleanup job, tmp reaper) is recreated.
+    """
+    os.makedirs(path, exist_ok=True)
+    return path
+
+def to_decimal(value) -> Decimal:
+    """Convert a score to Decimal; Decimals pass through, ints skip the string round-trip floats need."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, int):
+        return Decimal(value)
+    return Decimal(str(value))
+
+def write_json_gz(filepath: str, data) -> None:
+    """
+    Write data as compact gzipped JSON, creating parent folders as needed.
+    Blocking - call via asyncio.to_thread from async code.
+    """
+    ensure_dir(os.path.dirname(filepath))
+    # Compact JSON + gzip level 3: much smaller audit files at low CPU cost
+    payload = gzip.compress(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str), compresslevel=3)
+    with open(filepath, "wb") as f:
+        f.write(payload)
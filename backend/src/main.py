@@ -7,8 +7,14 @@ from src.organization.router import organization_router
 from src.operator.router import operator_router
 from src.trustscore.router import trustscore_router
 from src.user.router import user_router
-from src.scoring.router import scoring_router
+from src.scoring.router import (
+  scoring_router,
+  start_workflow_run_id_flusher,
+  stop_workflow_run_id_flusher,
+)
 from src.common.error import AuthError, HTTPError, exception_handler
+from src.common.log import start_logging, stop_logging
+from src.scoring.service import close_ntsb_http_client
 
 app = FastAPI()
 
@@ -21,6 +27,26 @@ app.add_middleware(
   allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def startup_logging():
+  start_logging()
+
+@app.on_event("startup")
+async def startup_workflow_run_id_flusher():
+  start_workflow_run_id_flusher()
+
+@app.on_event("shutdown")
+async def shutdown_workflow_run_id_flusher():
+  await stop_workflow_run_id_flusher()
+
+@app.on_event("shutdown")
+async def shutdown_http_clients():
+  await close_ntsb_http_client()
+
+@app.on_event("shutdown")
+async def shutdown_logging():
+  stop_logging()
+
 @app.exception_handler(AuthError)
 async def auth_error_handler(request: Request, exc: AuthError):
   return JSONResponse(
@@ -4,7 +4,7 @@ Pydantic models for charter operator data validation
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, NamedTuple
 from datetime import datetime
 
 
@@ -42,6 +42,12 @@ class OperatorData(BaseModel):
     url: Optional[str] = None
 
 
+class CharterOperatorRef(NamedTuple):
+    """Lightweight operator projection (name + FAA state) for batch jobs"""
+    company: str
+    faa_state: Optional[str] = None
+
+
 class CharterOperatorBase(BaseModel):
     """Base schema for charter operator"""
     company: str
@@ -3,13 +3,15 @@ Charter Operator Service
 Business logic for charter operator operations using Supabase RPC functions
 """
 
+import asyncio
 from typing import List, Optional
 from src.common.supabase import get_supabase_client
 from src.operator.charter_schemas import (
     CharterOperator,
     CharterOperatorCreate,
     CharterOperatorUpdate,
-    CharterOperatorResponse
+    CharterOperatorResponse,
+    CharterOperatorRef
 )
 
 
@@ -56,6 +58,46 @@ async def get_charter_operators(
         raise
 
 
+async def list_charter_operator_refs(
+    operator_ids: Optional[List[str]] = None
+) -> List[CharterOperatorRef]:
+    """
+    List charter operators' names and FAA states
+    Uses RPC function that projects only those columns from gtj.operators,
+    avoiding full operator payloads and Pydantic hydration for batch jobs
+
+    Args:
+        operator_ids: Optional operator UUIDs; when given, only those operators
+            are returned, fetched in a single query
+
+    Returns:
+        List of CharterOperatorRef tuples
+    """
+    try:
+        supabase = get_supabase_client()
+
+        if operator_ids:
+            rpc = supabase.rpc(
+                'list_charter_operator_states_by_ids',
+                {'p_operator_ids': operator_ids}
+            )
+        else:
+            rpc = supabase.rpc('list_charter_operator_states')
+
+        # supabase-py is synchronous; run the RPC in a worker thread so the
+        # batch workflow's event loop keeps serving in-flight verifications
+        response = await asyncio.to_thread(rpc.execute)
+
+        return [
+            CharterOperatorRef(row['company'], row.get('faa_state'))
+            for row in response.data or []
+        ]
+
+    except Exception as e:
+        print(f"Error listing charter operators: {e}")
+        raise
+
+
 async def get_charter_operator_by_id(charter_operator_id: str) -> Optional[CharterOperator]:
     """
     Get a single charter operator by ID
@@ -1,42 +1,115 @@
 # src/scoring/router.py
 import os
-import json
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException
+import asyncio
+import contextlib
+import logging
+from pathlib import Path
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
 from pydantic import UUID4
 from datetime import datetime, timedelta
-from decimal import Decimal
+import orjson
+from browserbase import Browserbase
 from src.scoring.schemas import NTSBQueryRequest, ScoreCalculationResponse
-from src.scoring.service import ScoringService
-from src.scoring.ucc_service import UCCVerificationService
-from src.trustscore.calculator import (
-    TrustScoreCalculator,
-    FleetScoreData,
-    TailScoreData,
+from src.scoring.service import ScoringService, NTSBService
+from src.scoring.steps import (
+    ntsb_score_for,
+    run_ntsb_and_ucc_steps,
+    run_trust_score_step,
 )
-from src.trustscore.llm_client import LLMClient, LLMProvider
+from src.scoring.ucc_service import create_browserbase_session
 from src.common.dependencies import get_db
 from src.auth.service import authentication
 from src.common.error import HTTPError
+from src.common.utils import DEC_100, ensure_dir, safe_name, to_decimal, write_json_gz
 from src.common.models import Operator, TrustScore
+from src.common.config import AsyncSessionLocal
 from src.hatchet_client import hatchet
-from src.workflows.batch_verify_workflow import batch_verify_workflow
+from src.workflows.batch_verify_workflow import (
+    batch_verify_workflow,
+    build_trust_score_factors,
+)
 
 # Directory for storing verification results
-VERIFICATION_RESULTS_DIR = os.path.join(os.path.dirname(__file__), "../../data/temp")
+VERIFICATION_RESULTS_DIR = (Path(__file__).parent / "../../data/temp").resolve()
 os.makedirs(VERIFICATION_RESULTS_DIR, exist_ok=True)
 
+# Hatchet workflow run IDs, read by ./run_production.sh cancel-all logs/workflows.txt
+WORKFLOWS_FILE = (Path(__file__).parent / "../../logs/workflows.txt").resolve()
+
+# Run IDs are buffered in memory and appended to WORKFLOWS_FILE in one write
+# once this many are pending, or every WORKFLOWS_FLUSH_INTERVAL seconds
+WORKFLOWS_FLUSH_SIZE = 32
+WORKFLOWS_FLUSH_INTERVAL = 5.0
+_pending_workflow_run_ids: List[str] = []
+_workflow_flush_task: Optional[asyncio.Task] = None
+
+# Banner separator used in log output
+_BAR = "=" * 80
+
+logger = logging.getLogger(__name__)
+
+
+def _append_workflow_run_ids(workflow_run_ids: List[str]) -> None:
+    """Append workflow run IDs to WORKFLOWS_FILE, one per line (blocking)."""
+    ensure_dir(str(WORKFLOWS_FILE.parent))
+    with open(WORKFLOWS_FILE, "a") as f:
+        f.write("".join(f"{run_id}\n" for run_id in workflow_run_ids))
+
+
+async def flush_workflow_run_ids() -> None:
+    """Write all buffered workflow run IDs to WORKFLOWS_FILE in a worker thread."""
+    if not _pending_workflow_run_ids:
+        return
+    workflow_run_ids = _pending_workflow_run_ids[:]
+    _pending_workflow_run_ids.clear()
+    try:
+        await asyncio.to_thread(_append_workflow_run_ids, workflow_run_ids)
+    except Exception as e:
+        logger.error("❌ Failed to record workflow run IDs %s: %s", workflow_run_ids, e)
+
+
+async def _flush_workflow_run_ids_periodically() -> None:
+    while True:
+        await asyncio.sleep(WORKFLOWS_FLUSH_INTERVAL)
+        await flush_workflow_run_ids()
+
+
+def start_workflow_run_id_flusher() -> None:
+    """Start the background task that periodically flushes buffered run IDs."""
+    global _workflow_flush_task
+    if _workflow_flush_task is None:
+        _workflow_flush_task = asyncio.create_task(_flush_workflow_run_ids_periodically())
+
+
+async def stop_workflow_run_id_flusher() -> None:
+    """Stop the periodic flush and write any run IDs still buffered."""
+    global _workflow_flush_task
+    if _workflow_flush_task is not None:
+        _workflow_flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _workflow_flush_task
+        _workflow_flush_task = None
+    await flush_workflow_run_ids()
+
+
+def _dump_debug_json(data) -> str:
+    """Pretty-print a payload for debug logs using orjson."""
+    return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str).decode()
+
+
 scoring_router = APIRouter()
 
 # Special operator state mappings (for testing specific flows)
 OPERATOR_STATE_OVERRIDES = {
     "Aero Air LLC": "Oregon",
 }
-
-# States with UCC scraper ready - UCC flow will only scrape these states
-# Add more states here as scrapers become available (e.g., ["CA", "FL"])
-UCC_READY_STATES = ["CA"]
+# Case-insensitive lookup table, keyed by lower-cased operator name
+_OPERATOR_STATE_OVERRIDES_LOWER = {
+    name.lower(): override for name, override in OPERATOR_STATE_OVERRIDES.items()
+}
 
 # Test filter for batch verification - only process these operators
 # Set to None or empty list to process all operators matching state filter
@@ -44,14 +117,14 @@ UCC_READY_STATES = ["CA"]
 # BATCH_TEST_OPERATORS = ["GO FLY LLC."]  # Set to None to disable filter
 BATCH_TEST_OPERATORS = None
 
-
-def save_trust_score_to_supabase(
+async def save_trust_score_to_supabase(
     operator_name: str,
     trust_score_result: dict,
     ntsb_result: dict,
     ucc_result: dict,
     argus_rating: str = None,
-    wyvern_rating: str = None
+    wyvern_rating: str = None,
+    operator_id=None
 ) -> bool:
     """
     Save trust score results to Supabase database.
@@ -64,90 +137,90 @@ def save_trust_score_to_supabase(
         ucc_result: UCC verification result
         argus_rating: ARGUS certification rating
         wyvern_rating: Wyvern certification rating
+        operator_id: Operator id, if the caller already loaded the operator;
+            skips the lookup by name
 
     Returns:
         True if saved successfully, False otherwise
     """
-    from src.common.config import SessionLocal
-
-    db = SessionLocal()
-    try:
-        # Find the operator
-        operator = db.query(Operator).filter(Operator.name == operator_name).first()
-
-        if not operator:
-            print(f"  ⚠️  Operator '{operator_name}' not found in gtj.operators table")
-            return False
-
-        # Extract scores from trust_score_result
-        overall_score = trust_score_result.get('trust_score', 0)
-        fleet_score = trust_score_result.get('fleet_score', overall_score)
-        tail_score = trust_score_result.get('tail_score', 100)
-        operator_score = trust_score_result.get('operator_score', 100)
-        confidence_score = trust_score_result.get('confidence_score', 0.8)
-
-        # Extract financial score from fleet_breakdown final_score
-        fleet_breakdown = trust_score_result.get('fleet_breakdown', {})
-        financial_score = fleet_breakdown.get('final_score', 100)
-
-        # Update operator's trust_score
-        operator.trust_score = Decimal(str(overall_score))
-        operator.trust_score_updated_at = datetime.utcnow()
+    async with AsyncSessionLocal() as db:
+        try:
+            # Extract scores from trust_score_result
+            overall_score = trust_score_result.get('trust_score', 0)
+            fleet_score = trust_score_result.get('fleet_score', overall_score)
+            operator_score = trust_score_result.get('operator_score', 100)
+            confidence_score = trust_score_result.get('confidence_score', 0.8)
+
+            overall_score_dec = to_decimal(overall_score)
+
+            # Extract financial score from fleet_breakdown final_score
+            fleet_breakdown = trust_score_result.get('fleet_breakdown', {})
+            financial_score = fleet_breakdown.get('final_score', 100)
+
+            if operator_id is None:
+                # Resolve the operator by name inside the UPDATE itself
+                operator_match = Operator.operator_id == (
+                    select(Operator.operator_id)
+                    .where(Operator.name == operator_name)
+                    .limit(1)
+                    .scalar_subquery()
+                )
+            else:
+                operator_match = Operator.operator_id == operator_id
 
-        # Build comprehensive factors JSON
-        factors = {
-            "ntsb": {
-                "score": ntsb_result.get('score', 100),
-                "total_incidents": ntsb_result.get('total_incidents', 0),
-                "incidents": ntsb_result.get('incidents', [])
-            },
-            "ucc": {
-                "status": ucc_result.get('status', 'unknown'),
-                "states_processed": ucc_result.get('states_processed', 0),
-                "visited_states": ucc_result.get('visited_states', [])
-            },
-            "scores": {
-                "fleet_score": fleet_score,
-                "tail_score": tail_score,
-                "operator_score": operator_score,
-                "raw_combined_score": trust_score_result.get('raw_combined_score', 0),
-                "score_tier": trust_score_result.get('score_tier', 'Unknown')
-            },
-            "fleet_breakdown": fleet_breakdown,
-            "tail_breakdown": trust_score_result.get('tail_breakdown', {}),
-            "certifications": {
-                "argus_rating": argus_rating,
-                "wyvern_rating": wyvern_rating
-            },
-            "ai_insights": trust_score_result.get('ai_insights', None)
-        }
+            factors = build_trust_score_factors(
+                trust_score_result, ntsb_result, ucc_result, argus_rating, wyvern_rating
+            )
 
-        # Create trust_scores record with enriched data
-        trust_score_record = TrustScore(
-            operator_id=operator.operator_id,
-            overall_score=Decimal(str(overall_score)),
-            safety_score=Decimal(str(fleet_score)),
-            financial_score=Decimal(str(financial_score)),
-            regulatory_score=Decimal(str(operator_score)),
-            aog_score=Decimal(str(100)),  # Default, no AOG data yet
-            factors=factors,
-            version="3.0",  # Algorithm v3
-            expires_at=datetime.utcnow() + timedelta(days=30),
-            confidence_level=Decimal(str(confidence_score))
-        )
+            # One transaction, two Core statements: UPDATE ... RETURNING replaces
+            # the SELECT + ORM flush, and the trust_scores row is a plain INSERT
+            async with db.begin():
+                # Update operator's trust_score
+                operator_id = (
+                    await db.execute(
+                        update(Operator)
+                        .where(operator_match)
+                        .values(
+                            trust_score=overall_score_dec,
+                            trust_score_updated_at=datetime.utcnow(),
+                        )
+                        .returning(Operator.operator_id)
+                    )
+                ).scalar()
 
-        db.add(trust_score_record)
-        db.commit()
+                if operator_id is None:
+                    logger.warning(
+                        "  ⚠️  Operator '%s' not found in gtj.operators table",
+                        operator_name,
+                    )
+                    return False
+
+                # Create trust_scores record with enriched data
+                await db.execute(
+                    insert(TrustScore).values(
+                        operator_id=operator_id,
+                        overall_score=overall_score_dec,
+                        safety_score=to_decimal(fleet_score),
+                        financial_score=to_decimal(financial_score),
+                        regulatory_score=to_decimal(operator_score),
+                        aog_score=DEC_100,  # Default, no AOG data yet
+                        factors=factors,
+                        version="3.0",  # Algorithm v3
+                        expires_at=datetime.utcnow() + timedelta(days=30),
+                        confidence_level=to_decimal(confidence_score)
+                    )
+                )
 
-        print(f"  ✓ Saved trust score {overall_score} for {operator_name} to gtj.operators and gtj.trust_scores")
-        return True
+            logger.info(
+                "  ✓ Saved trust score %s for %s to gtj.operators and gtj.trust_scores",
+                overall_score,
+                operator_name,
+            )
+            return True
 
-    except Exception as e:
-        print(f"  ❌ Error saving to Supabase for {operator_name}: {e}")
-        db.rollback()
-        return False
-    finally:
-        db.close()
+        except Exception as e:
+            logger.error("  ❌ Error saving to Supabase for %s: %s", operator_name, e)
+            return False
 
 
 @scoring_router.post(
@@ -216,7 +289,9 @@ async def scoring_health_check():
     response_description="NTSB incidents and calculated score",
     tags=["scoring"],
 )
-async def query_ntsb_by_name(operator_name: str):
+async def query_ntsb_by_name(
+    operator_name: str, response: Response, force_refresh: bool = False
+):
     """
     Query NTSB database directly by operator name.
 
@@ -225,6 +300,7 @@ async def query_ntsb_by_name(operator_name: str):
 
     Args:
         operator_name: Name of the operator to search for
+        force_refresh: If True, bypass the cached NTSB response
 
     Returns:
         ScoreCalculationResponse: Score and incident details
@@ -233,41 +309,44 @@ async def query_ntsb_by_name(operator_name: str):
         HTTPException: If NTSB API query fails
     """
     try:
-        from src.scoring.service import NTSBService
-
         # Query NTSB directly
-        print(f"\n{'='*80}")
-        print(f"QUERYING NTSB FOR OPERATOR: {operator_name}")
-        print(f"{'='*80}")
+        logger.debug("\n%s", _BAR)
+        logger.info("QUERYING NTSB FOR OPERATOR: %s", operator_name)
+        logger.debug("%s", _BAR)
 
-        ntsb_data = await NTSBService.query_ntsb_incidents(operator_name)
-
-        print(f"\nNTSB Response Type: {type(ntsb_data)}")
-        print(
-            f"NTSB Response Keys: {ntsb_data.keys() if isinstance(ntsb_data, dict) else 'Not a dict'}"
+        # Expose whether the NTSB cache served this request (hit, neg or miss)
+        response.headers["X-NTSB-Cache"] = (
+            "miss" if force_refresh else NTSBService.cache_status(operator_name)
+        )
+        ntsb_data = await NTSBService.query_ntsb_incidents(
+            operator_name, force_refresh=force_refresh
         )
-        print(f"\n{'='*80}")
-        print(f"FULL NTSB RESPONSE DATA:")
-        print(f"{'='*80}")
-
-        import json
-
-        print(json.dumps(ntsb_data, indent=2, default=str))
 
-        print(f"\n{'='*80}")
+        logger.debug("NTSB Response Type: %s", type(ntsb_data))
+        logger.debug(
+            "NTSB Response Keys: %s",
+            ntsb_data.keys() if isinstance(ntsb_data, dict) else 'Not a dict',
+        )
+        # Only serialize the full payload when debug logging is on
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("\n%s", _BAR)
+            logger.debug("FULL NTSB RESPONSE DATA:")
+            logger.debug("%s", _BAR)
+            logger.debug(_dump_debug_json(ntsb_data))
+            logger.debug("\n%s", _BAR)
 
         # Parse incidents
         incidents = NTSBService.parse_ntsb_response(ntsb_data)
-        print(f"\nParsed {len(incidents)} incidents")
+        logger.info("Parsed %s incidents", len(incidents))
 
-        print(f"\n{'='*80}")
-        print(f"PARSED INCIDENTS:")
-        print(f"{'='*80}")
-        import json
+        logger.debug("\n%s", _BAR)
+        logger.debug("PARSED INCIDENTS:")
+        logger.debug("%s", _BAR)
 
-        for i, incident in enumerate(incidents, 1):
-            print(f"\nIncident {i}:")
-            print(json.dumps(incident.dict(), indent=2, default=str))
+        if logger.isEnabledFor(logging.DEBUG):
+            for i, incident in enumerate(incidents, 1):
+                logger.debug("\nIncident %s:", i)
+                logger.debug(_dump_debug_json(incident.model_dump()))
 
         # Calculate simple score based on incidents
         total_incidents = len(incidents)
@@ -275,12 +354,12 @@ async def query_ntsb_by_name(operator_name: str):
         # Simple scoring: 100 - (incidents * 5), minimum 0
         ntsb_score = max(0, 100 - (total_incidents * 5))
 
-        print(f"\n{'='*80}")
-        print(f"FINAL CALCULATION:")
-        print(f"{'='*80}")
-        print(f"Total Incidents: {total_incidents}")
-        print(f"NTSB Score: {ntsb_score}")
-        print(f"{'='*80}\n")
+        logger.debug("\n%s", _BAR)
+        logger.debug("FINAL CALCULATION:")
+        logger.debug("%s", _BAR)
+        logger.info("Total Incidents: %s", total_incidents)
+        logger.info("NTSB Score: %s", ntsb_score)
+        logger.debug("%s\n", _BAR)
 
         return ScoreCalculationResponse(
             operator_id=None,  # No operator in database
@@ -292,13 +371,10 @@ async def query_ntsb_by_name(operator_name: str):
         )
 
     except HTTPError as e:
-        print(f"HTTPError: {e.detail}")
+        logger.error("HTTPError: %s", e.detail)
         raise HTTPException(status_code=400, detail=str(e.detail))
     except Exception as e:
-        print(f"Exception: {type(e).__name__}: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("Exception: %s: %s", type(e).__name__, str(e))
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
 
@@ -314,9 +390,6 @@ async def start_browserbase_session(operator_name: str):
     Returns the session URL immediately so user can watch live.
     """
     try:
-        from browserbase import Browserbase
-        import os
-
         browserbase_api_key = os.getenv("BROWSERBASE_API_KEY")
         browserbase_project_id = os.getenv("BROWSERBASE_PROJECT_ID")
 
@@ -327,16 +400,18 @@ async def start_browserbase_session(operator_name: str):
 
         # Create session
         bb = Browserbase(api_key=browserbase_api_key)
-        session = bb.sessions.create(project_id=browserbase_project_id, proxies=False)
+        session = await create_browserbase_session(
+            bb, project_id=browserbase_project_id, proxies=False
+        )
 
         session_id = session.id
 
         # Get the debugger fullscreen URL for iframe embedding
-        live_view_links = bb.sessions.debug(session_id)
+        live_view_links = await asyncio.to_thread(bb.sessions.debug, session_id)
         debugger_fullscreen_url = live_view_links.debugger_fullscreen_url
 
-        print(f"✓ Browserbase session created: {session_id}")
-        print(f"✓ Live view URL: {debugger_fullscreen_url}")
+        logger.info("✓ Browserbase session created: %s", session_id)
+        logger.info("✓ Live view URL: %s", debugger_fullscreen_url)
 
         return {
             "session_id": session_id,
@@ -346,12 +421,72 @@ async def start_browserbase_session(operator_name: str):
         }
 
     except Exception as e:
-        print(f"❌ Error creating session: {str(e)}")
+        logger.error("❌ Error creating session: %s", str(e))
         raise HTTPException(
             status_code=500, detail=f"Failed to create session: {str(e)}"
         )
 
 
+async def _load_operator_profile(
+    operator_name: str,
+) -> Tuple[Optional[UUID4], float, Optional[str], Optional[str]]:
+    """
+    Look up the operator's id, age and certification ratings in gtj.operators.
+    Never raises - missing operators and DB errors fall back to defaults.
+
+    Returns:
+        Tuple of (operator id or None, operator age in years, ARGUS rating,
+        Wyvern rating)
+    """
+    operator_id = None
+    operator_age_years = 10.0  # Default fallback
+    argus_rating = None  # Default fallback
+    wyvern_rating = None  # Default fallback
+
+    try:
+        async with AsyncSessionLocal() as db:
+            operator = (
+                await db.execute(
+                    select(Operator).where(Operator.name == operator_name)
+                )
+            ).scalars().first()
+
+        if operator:
+            operator_id = operator.operator_id
+
+            # Calculate operator age in years from business_started_date
+            if operator.business_started_date:
+                years_diff = (
+                    datetime.now() - operator.business_started_date
+                ).days / 365.25
+                operator_age_years = round(years_diff, 1)
+                logger.info(
+                    "✓ Operator age calculated: %s years (started: %s)",
+                    operator_age_years,
+                    operator.business_started_date,
+                )
+            else:
+                logger.warning(
+                    "⚠️  No business_started_date found for operator, using default: %s years",
+                    operator_age_years,
+                )
+
+            # Fetch ARGUS and Wyvern ratings
+            argus_rating = operator.argus_rating
+            wyvern_rating = operator.wyvern_rating
+            logger.info(
+                "✓ ARGUS rating: %s, Wyvern rating: %s",
+                argus_rating or 'None',
+                wyvern_rating or 'None',
+            )
+        else:
+            logger.warning("⚠️  Operator not found in database, using default values")
+    except Exception as e:
+        logger.warning("⚠️  Error fetching operator data: %s, using default values", e)
+
+    return operator_id, operator_age_years, argus_rating, wyvern_rating
+
+
 @scoring_router.post(
     "/scoring/full-scoring-flow",
     summary="Run full scoring flow (NTSB + UCC) for an operator",
@@ -359,7 +494,12 @@ async def start_browserbase_session(operator_name: str):
     tags=["scoring"],
 )
 async def full_scoring_flow(
-    operator_name: str, faa_state: str, state: str = None, session_id: str = None
+    operator_name: str,
+    faa_state: str,
+    state: str = None,
+    session_id: str = None,
+    force_refresh: bool = False,
+    keep_raw: bool = False,
 ):
     """
     Run full scoring flow including NTSB and UCC checks.
@@ -375,220 +515,76 @@ async def full_scoring_flow(
         faa_state: FAA state code (2-letter abbreviation) from database - used as fallback
         state: Optional state code for UCC search override
         session_id: Optional existing Browserbase session ID
+        force_refresh: If True, bypass the cached NTSB response
+        keep_raw: If True, keep the raw NTSB response inline in the result
+            instead of a sibling .ntsb.json.gz file
 
     Returns:
         Combined scoring results with NTSB and UCC data
     """
     try:
-        from src.scoring.service import NTSBService
-
         # Check for operator-specific state overrides
-        if state is None and operator_name in OPERATOR_STATE_OVERRIDES:
-            state = OPERATOR_STATE_OVERRIDES[operator_name]
-            print(f"📍 Using operator-specific state override: {state}")
+        if state is None:
+            state = _OPERATOR_STATE_OVERRIDES_LOWER.get(operator_name.lower())
+            if state:
+                logger.info("📍 Using operator-specific state override: %s", state)
 
-        print(f"\n{'='*80}")
-        print(f"FULL SCORING FLOW FOR: {operator_name}")
+        logger.debug("\n%s", _BAR)
+        logger.info("FULL SCORING FLOW FOR: %s", operator_name)
         if state:
-            print(f"State: {state}")
+            logger.info("State: %s", state)
         else:
-            print("State: Will be determined from NTSB results")
+            logger.info("State: Will be determined from NTSB results")
         if session_id:
-            print(f"Using existing session: {session_id}")
-        print(f"{'='*80}\n")
-
-        # Step 1: Query NTSB
-        print("Step 1: Querying NTSB database...")
-        ntsb_error = None
-        try:
-            ntsb_data = await NTSBService.query_ntsb_incidents(operator_name)
-            incidents = NTSBService.parse_ntsb_response(ntsb_data)
-            total_incidents = len(incidents)
-            ntsb_score = max(0, 100 - (total_incidents * 5))
-            print(
-                f"✓ NTSB check complete: {total_incidents} incidents found, score: {ntsb_score}"
-            )
-        except Exception as e:
-            ntsb_error = str(e)
-            print(f"⚠️  NTSB check failed: {ntsb_error}")
-            print("  → Continuing with default values (no incidents, score: 100)")
-            ntsb_data = {"Results": []}
-            incidents = []
-            total_incidents = 0
-            ntsb_score = 100.0
-
-        # Step 2: Verify UCC filings
-        print("\nStep 2: Verifying UCC filings with Browserbase...")
-        ucc_error = None
-        try:
-            ucc_service = UCCVerificationService()
-            # Pass raw NTSB results (Results array) to UCC service, not parsed incidents
-            ntsb_results = ntsb_data.get("Results", [])
-            ucc_data = await ucc_service.verify_ucc_filings_with_session(
-                operator_name,
-                ntsb_results,
-                faa_state,
-                state,
-                session_id,
-                UCC_READY_STATES,
-            )
-            print(f"✓ UCC check complete: {ucc_data.get('status')}")
-        except Exception as e:
-            ucc_error = str(e)
-            print(f"⚠️  UCC check failed: {ucc_error}")
-            print("  → Continuing with default values (no UCC data)")
-            ucc_data = {
-                "status": "failed",
-                "error": ucc_error,
-                "visited_states": [],
-                "states_processed": 0,
-            }
-
-        # Step 3: Calculate TrustScore using gathered data
-        print("\nStep 3: Calculating TrustScore...")
-        trust_score_error = None
-
-        try:
-            # Extract UCC filings from the verification result
-            ucc_filings = []
-            visited_states = ucc_data.get("visited_states", [])
-            for state_result in visited_states:
-                if state_result.get("flow_used") and state_result.get("flow_result"):
-                    flow_result = state_result["flow_result"]
-                    # Use normalized_filings instead of raw filings
-                    normalized_filings = flow_result.get("normalized_filings", [])
-                    for filing in normalized_filings:
-                        ucc_filings.append(
-                            {
-                                "file_number": filing.get("file_number", "Unknown"),
-                                "status": filing.get("status", "Unknown"),
-                                "filing_date": filing.get("filing_date", "Unknown"),
-                                "lapse_date": filing.get("lapse_date", "Unknown"),
-                                "lien_type": filing.get("lien_type", "Unknown"),
-                                "debtor": filing.get("debtor", "Unknown"),
-                                "secured_party": filing.get("secured_party", None),
-                                "collateral": filing.get("collateral", None),
-                                "state": state_result.get("state", "Unknown"),
-                            }
-                        )
-
-            # Convert NTSB incidents to dict format for TrustScore calculator (Algorithm v3)
-            fleet_events = [incident.dict() for incident in incidents]
-            ntsb_incidents_dict = fleet_events  # Keep reference for result output
-
-            # Fetch operator data from database to get business_started_date
-            from src.common.models import Operator
-            from src.common.config import SessionLocal
-
-            operator_age_years = 10.0  # Default fallback
-            fleet_size = 1  # Default fallback
-            argus_rating = None  # Default fallback
-            wyvern_rating = None  # Default fallback
-
-            try:
-                db = SessionLocal()
-                operator = (
-                    db.query(Operator).filter(Operator.name == operator_name).first()
-                )
-
-                if operator:
-                    # Calculate operator age in years from business_started_date
-                    if operator.business_started_date:
-                        years_diff = (
-                            datetime.now() - operator.business_started_date
-                        ).days / 365.25
-                        operator_age_years = round(years_diff, 1)
-                        print(
-                            f"✓ Operator age calculated: {operator_age_years} years (started: {operator.business_started_date})"
-                        )
-                    else:
-                        print(
-                            f"⚠️  No business_started_date found for operator, using default: {operator_age_years} years"
-                        )
-
-                    # Fetch ARGUS and Wyvern ratings
-                    argus_rating = operator.argus_rating
-                    wyvern_rating = operator.wyvern_rating
-                    print(
-                        f"✓ ARGUS rating: {argus_rating or 'None'}, Wyvern rating: {wyvern_rating or 'None'}"
-                    )
-                else:
-                    print(f"⚠️  Operator not found in database, using default values")
-
-                db.close()
-            except Exception as e:
-                print(f"⚠️  Error fetching operator data: {e}, using default values")
-
-            # Create FleetScoreData (Algorithm v3)
-            fleet_data = FleetScoreData(
-                operator_name=operator_name,
-                operator_age_years=operator_age_years,
-                fleet_size=fleet_size,  # Default - would need to be fetched from operator data
-                fleet_events=fleet_events,  # All fleet-wide events (NTSB + FAA)
-                ucc_filings=ucc_filings,
-                argus_rating=argus_rating,
-                wyvern_rating=wyvern_rating,
-                bankruptcy_history=None,
+            logger.info("Using existing session: %s", session_id)
+        logger.debug("%s\n", _BAR)
+
+        # Steps 1 & 2: Query NTSB and verify UCC filings - concurrently unless
+        # UCC needs the NTSB incident states
+        ntsb_data, incidents, ntsb_error, ucc_data, ucc_error = (
+            await run_ntsb_and_ucc_steps(
+                operator_name, faa_state, state, session_id, force_refresh
             )
+        )
 
-            # Create TailScoreData (placeholder - would need aircraft-specific data)
-            tail_data = TailScoreData(
-                aircraft_age_years=5.0,  # Default placeholder
-                operator_name=operator_name,
-                registered_owner=operator_name,  # Assume same as operator
-                fractional_owner=False,
-                tail_events=fleet_events,  # Tail-specific events
-            )
+        total_incidents = len(incidents)
+        ntsb_score = ntsb_score_for(incidents, ntsb_error)
+        # Incident dicts are reused for TrustScore input, result and DB save
+        ntsb_incidents_dict = incidents
 
-            # Initialize calculator with LLM for AI insights
-            try:
-                llm_client = LLMClient(provider=LLMProvider.OPENROUTER)
-                calculator = TrustScoreCalculator(llm_client=llm_client)
-                print("✓ Using LLM for AI insights")
-            except Exception as e:
-                print(f"⚠️  LLM unavailable, using calculator without AI insights: {e}")
-                calculator = TrustScoreCalculator(llm_client=None)
-
-            # Calculate TrustScore
-            trust_score_result = await calculator.calculate_trust_score(
-                fleet_data, tail_data
-            )
-            print(f"✓ TrustScore calculated: {trust_score_result['trust_score']}")
+        # Operator row is loaded once: its id is reused by the Supabase save
+        operator_id, operator_age_years, argus_rating, wyvern_rating = (
+            await _load_operator_profile(operator_name)
+        )
 
-        except Exception as e:
-            trust_score_error = str(e)
-            print(f"⚠️  TrustScore calculation failed: {trust_score_error}")
-            print(f"  → Using fallback calculation based on NTSB score: {ntsb_score}")
-            # Set default values
-            ntsb_incidents_dict = (
-                [incident.dict() for incident in incidents] if incidents else []
-            )
-            argus_rating = None
-            wyvern_rating = None
-            # Use NTSB score as fallback trust score if available
-            fallback_score = ntsb_score if ntsb_score is not None else 50.0
-            trust_score_result = {
-                "trust_score": fallback_score,
-                "fleet_score": fallback_score,
-                "tail_score": fallback_score,
-                "error": trust_score_error,
-                "fallback": True,
-            }
+        # Step 3: Calculate TrustScore using gathered data
+        trust_score_result, trust_score_error = await run_trust_score_step(
+            operator_name,
+            ntsb_incidents_dict,
+            ucc_data,
+            ntsb_score,
+            operator_age_years,
+            argus_rating,
+            wyvern_rating,
+        )
 
         # Determine overall status
-        has_errors = any([ntsb_error, ucc_error, trust_score_error])
+        has_errors = bool(ntsb_error or ucc_error or trust_score_error)
         overall_status = "completed_with_errors" if has_errors else "completed"
 
+        # One clock read drives verification_date and the saved file names
+        verified_at = datetime.now()
+
         # Combine results
         result = {
             "operator_name": operator_name,
-            "verification_date": datetime.now().isoformat(),
+            "verification_date": verified_at.isoformat(),
             # NTSB Results
             "ntsb": {
                 "score": ntsb_score,
                 "total_incidents": total_incidents,
                 "incidents": ntsb_incidents_dict,
-                "raw_response": ntsb_data,
+                "raw_response": ntsb_data if keep_raw else None,
                 "error": ntsb_error,  # Will be None if successful
             },
             # UCC Results
@@ -610,28 +606,39 @@ async def full_scoring_flow(
         }
 
         # Save combined verification result to single JSON file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_operator_name = "".join(c if c.isalnum() else "_" for c in operator_name)
+        timestamp = verified_at.strftime("%Y%m%d_%H%M%S")
+        safe_operator_name = safe_name(operator_name)
 
         # Create operator-specific folder: YYYYMMDD/operator_name
-        date_only = datetime.now().strftime("%Y%m%d")
+        date_only = timestamp[:8]
         folder_name = f"{date_only}/{safe_operator_name}"
         operator_folder = os.path.join(VERIFICATION_RESULTS_DIR, folder_name)
-        os.makedirs(operator_folder, exist_ok=True)
 
         # Save verification result in the operator folder
-        filename = f"verification_result_{safe_operator_name}_{timestamp}.json"
+        filename = f"verification_result_{safe_operator_name}_{timestamp}.json.gz"
         filepath = os.path.join(operator_folder, filename)
 
-        with open(filepath, "w") as f:
-            json.dump(result, f, indent=2, default=str)
-        print(f"✓ Verification result saved to: {filepath}")
+        # Store the raw NTSB payload in a sibling file unless asked to keep it inline
+        writes = []
+        if not keep_raw:
+            raw_filename = f"verification_result_{safe_operator_name}_{timestamp}.ntsb.json.gz"
+            result["ntsb"]["raw_response_file"] = raw_filename
+            writes.append(
+                asyncio.to_thread(
+                    write_json_gz, os.path.join(operator_folder, raw_filename), ntsb_data
+                )
+            )
+        writes.append(asyncio.to_thread(write_json_gz, filepath, result))
+
+        # Serialize and write in worker threads so the event loop isn't blocked
+        await asyncio.gather(*writes)
+        logger.info("✓ Verification result saved to: %s", filepath)
 
         # Add filename to result
         result["saved_file"] = filename
 
         # Save to Supabase database (gtj.operators and gtj.trust_scores)
-        saved_to_db = save_trust_score_to_supabase(
+        saved_to_db = await save_trust_score_to_supabase(
             operator_name=operator_name,
             trust_score_result=trust_score_result,
             ntsb_result={
@@ -641,34 +648,35 @@ async def full_scoring_flow(
             },
             ucc_result=ucc_data,
             argus_rating=argus_rating,
-            wyvern_rating=wyvern_rating
+            wyvern_rating=wyvern_rating,
+            operator_id=operator_id
         )
         result["saved_to_supabase"] = saved_to_db
 
-        print(f"\n{'='*80}")
-        print(f"FULL SCORING FLOW COMPLETED - Status: {overall_status.upper()}")
+        logger.debug("\n%s", _BAR)
+        logger.info("FULL SCORING FLOW COMPLETED - Status: %s", overall_status.upper())
         if has_errors:
-            print(f"⚠️  Some steps encountered errors but flow completed:")
+            logger.warning("⚠️  Some steps encountered errors but flow completed:")
             if ntsb_error:
-                print(f"  - NTSB: {ntsb_error}")
+                logger.warning("  - NTSB: %s", ntsb_error)
             if ucc_error:
-                print(f"  - UCC: {ucc_error}")
+                logger.warning("  - UCC: %s", ucc_error)
             if trust_score_error:
-                print(f"  - TrustScore: {trust_score_error}")
-        print(f"NTSB Score: {ntsb_score}, UCC Status: {ucc_data.get('status')}")
-        print(
-            f"TrustScore: {trust_score_result['trust_score']} (Fleet: {trust_score_result['fleet_score']}, Tail: {trust_score_result['tail_score']})"
+                logger.warning("  - TrustScore: %s", trust_score_error)
+        logger.info("NTSB Score: %s, UCC Status: %s", ntsb_score, ucc_data.get('status'))
+        logger.info(
+            "TrustScore: %s (Fleet: %s, Tail: %s)",
+            trust_score_result['trust_score'],
+            trust_score_result['fleet_score'],
+            trust_score_result['tail_score'],
         )
-        print(f"Saved to: {filename}")
-        print(f"{'='*80}\n")
+        logger.info("Saved to: %s", filename)
+        logger.debug("%s\n", _BAR)
 
         return result
 
     except Exception as e:
-        print(f"❌ Full scoring flow error: {type(e).__name__}: {str(e)}")
-        import traceback
-
-        traceback.print_exc()
+        logger.exception("❌ Full scoring flow error: %s: %s", type(e).__name__, str(e))
         raise HTTPException(status_code=500, detail=f"Scoring flow failed: {str(e)}")
 
 
@@ -681,7 +689,8 @@ async def full_scoring_flow(
 async def batch_verify_by_states(
     session_id: str = None,
     null_trust_score_only: bool = False,
-    operator_id: str = None
+    operator_id: str = None,
+    operator_ids: Optional[List[UUID4]] = Query(None)
 ):
     """
     Trigger batch verification workflow for all operators.
@@ -695,25 +704,26 @@ async def batch_verify_by_states(
         session_id: Optional existing Browserbase session ID
         null_trust_score_only: If True, only process operators with NULL trust_score
         operator_id: Optional specific operator ID (UUID) to process only that operator
+        operator_ids: Optional operator IDs (UUIDs) to process only those operators
 
     Returns:
         Workflow run ID for tracking progress
     """
     try:
         # Trigger the Hatchet workflow (fire and forget - returns immediately)
-        workflow_ref = batch_verify_workflow.run_no_wait(
+        workflow_ref = await batch_verify_workflow.aio_run_no_wait(
             input={
                 "session_id": session_id,
                 "null_trust_score_only": null_trust_score_only,
-                "operator_id": operator_id
+                "operator_id": operator_id,
+                "operator_ids": [str(oid) for oid in operator_ids] if operator_ids else None
             }
         )
 
-        # Save Hatchet workflow run ID for tracking/cancellation via ./run_production.sh cancel-all logs/workflows.txt
-        workflow_file = os.path.join(os.path.dirname(__file__), "../../logs/workflows.txt")
-        os.makedirs(os.path.dirname(workflow_file), exist_ok=True)
-        with open(workflow_file, "a") as f:
-            f.write(f"{workflow_ref.workflow_run_id}\n")
+        # Buffer the Hatchet workflow run ID for tracking/cancellation
+        _pending_workflow_run_ids.append(workflow_ref.workflow_run_id)
+        if len(_pending_workflow_run_ids) >= WORKFLOWS_FLUSH_SIZE:
+            await flush_workflow_run_ids()
 
         return {
             "status": "queued",
@@ -722,9 +732,11 @@ async def batch_verify_by_states(
         }
 
     except Exception as e:
-        print(f"❌ Failed to start batch verification workflow: {type(e).__name__}: {str(e)}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(
+            "❌ Failed to start batch verification workflow: %s: %s",
+            type(e).__name__,
+            str(e),
+        )
         raise HTTPException(
             status_code=500, detail=f"Failed to start batch verification workflow: {str(e)}"
         )
@@ -754,7 +766,7 @@ async def cancel_batch_verify(workflow_run_id: str):
             "message": "Workflow run cancelled successfully"
         }
     except Exception as e:
-        print(f"❌ Failed to cancel workflow: {type(e).__name__}: {str(e)}")
+        logger.error("❌ Failed to cancel workflow: %s: %s", type(e).__name__, str(e))
         raise HTTPException(
             status_code=500, detail=f"Failed to cancel workflow: {str(e)}"
         )
@@ -794,7 +806,7 @@ async def get_batch_verify_status(workflow_run_id: str):
             "result": result
         }
     except Exception as e:
-        print(f"❌ Failed to get workflow status: {type(e).__name__}: {str(e)}")
+        logger.error("❌ Failed to get workflow status: %s: %s", type(e).__name__, str(e))
         raise HTTPException(
             status_code=500, detail=f"Failed to get workflow status: {str(e)}"
         )
@@ -12,6 +12,7 @@ class NTSBIncident(BaseModel):
     event_id: Optional[str] = None
     event_date: Optional[str] = None
     location: Optional[str] = None
+    state: Optional[str] = None
     aircraft_damage: Optional[str] = None
     injury_level: Optional[str] = None
     investigation_type: Optional[str] = None
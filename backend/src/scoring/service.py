@@ -1,11 +1,17 @@
 # src/scoring/service.py
+import asyncio
+import contextlib
 import httpx
+import logging
+import orjson
 import os
-import sys
 import requests
+import shutil
 import math
+import time
+import urllib3
 from datetime import datetime
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Dict, Any, List, Optional
 from pydantic import UUID4
 from sqlalchemy.orm import Session
 from requests.adapters import HTTPAdapter
@@ -16,11 +22,165 @@ from src.scoring.schemas import (
     NTSBQueryResponse,
     ScoreCalculationResponse,
 )
+from src.common.cache import KeyedLocks, TTLCache
 from src.common.error import HTTPError
+from src.common.rate_limit import AsyncTokenBucket
+from src.common.utils import ensure_dir, safe_name
+
+logger = logging.getLogger(__name__)
 
 # NTSB API Configuration
 NTSB_API_URL = "https://data.ntsb.gov/carol-main-public/api/Query/Main"
 NTSB_TIMEOUT = 30.0  # seconds
+NTSB_CACHE_TTL = int(os.getenv("NTSB_CACHE_TTL", "86400"))  # seconds
+# Operators with no NTSB history rarely gain one, so empty results live longer
+NTSB_EMPTY_CACHE_TTL = int(os.getenv("NTSB_EMPTY_CACHE_TTL", "604800"))  # seconds
+NTSB_CACHE_MAXSIZE = int(os.getenv("NTSB_CACHE_MAXSIZE", "1024"))  # operators
+NTSB_MAX_RETRIES = 2  # retries on 429/503 responses
+NTSB_PDF_CHUNK_SIZE = 262144  # bytes read and written per report chunk
+NTSB_PDF_PROGRESS_STEP = 1048576  # bytes between progress log lines
+# Root folder for downloaded reports, resolved once at import
+# Assuming the backend/src/scoring directory structure
+NTSB_PDF_TEMP_ROOT = os.path.join(
+    os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../../")),
+    "backend/data/temp",
+)
+# Max report downloads in flight per operator - each one holds a pooled connection
+NTSB_PDF_CONCURRENCY = int(os.getenv("NTSB_PDF_CONCURRENCY", "8"))
+
+# Extra score deductions for severe incidents, keyed by lowercased value
+NTSB_DAMAGE_PENALTIES = {"destroyed": 10, "substantial": 10}
+NTSB_INJURY_PENALTIES = {"fatal": 15, "serious": 15}
+
+# Outbound NTSB request rate (requests per second), shared by all callers
+NTSB_RATE_LIMIT = AsyncTokenBucket(float(os.getenv("NTSB_RATE_LIMIT", "50")))
+
+# NTSB query body - constant except for the operator name, so it is
+# serialized once at import and split around a placeholder
+_NTSB_NAME_PLACEHOLDER = "__OPERATOR_NAME__"
+_NTSB_PAYLOAD_TEMPLATE = {
+    "ResultSetSize": 50,
+    "ResultSetOffset": 0,
+    "QueryGroups": [
+        {
+            "QueryRules": [
+                {
+                    "RuleType": "Simple",
+                    "Values": [_NTSB_NAME_PLACEHOLDER],
+                    "Columns": ["AviationOperation.OperatorName"],
+                    # "Operator": "contains",
+                    "Operator": "is",
+                    "overrideColumn": "",
+                    "selectedOption": {
+                        "FieldName": "OperatorName",
+                        "DisplayText": "Operator name",
+                        "Columns": ["AviationOperation.OperatorName"],
+                        "Selectable": True,
+                        "InputType": "Text",
+                        "RuleType": 0,
+                        "Options": None,
+                        "TargetCollection": "cases",
+                        "UnderDevelopment": False,
+                    },
+                }
+            ],
+            "AndOr": "and",
+            "inLastSearch": False,
+            "editedSinceLastSearch": False,
+        }
+    ],
+    "AndOr": "and",
+    "SortColumn": None,
+    "SortDescending": True,
+    "TargetCollection": "cases",
+    "SessionId": 1171,
+}
+_NTSB_PAYLOAD_PREFIX, _NTSB_PAYLOAD_SUFFIX = orjson.dumps(_NTSB_PAYLOAD_TEMPLATE).split(
+    orjson.dumps(_NTSB_NAME_PLACEHOLDER)
+)
+
+# Shared NTSB HTTP client - created lazily, closed on app shutdown
+_ntsb_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_ntsb_http_client() -> httpx.AsyncClient:
+    """Return the pooled NTSB HTTP client, creating it on first use."""
+    global _ntsb_http_client
+
+    if _ntsb_http_client is None or _ntsb_http_client.is_closed:
+        _ntsb_http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=NTSB_TIMEOUT,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20),
+        )
+    return _ntsb_http_client
+
+
+async def close_ntsb_http_client() -> None:
+    """Close the pooled NTSB HTTP client."""
+    global _ntsb_http_client
+
+    if _ntsb_http_client is not None:
+        await _ntsb_http_client.aclose()
+        _ntsb_http_client = None
+
+
+# Shared NTSB report (PDF) session - keeps the TLS connection to data.ntsb.gov
+# alive across downloads instead of a new session and handshake per report
+_ntsb_pdf_session: Optional[requests.Session] = None
+
+
+def get_ntsb_pdf_session() -> requests.Session:
+    """Return the pooled NTSB report download session, creating it on first use."""
+    global _ntsb_pdf_session
+
+    if _ntsb_pdf_session is None:
+        session = requests.Session()
+        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=16, pool_maxsize=16)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        _ntsb_pdf_session = session
+    return _ntsb_pdf_session
+
+
+class _ProgressWriter:
+    """
+    File wrapper for shutil.copyfileobj that logs download progress at debug
+    level, at most once per NTSB_PDF_PROGRESS_STEP bytes.
+    """
+
+    def __init__(self, f, accident_number: str, total_size: int):
+        self._f = f
+        self._accident_number = accident_number
+        self._total_size = total_size
+        self.written = 0
+        self._next_report = NTSB_PDF_PROGRESS_STEP
+
+    def write(self, data) -> int:
+        written = self._f.write(data)
+        self.written += written
+        if self.written >= self._next_report:
+            self._next_report = self.written + NTSB_PDF_PROGRESS_STEP
+            if self._total_size:
+                logger.debug(
+                    "NTSB report %s: %.1f%% (%d / %d bytes)",
+                    self._accident_number,
+                    self.written / self._total_size * 100,
+                    self.written,
+                    self._total_size,
+                )
+            else:
+                logger.debug(
+                    "NTSB report %s: %d bytes", self._accident_number, self.written
+                )
+        return written
+
+
+# In-process cache of NTSB responses: lowercased operator name -> raw_data
+_ntsb_cache = TTLCache(maxsize=NTSB_CACHE_MAXSIZE)
+# Per-operator locks so only one uncached query per operator is in flight
+_ntsb_locks = KeyedLocks()
 
 
 class NTSBService:
@@ -47,68 +207,77 @@ class NTSBService:
         url = f"https://data.ntsb.gov/carol-repgen/api/Aviation/ReportMain/GenerateNewestReport/{accident_number}/pdf"
 
         # Create output folder if it doesn't exist
-        os.makedirs(output_folder, exist_ok=True)
+        ensure_dir(output_folder)
 
         output_filename = os.path.join(
             output_folder, f"ntsb_report_{accident_number}.pdf"
         )
 
-        print(f"Downloading PDF from: {url}")
-        print(f"Saving to: {output_filename}")
-        print(
-            f"Note: The NTSB server generates reports on-demand. This may take 30 seconds to several minutes."
-        )
+        # The NTSB server generates reports on-demand - 30 seconds to several minutes
+        logger.debug("Downloading NTSB report %s for %s: %s", accident_number, operator_name, url)
+        started_at = time.monotonic()
 
-        # Configure session with retries
-        session = requests.Session()
-        retry = Retry(total=3, backoff_factor=1, status_forcelist=[500, 502, 503, 504])
-        adapter = HTTPAdapter(max_retries=retry)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+        # Pooled session with retries, shared across downloads
+        session = get_ntsb_pdf_session()
 
         try:
             # Use a longer timeout - 5 minutes should be enough
             # timeout = (connect_timeout, read_timeout)
-            response = session.get(url, timeout=(30, 300), stream=True)
-            response.raise_for_status()
-
-            # Write to file with progress indicator
-            total_size = int(response.headers.get("content-length", 0))
-            downloaded = 0
-
-            with open(output_filename, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size:
-                            percent = (downloaded / total_size) * 100
-                            sys.stdout.write(
-                                f"\rProgress: {percent:.1f}% ({downloaded:,} / {total_size:,} bytes)"
-                            )
-                            sys.stdout.flush()
-                        else:
-                            sys.stdout.write(f"\rDownloaded: {downloaded:,} bytes")
-                            sys.stdout.flush()
+            # Context manager returns the connection to the pool even on errors
+            with session.get(url, timeout=(30, 300), stream=True) as response:
+                response.raise_for_status()
+
+                # Unbuffered raw fd - no BufferedWriter copy; copyfileobj moves
+                # NTSB_PDF_CHUNK_SIZE blocks, progress is logged per
+                # NTSB_PDF_PROGRESS_STEP bytes
+                response.raw.decode_content = True
+                total_size = int(response.headers.get("content-length", 0))
+                # Written under a .part name and renamed when complete, so an
+                # existing report file is always a whole one
+                partial_filename = f"{output_filename}.part"
+                try:
+                    fd = os.open(partial_filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    with os.fdopen(fd, "wb", buffering=0) as f:
+                        shutil.copyfileobj(
+                            response.raw,
+                            _ProgressWriter(f, accident_number, total_size),
+                            length=NTSB_PDF_CHUNK_SIZE,
+                        )
+                    os.replace(partial_filename, output_filename)
+                except BaseException:
+                    # Don't leave a truncated .part behind for the next attempt
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(partial_filename)
+                    raise
 
             file_size = os.path.getsize(output_filename)
-            print(f"\n\nDownload complete! File size: {file_size:,} bytes")
-            print(f"Saved to: {output_filename}")
+            logger.info(
+                "✓ Downloaded %d bytes in %.1fs to %s",
+                file_size,
+                time.monotonic() - started_at,
+                output_filename,
+            )
             return True
 
-        except requests.exceptions.Timeout:
-            print(
-                f"\nError: Request timed out. The NTSB server may be overloaded or the report is very large."
+        # Errors while streaming response.raw come from urllib3, not requests
+        except (requests.exceptions.Timeout, urllib3.exceptions.ReadTimeoutError):
+            logger.error(
+                "❌ NTSB report %s timed out - the server may be overloaded or the report is very large",
+                accident_number,
             )
             return False
-        except requests.exceptions.RequestException as e:
-            print(f"\nError downloading PDF: {e}")
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError, OSError) as e:
+            logger.error("❌ Error downloading NTSB report %s: %s", accident_number, e)
             return False
 
     @staticmethod
-    def _download_incident_pdfs(raw_data: Dict[str, Any], operator_name: str) -> None:
+    async def _download_incident_pdfs(
+        raw_data: Dict[str, Any], operator_name: str
+    ) -> None:
         """
         Download PDFs for all incidents in the NTSB response.
+        Reports are fetched concurrently (up to NTSB_PDF_CONCURRENCY at a time)
+        on worker threads sharing the pooled report session.
 
         Args:
             raw_data: Raw response from NTSB API
@@ -119,39 +288,65 @@ class NTSBService:
 
         # Create folder name with format: YYYYMMDD/operator_name
         timestamp = datetime.now().strftime("%Y%m%d")
-        safe_operator_name = "".join(c if c.isalnum() else "_" for c in operator_name)
+        safe_operator_name = safe_name(operator_name)
         folder_name = f"{timestamp}/{safe_operator_name}"
 
-        # Get the project root directory and create temp folder path
-        # Assuming the backend/src/scoring directory structure
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        project_root = os.path.abspath(os.path.join(current_dir, "../../../"))
-        temp_folder = os.path.join(project_root, "backend/data/temp", folder_name)
+        temp_folder = os.path.join(NTSB_PDF_TEMP_ROOT, folder_name)
 
-        print(f"\nDownloading NTSB PDFs to: {temp_folder}")
-
-        # Extract Mkey (accident number) from each result
+        # Extract Mkey (accident number) from each result - deduplicated in
+        # order, since every repeat would regenerate the same report
+        accident_numbers: Dict[str, None] = {}
         for result in raw_data.get("Results", []):
-            fields = result.get("Fields", [])
-
-            # Find the Mkey field
-            for field in fields:
-                if field.get("FieldName") == "Mkey":
-                    values = field.get("Values", [])
-                    if values:
-                        accident_number = values[0]
-                        print(f"\nProcessing accident number: {accident_number}")
-                        NTSBService.download_ntsb_pdf(
-                            accident_number, temp_folder, operator_name
-                        )
+            accident_number = NTSBService._field_map(result.get("Fields", [])).get("Mkey")
+            if accident_number:
+                accident_numbers[accident_number] = None
+
+        # Skip reports already downloaded to today's folder
+        accident_numbers_to_fetch = [
+            accident_number
+            for accident_number in accident_numbers
+            if not os.path.exists(
+                os.path.join(temp_folder, f"ntsb_report_{accident_number}.pdf")
+            )
+        ]
+        if not accident_numbers_to_fetch:
+            return
+
+        # Create the folder once here rather than racing on it in every download
+        ensure_dir(temp_folder)
+
+        logger.info("Downloading %s NTSB PDFs to: %s", len(accident_numbers_to_fetch), temp_folder)
+
+        semaphore = asyncio.Semaphore(NTSB_PDF_CONCURRENCY)
+
+        async def download_one(accident_number: str) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    NTSBService.download_ntsb_pdf,
+                    accident_number,
+                    temp_folder,
+                    operator_name,
+                )
+
+        # One failed report must not cancel the others
+        await asyncio.gather(
+            *(download_one(accident_number) for accident_number in accident_numbers_to_fetch),
+            return_exceptions=True,
+        )
 
     @staticmethod
-    async def query_ntsb_incidents(operator_name: str) -> Dict[str, Any]:
+    async def query_ntsb_incidents(
+        operator_name: str, force_refresh: bool = False
+    ) -> Dict[str, Any]:
         """
         Query NTSB database for incidents related to an operator.
+        Responses are cached per operator name for NTSB_CACHE_TTL seconds,
+        empty responses for NTSB_EMPTY_CACHE_TTL seconds. Concurrent uncached
+        calls for the same operator share a single API query.
 
         Args:
             operator_name: The name of the operator to search for
+            force_refresh: If True, bypass the cache and query the API
 
         Returns:
             Dict containing the NTSB API response
@@ -159,63 +354,88 @@ class NTSBService:
         Raises:
             HTTPError: If the NTSB API request fails
         """
-        print("FROM query_ntsb_incidents")
-        payload = {
-            "ResultSetSize": 50,
-            "ResultSetOffset": 0,
-            "QueryGroups": [
-                {
-                    "QueryRules": [
-                        {
-                            "RuleType": "Simple",
-                            "Values": [operator_name],
-                            "Columns": ["AviationOperation.OperatorName"],
-                            # "Operator": "contains",
-                            "Operator": "is",
-                            "overrideColumn": "",
-                            "selectedOption": {
-                                "FieldName": "OperatorName",
-                                "DisplayText": "Operator name",
-                                "Columns": ["AviationOperation.OperatorName"],
-                                "Selectable": True,
-                                "InputType": "Text",
-                                "RuleType": 0,
-                                "Options": None,
-                                "TargetCollection": "cases",
-                                "UnderDevelopment": False,
-                            },
-                        }
-                    ],
-                    "AndOr": "and",
-                    "inLastSearch": False,
-                    "editedSinceLastSearch": False,
-                }
-            ],
-            "AndOr": "and",
-            "SortColumn": None,
-            "SortDescending": True,
-            "TargetCollection": "cases",
-            "SessionId": 1171,
-        }
-
-        try:
-            async with httpx.AsyncClient(timeout=NTSB_TIMEOUT) as client:
-                response = await client.post(NTSB_API_URL, json=payload)
+        cache_key = operator_name.lower()
+        if not force_refresh:
+            cached = _ntsb_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
+        # Concurrent misses for the same operator wait for the first query
+        # instead of each posting it and re-downloading the same reports
+        async with _ntsb_locks.hold(cache_key):
+            if not force_refresh:
+                cached = _ntsb_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+            logger.debug("Querying NTSB incidents for %s", operator_name)
+            # Splice the JSON-encoded name into the pre-serialized query body
+            payload = _NTSB_PAYLOAD_PREFIX + orjson.dumps(operator_name) + _NTSB_PAYLOAD_SUFFIX
+
+            try:
+                client = get_ntsb_http_client()
+                for attempt in range(NTSB_MAX_RETRIES + 1):
+                    async with NTSB_RATE_LIMIT:
+                        response = await client.post(
+                            NTSB_API_URL,
+                            content=payload,
+                            headers={"Content-Type": "application/json"},
+                        )
+                    if response.status_code not in (429, 503) or attempt == NTSB_MAX_RETRIES:
+                        break
+                    # Honor Retry-After when throttled instead of failing the operator
+                    retry_after = response.headers.get("Retry-After", "")
+                    await asyncio.sleep(
+                        float(retry_after) if retry_after.isdigit() else 2 ** attempt
+                    )
                 response.raise_for_status()
-                raw_data = response.json()
+                raw_data = orjson.loads(response.content)
 
                 # Download PDFs for each incident
-                NTSBService._download_incident_pdfs(raw_data, operator_name)
+                await NTSBService._download_incident_pdfs(raw_data, operator_name)
 
+                ttl = NTSB_CACHE_TTL if raw_data.get("Results") else NTSB_EMPTY_CACHE_TTL
+                _ntsb_cache.set(cache_key, raw_data, ttl)
                 return raw_data
-        except httpx.TimeoutException:
-            raise HTTPError(
-                detail=f"NTSB API request timed out after {NTSB_TIMEOUT} seconds"
-            )
-        except httpx.HTTPStatusError as e:
-            raise HTTPError(detail=f"NTSB API returned error: {e.response.status_code}")
-        except Exception as e:
-            raise HTTPError(detail=f"Error querying NTSB API: {str(e)}")
+            except httpx.TimeoutException:
+                raise HTTPError(
+                    detail=f"NTSB API request timed out after {NTSB_TIMEOUT} seconds"
+                )
+            except httpx.HTTPStatusError as e:
+                raise HTTPError(detail=f"NTSB API returned error: {e.response.status_code}")
+            except Exception as e:
+                raise HTTPError(detail=f"Error querying NTSB API: {str(e)}")
+
+    @staticmethod
+    def cache_status(operator_name: str) -> str:
+        """
+        Report how query_ntsb_incidents would serve an operator right now.
+
+        Returns:
+            "hit" for a cached response, "neg" for a cached empty response,
+            "miss" if the NTSB API would be queried
+        """
+        cached = _ntsb_cache.get(operator_name.lower())
+        if cached is None:
+            return "miss"
+        return "hit" if cached.get("Results") else "neg"
+
+    @staticmethod
+    def _field_map(fields: List[Dict]) -> Dict[str, Optional[str]]:
+        """
+        Build a FieldName -> first value lookup from an NTSB Fields array.
+
+        Args:
+            fields: List of field dictionaries from NTSB response
+
+        Returns:
+            Dict mapping each field name to the first value of its Values array,
+            or None. If a field name repeats, the first occurrence wins.
+        """
+        return {
+            field.get("FieldName"): (field.get("Values") or [None])[0]
+            for field in reversed(fields)
+        }
 
     @staticmethod
     def _extract_field_value(fields: List[Dict], field_name: str) -> Optional[str]:
@@ -229,22 +449,20 @@ class NTSBService:
         Returns:
             First value from the Values array, or None
         """
-        for field in fields:
-            if field.get("FieldName") == field_name:
-                values = field.get("Values", [])
-                return values[0] if values else None
-        return None
+        return NTSBService._field_map(fields).get(field_name)
 
     @staticmethod
-    def parse_ntsb_response(raw_data: Dict[str, Any]) -> List[NTSBIncident]:
+    def parse_ntsb_incident_dicts(raw_data: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
-        Parse NTSB API response into structured incident data.
+        Parse NTSB API response into plain incident dicts.
+        Same keys as NTSBIncident, without building Pydantic models - used on
+        the scoring and save paths, which only need JSON-ready dicts.
 
         Args:
             raw_data: Raw response from NTSB API
 
         Returns:
-            List of NTSBIncident objects
+            List of incident dicts
         """
         incidents = []
 
@@ -252,37 +470,52 @@ class NTSBService:
         # Response format: { "Results": [ { "Fields": [...] } ] }
         if isinstance(raw_data, dict) and "Results" in raw_data:
             for result in raw_data.get("Results", []):
-                fields = result.get("Fields", [])
+                # One lookup table per result instead of a scan per field
+                field_map = NTSBService._field_map(result.get("Fields", []))
 
                 # Extract relevant fields
-                event_id = NTSBService._extract_field_value(fields, "NtsbNo")
-                event_date = NTSBService._extract_field_value(fields, "EventDate")
-                event_type = NTSBService._extract_field_value(fields, "EventType")
-                injury_level = NTSBService._extract_field_value(
-                    fields, "HighestInjuryLevel"
-                )
-                city = NTSBService._extract_field_value(fields, "City")
-                state = NTSBService._extract_field_value(fields, "State")
-                country = NTSBService._extract_field_value(fields, "Country")
+                event_id = field_map.get("NtsbNo")
+                event_date = field_map.get("EventDate")
+                event_type = field_map.get("EventType")
+                injury_level = field_map.get("HighestInjuryLevel")
+                city = field_map.get("City")
+                state = field_map.get("State")
+                country = field_map.get("Country")
 
                 # Build location string
                 location_parts = [p for p in [city, state, country] if p]
                 location = ", ".join(location_parts) if location_parts else None
 
-                # Create incident object
-                incident = NTSBIncident(
-                    event_id=event_id,
-                    event_date=event_date,
-                    location=location,
-                    aircraft_damage=None,  # Not in this response format
-                    injury_level=injury_level,
-                    investigation_type=None,  # Not directly available
-                    event_type=event_type,
-                )
-                incidents.append(incident)
+                # Field order matches NTSBIncident
+                incidents.append({
+                    "event_id": event_id,
+                    "event_date": event_date,
+                    "location": location,
+                    "state": state,
+                    "aircraft_damage": None,  # Not in this response format
+                    "injury_level": injury_level,
+                    "investigation_type": None,  # Not directly available
+                    "event_type": event_type,
+                })
 
         return incidents
 
+    @staticmethod
+    def parse_ntsb_response(raw_data: Dict[str, Any]) -> List[NTSBIncident]:
+        """
+        Parse NTSB API response into structured incident data.
+
+        Args:
+            raw_data: Raw response from NTSB API
+
+        Returns:
+            List of NTSBIncident objects
+        """
+        return [
+            NTSBIncident(**incident)
+            for incident in NTSBService.parse_ntsb_incident_dicts(raw_data)
+        ]
+
     @staticmethod
     def calculate_ntsb_score(incidents: List[NTSBIncident]) -> float:
         """
@@ -306,17 +539,12 @@ class NTSBService:
         score = base_score - (incident_count * 5)
 
         # Additional deductions for severe incidents
+        # Stop once the score is used up - the result is clamped to 0 anyway
         for incident in incidents:
-            if incident.aircraft_damage and incident.aircraft_damage.lower() in [
-                "destroyed",
-                "substantial",
-            ]:
-                score -= 10
-            if incident.injury_level and incident.injury_level.lower() in [
-                "fatal",
-                "serious",
-            ]:
-                score -= 15
+            if score <= 0:
+                break
+            score -= NTSB_DAMAGE_PENALTIES.get((incident.aircraft_damage or "").lower(), 0)
+            score -= NTSB_INJURY_PENALTIES.get((incident.injury_level or "").lower(), 0)
 
         # Ensure score doesn't go below 0
         return max(0.0, score)
@@ -0,0 +1,256 @@
+# src/scoring/steps.py
+"""
+Verification steps shared by the full scoring flow (scoring router) and the
+batch verification workflow. Every step is failure-tolerant: errors are
+returned alongside default data so one failing source doesn't sink the run.
+"""
+
+import asyncio
+import contextlib
+import logging
+from typing import List, Optional, Tuple
+from src.scoring.service import NTSBService
+from src.scoring.ucc_service import (
+    BrowserbaseSessionPool,
+    UCCVerificationService,
+    extract_ucc_filings,
+)
+from src.trustscore.calculator import (
+    FleetScoreData,
+    TailScoreData,
+    get_shared_calculator,
+)
+
+logger = logging.getLogger(__name__)
+
+# States with UCC scraper ready - UCC flow will only scrape these states
+# Add more states here as scrapers become available (e.g., ["CA", "FL"])
+UCC_READY_STATES = ["CA"]
+
+
+def ucc_needs_ntsb_incidents(state: Optional[str]) -> bool:
+    """
+    Whether UCC picks its states from NTSB incident locations. A state override
+    or UCC_READY_STATES replaces that list, so the incidents are unused then.
+    """
+    return not state and not UCC_READY_STATES
+
+
+def ntsb_score_for(incidents: list, ntsb_error: Optional[str]) -> float:
+    """NTSB score: 100 - 5 per incident, minimum 0; 100 when NTSB failed."""
+    if ntsb_error:
+        return 100.0
+    return max(0, 100 - (len(incidents) * 5))
+
+
+async def run_ntsb_step(
+    operator_name: str, force_refresh: bool = False
+) -> Tuple[dict, list, Optional[str]]:
+    """
+    Query and parse NTSB incidents for one operator.
+    Never raises - failures are returned as an error string with empty data.
+
+    Returns:
+        Tuple of (raw NTSB response, incident dicts, error or None)
+    """
+    logger.info("Step 1: Querying NTSB database for %s...", operator_name)
+    try:
+        ntsb_data = await NTSBService.query_ntsb_incidents(
+            operator_name, force_refresh=force_refresh
+        )
+        # Plain dicts - the flow only needs JSON-ready incidents, not models
+        incidents = NTSBService.parse_ntsb_incident_dicts(ntsb_data)
+        logger.info(
+            "✓ NTSB check complete: %s incidents found, score: %s",
+            len(incidents),
+            ntsb_score_for(incidents, None),
+        )
+        return ntsb_data, incidents, None
+    except Exception as e:
+        ntsb_error = str(e)
+        logger.warning("⚠️  NTSB check failed: %s", ntsb_error)
+        logger.info("  → Continuing with default values (no incidents, score: 100)")
+        return {"Results": []}, [], ntsb_error
+
+
+async def run_ucc_step(
+    operator_name: str,
+    incidents: list,
+    faa_state: str,
+    state: Optional[str],
+    session_id: Optional[str],
+    session_pool: Optional[BrowserbaseSessionPool] = None,
+    session_lock: Optional[asyncio.Lock] = None,
+) -> Tuple[dict, Optional[str]]:
+    """
+    Verify UCC filings for one operator with Browserbase.
+    Never raises - failures are returned as an error string with default data.
+
+    Args:
+        operator_name: Name of the operator
+        incidents: Parsed NTSB incident dicts, used to infer states to search
+        faa_state: FAA state code, used as fallback
+        state: Optional state override
+        session_id: Optional existing Browserbase session ID
+        session_pool: Optional pool to check a session out of instead of
+            session_id; the session is handed back when the run finishes
+        session_lock: Optional lock held for the run, so runs sharing one
+            session_id (a single page) don't overlap
+
+    Returns:
+        Tuple of (UCC verification result, error or None)
+    """
+    logger.info("Step 2: Verifying UCC filings with Browserbase...")
+    try:
+        ucc_service = UCCVerificationService()
+        if session_pool:
+            session_id = await session_pool.acquire()
+        ucc_data = None
+        try:
+            async with session_lock or contextlib.nullcontext():
+                # Parsed incident dicts carry the state UCC needs, so the raw
+                # NTSB response is only walked once
+                ucc_data = await ucc_service.verify_ucc_filings_with_session(
+                    operator_name,
+                    incidents,
+                    faa_state,
+                    state,
+                    session_id,
+                    UCC_READY_STATES,
+                )
+        finally:
+            if session_pool:
+                await session_pool.release(session_id, ucc_data)
+        logger.info("✓ UCC check complete: %s", ucc_data.get('status'))
+        return ucc_data, None
+    except Exception as e:
+        ucc_error = str(e)
+        logger.warning("⚠️  UCC check failed: %s", ucc_error)
+        logger.info("  → Continuing with default values (no UCC data)")
+        return {
+            "status": "failed",
+            "error": ucc_error,
+            "visited_states": [],
+            "states_processed": 0,
+        }, ucc_error
+
+
+async def run_ntsb_and_ucc_steps(
+    operator_name: str,
+    faa_state: str,
+    state: Optional[str],
+    session_id: Optional[str],
+    force_refresh: bool = False,
+    session_pool: Optional[BrowserbaseSessionPool] = None,
+    session_lock: Optional[asyncio.Lock] = None,
+) -> Tuple[dict, list, Optional[str], dict, Optional[str]]:
+    """
+    Run the NTSB and UCC steps for one operator. They run concurrently unless
+    UCC needs the NTSB incident locations to pick its states, in which case
+    UCC runs after NTSB with the parsed incidents.
+    Never raises - see run_ntsb_step and run_ucc_step.
+
+    Returns:
+        Tuple of (raw NTSB response, incident dicts, NTSB error or None,
+        UCC verification result, UCC error or None)
+    """
+    if ucc_needs_ntsb_incidents(state):
+        ntsb_data, incidents, ntsb_error = await run_ntsb_step(
+            operator_name, force_refresh
+        )
+        ucc_data, ucc_error = await run_ucc_step(
+            operator_name, incidents, faa_state, state, session_id,
+            session_pool, session_lock,
+        )
+    else:
+        (ntsb_data, incidents, ntsb_error), (ucc_data, ucc_error) = await asyncio.gather(
+            run_ntsb_step(operator_name, force_refresh),
+            run_ucc_step(
+                operator_name, [], faa_state, state, session_id,
+                session_pool, session_lock,
+            ),
+        )
+    return ntsb_data, incidents, ntsb_error, ucc_data, ucc_error
+
+
+async def run_trust_score_step(
+    operator_name: str,
+    fleet_events: List[dict],
+    ucc_data: dict,
+    ntsb_score: float,
+    operator_age_years: float,
+    argus_rating: Optional[str],
+    wyvern_rating: Optional[str],
+) -> Tuple[dict, Optional[str]]:
+    """
+    Calculate the TrustScore (Algorithm v3) from the gathered data.
+    Never raises - failures fall back to the NTSB score.
+
+    Args:
+        operator_name: Name of the operator
+        fleet_events: NTSB incidents in dict format
+        ucc_data: UCC verification result
+        ntsb_score: NTSB score, used as the fallback trust score
+        operator_age_years: Operator age from gtj.operators
+        argus_rating: ARGUS certification rating
+        wyvern_rating: Wyvern certification rating
+
+    Returns:
+        Tuple of (TrustScore result, error or None)
+    """
+    logger.info("Step 3: Calculating TrustScore...")
+    try:
+        # Extract UCC filings from the verification result
+        # (normalized_filings instead of raw filings)
+        ucc_filings = extract_ucc_filings(ucc_data)
+
+        # Create FleetScoreData (Algorithm v3)
+        fleet_data = FleetScoreData(
+            operator_name=operator_name,
+            operator_age_years=operator_age_years,
+            fleet_size=1,  # Default - would need to be fetched from operator data
+            fleet_events=fleet_events,  # All fleet-wide events (NTSB + FAA)
+            ucc_filings=ucc_filings,
+            argus_rating=argus_rating,
+            wyvern_rating=wyvern_rating,
+            bankruptcy_history=None,
+        )
+
+        # Create TailScoreData (placeholder - would need aircraft-specific data)
+        tail_data = TailScoreData(
+            aircraft_age_years=5.0,  # Default placeholder
+            operator_name=operator_name,
+            registered_owner=operator_name,  # Assume same as operator
+            fractional_owner=False,
+            tail_events=fleet_events,  # Tail-specific events
+        )
+
+        # Shared calculator - includes LLM for AI insights when configured
+        calculator = get_shared_calculator()
+        # The calculator drops the LLM when its client fails to initialize,
+        # so check the client rather than the API key
+        if calculator.llm_client is not None:
+            logger.info("✓ Using LLM for AI insights")
+        else:
+            logger.warning("⚠️  LLM unavailable, using calculator without AI insights")
+
+        # Calculate TrustScore
+        trust_score_result = await calculator.calculate_trust_score(
+            fleet_data, tail_data
+        )
+        logger.info("✓ TrustScore calculated: %s", trust_score_result['trust_score'])
+        return trust_score_result, None
+
+    except Exception as e:
+        trust_score_error = str(e)
+        logger.warning("⚠️  TrustScore calculation failed: %s", trust_score_error)
+        logger.info("  → Using fallback calculation based on NTSB score: %s", ntsb_score)
+        # Use NTSB score as fallback trust score if available
+        fallback_score = ntsb_score if ntsb_score is not None else 50.0
+        return {
+            "trust_score": fallback_score,
+            "fleet_score": fallback_score,
+            "tail_score": fallback_score,
+            "error": trust_score_error,
+            "fallback": True,
+        }, trust_score_error
@@ -16,7 +16,7 @@ Search Portal: https://www.alabamainteractive.org/ucc_filing/
 """
 
 from typing import Dict, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from base_flow import BaseUCCFlow
 
 
@@ -103,19 +103,17 @@ class AlabamaFlow(BaseUCCFlow):
                 'a:has-text("By Name")',
             ]
 
+            # One combined locator - a single browser round-trip instead of
+            # one query_selector call per candidate
             search_link_found = False
-            for selector in search_options:
-                try:
-                    link = await page.query_selector(selector)
-                    if link:
-                        print(f"✓ Found search option with selector: {selector}")
-                        await link.click()
-                        await page.wait_for_timeout(2000)
-                        await self.take_screenshot(page, "alabama_search_form.png")
-                        search_link_found = True
-                        break
-                except:
-                    continue
+            try:
+                await page.locator(", ".join(search_options)).first.click(timeout=2000)
+                print("✓ Found search option")
+                await page.wait_for_timeout(2000)
+                await self.take_screenshot(page, "alabama_search_form.png")
+                search_link_found = True
+            except PlaywrightTimeoutError:
+                pass
 
             if not search_link_found:
                 print("⚠️  Could not find 'Search by Name' link")
@@ -123,27 +121,30 @@ class AlabamaFlow(BaseUCCFlow):
                 await self.take_screenshot(page, "alabama_no_search_link.png")
 
             # Try to find debtor name input field (if available)
-            input_selectors = [
-                'input[name*="debtor"]',
-                'input[name*="name"]',
-                'input[id*="debtor"]',
-                'input[id*="name"]',
-                'input[type="text"]',
+            # Debtor/name fields are tried together first; any text input is
+            # only the fallback, so it cannot win over a better match on the page
+            input_selector_groups = [
+                [
+                    'input[name*="debtor"]',
+                    'input[name*="name"]',
+                    'input[id*="debtor"]',
+                    'input[id*="name"]',
+                ],
+                ['input[type="text"]'],
             ]
 
             input_found = False
-            for selector in input_selectors:
+            for selectors in input_selector_groups:
                 try:
-                    input_field = await page.query_selector(selector)
-                    if input_field:
-                        print(f"✓ Found input field with selector: {selector}")
-                        # Fill the field but don't submit (payment required)
-                        await input_field.fill(search_query)
-                        print(f"✓ Filled search query: {search_query}")
-                        input_found = True
-                        await self.take_screenshot(page, "alabama_form_filled.png")
-                        break
-                except:
+                    input_field = page.locator(", ".join(selectors)).first
+                    # Fill the field but don't submit (payment required)
+                    await input_field.fill(search_query, timeout=2000)
+                    print(f"✓ Found input field with selector: {', '.join(selectors)}")
+                    print(f"✓ Filled search query: {search_query}")
+                    input_found = True
+                    await self.take_screenshot(page, "alabama_form_filled.png")
+                    break
+                except PlaywrightTimeoutError:
                     continue
 
             if not input_found:
@@ -188,44 +189,50 @@ class AlabamaFlow(BaseUCCFlow):
             print(f"   Current URL: {page_url}")
 
             # Since we can't complete paid search, document what we see
-            filings = []
-
-            # Try to detect if we're on a results page (unlikely without payment)
-            # Check for common result indicators
-            has_results_table = await page.query_selector("table")
-            has_results_list = await page.query_selector("ul.results, div.results")
-
-            if has_results_table or has_results_list:
+            # Detection and row parsing run in one page.evaluate round-trip.
+            # Column order follows the expected fields above; raw_text is kept
+            # because it is unverified without a paid search
+            result = await page.evaluate(
+                """() => {
+                const hasContainer = !!document.querySelector(
+                    'table, ul.results, div.results'
+                );
+                const filings = [];
+                const rows = document.querySelectorAll('table tr');
+                for (let i = 1; i < rows.length; i++) {
+                    const cells = rows[i].querySelectorAll('td');
+                    if (cells.length === 0) continue;
+                    const cell = (idx) =>
+                        cells[idx] ? cells[idx].textContent.trim() || null : null;
+                    filings.push({
+                        filing_number: cell(0),
+                        debtor_name: cell(1),
+                        filing_date: cell(2),
+                        status: cell(3),
+                        secured_party: cell(4),
+                        expiration_date: cell(5),
+                        raw_text: rows[i].textContent.trim(),
+                    });
+                }
+                return {
+                    has_container: hasContainer,
+                    filings: filings,
+                    total_count: filings.length,
+                };
+            }"""
+            )
+            filings = result["filings"]
+            total_count = result["total_count"]
+
+            if result["has_container"]:
                 print("✓ Detected possible results container on page")
-
-                # Attempt to extract using generic selectors
-                # This would need to be customized based on actual results page structure
-                try:
-                    filings = await page.evaluate(
-                        """() => {
-                        const results = [];
-                        // Look for table rows
-                        const rows = document.querySelectorAll('table tr');
-                        for (let i = 1; i < rows.length; i++) {
-                            const cells = rows[i].querySelectorAll('td');
-                            if (cells.length > 0) {
-                                results.push({
-                                    raw_text: rows[i].textContent.trim()
-                                });
-                            }
-                        }
-                        return results;
-                    }"""
-                    )
-                    print(f"✓ Extracted {len(filings)} potential result rows")
-                except Exception as extract_error:
-                    print(f"⚠️  Could not extract table data: {str(extract_error)}")
+                print(f"✓ Extracted {total_count} potential result rows")
             else:
                 print("⚠️  No results container detected (expected - payment required)")
 
             return {
                 "filings": filings,
-                "total_count": len(filings),
+                "total_count": total_count,
                 "page_title": page_title,
                 "page_url": page_url,
                 "implementation_status": "navigation_only",
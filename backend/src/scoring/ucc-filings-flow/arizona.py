@@ -5,13 +5,48 @@ URL: https://azsos.gov/business/uniform-commercial-code-ucc
 """
 
 from typing import Dict, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from base_flow import BaseUCCFlow
 
 
 class ArizonaFlow(BaseUCCFlow):
     """Arizona-specific UCC filing flow"""
 
+    # Form selectors, joined once per tier. query_selector_all returns DOM
+    # order, so generic inputs/links sit in a later tier that is only tried
+    # when the earlier one has no visible match
+    _INPUT_SELECTORS = (
+        ", ".join((
+            'input[name*="organization"]',
+            'input[name*="Organization"]',
+            'input[id*="organization"]',
+            'input[id*="orgName"]',
+            'input[name*="debtor"]',
+            'input[name*="Debtor"]',
+            'input[id*="debtor"]',
+            'input[name*="name"]',
+            'input[name*="Name"]',
+            'input[placeholder*="Organization"]',
+            'input[placeholder*="Business"]',
+            'input[placeholder*="Debtor"]',
+            'input[placeholder*="Name"]',
+        )),
+        ", ".join((
+            'input[type="text"]',
+            'input[type="search"]',
+        )),
+    )
+    _BUTTON_SELECTORS = (
+        ", ".join((
+            'button[type="submit"]',
+            'input[type="submit"]',
+            'button:has-text("Search")',
+            'button:has-text("Submit")',
+            'input[value*="Search"]',
+        )),
+        'a:has-text("Search")',
+    )
+
     async def navigate_to_search(self, page: Page) -> bool:
         """Navigate to Arizona UCC search page"""
         try:
@@ -42,32 +77,12 @@ class ArizonaFlow(BaseUCCFlow):
 
             # Step 1: Look for organization name input
             print("   Step 1: Looking for organization name input...")
-            input_selectors = [
-                'input[name*="organization"]',
-                'input[name*="Organization"]',
-                'input[id*="organization"]',
-                'input[id*="orgName"]',
-                'input[name*="debtor"]',
-                'input[name*="Debtor"]',
-                'input[id*="debtor"]',
-                'input[name*="name"]',
-                'input[name*="Name"]',
-                'input[placeholder*="Organization"]',
-                'input[placeholder*="Business"]',
-                'input[placeholder*="Debtor"]',
-                'input[placeholder*="Name"]',
-                'input[type="text"]',
-                'input[type="search"]'
-            ]
-
             input_found = False
-            for selector in input_selectors:
+            for selectors in self._INPUT_SELECTORS:
                 try:
-                    input_field = await page.query_selector(selector)
-                    if input_field:
-                        is_visible = await input_field.is_visible()
-                        if is_visible:
-                            print(f"   ✓ Found input field: {selector}")
+                    for input_field in await page.query_selector_all(selectors):
+                        if await input_field.is_visible():
+                            print("   ✓ Found input field")
                             await input_field.fill(search_query)
                             await page.wait_for_timeout(1000)
                             print(f"   ✓ Organization name entered: {search_query}")
@@ -75,43 +90,40 @@ class ArizonaFlow(BaseUCCFlow):
                             break
                 except:
                     continue
+                if input_found:
+                    break
 
             if not input_found:
                 print("   ⚠️  Could not find organization name input")
 
             # Step 2: Click the search button
             print("   Step 2: Clicking search button...")
-            button_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Search")',
-                'button:has-text("Submit")',
-                'input[value*="Search"]',
-                'a:has-text("Search")'
-            ]
-
             button_found = False
-            for selector in button_selectors:
+            for selectors in self._BUTTON_SELECTORS:
                 try:
-                    button = await page.query_selector(selector)
-                    if button:
-                        is_visible = await button.is_visible()
-                        if is_visible:
-                            print(f"   ✓ Found search button: {selector}")
+                    for button in await page.query_selector_all(selectors):
+                        if await button.is_visible():
+                            print("   ✓ Found search button")
                             await button.click()
                             print("   ✓ Search button clicked")
                             button_found = True
                             break
                 except:
                     continue
+                if button_found:
+                    break
 
             if not button_found:
                 print("   ⚠️  Could not find search button")
 
-            # Step 3: Wait for results to load
+            # Step 3: Wait for results to load - returns as soon as the
+            # page goes quiet instead of always sleeping
             print("   Step 3: Waiting for results...")
-            await page.wait_for_timeout(3000)
-            print("   ✓ Results loaded")
+            try:
+                await page.wait_for_load_state("networkidle", timeout=15000)
+                print("   ✓ Results loaded")
+            except PlaywrightTimeoutError:
+                print("   ⚠️  Page still busy after 15s, continuing")
 
             # Take screenshot of results
             await self.take_screenshot(page, f"arizona_search_results.png")
@@ -152,38 +164,23 @@ class ArizonaFlow(BaseUCCFlow):
 
                 if table_count > 0:
                     # Try to extract from the main results table
-                    rows = page.locator('table tr')
-                    row_count = await rows.count()
-                    print(f"   Found {row_count} rows in tables")
+                    # All rows' cell texts in one evaluate_all round-trip
+                    row_cells = await page.locator('table tr').evaluate_all(
+                        "rows => rows.map(row => Array.from(row.querySelectorAll('td'), cell => cell.innerText.trim()))"
+                    )
+                    print(f"   Found {len(row_cells)} rows in tables")
 
                     # Process each row (skip header)
-                    for i in range(1, row_count):
-                        row = rows.nth(i)
-                        try:
-                            # Extract all cells
-                            cells = row.locator('td')
-                            cell_count = await cells.count()
-
-                            if cell_count > 0:
-                                # Extract data from cells
-                                filing_record = {}
-
-                                # Typically: File Number, Debtor, Filing Date, Status, etc.
-                                if cell_count >= 1:
-                                    filing_record['file_number'] = (await cells.nth(0).inner_text()).strip()
-                                if cell_count >= 2:
-                                    filing_record['debtor_name'] = (await cells.nth(1).inner_text()).strip()
-                                if cell_count >= 3:
-                                    filing_record['filing_date'] = (await cells.nth(2).inner_text()).strip()
-                                if cell_count >= 4:
-                                    filing_record['status'] = (await cells.nth(3).inner_text()).strip()
-
-                                if filing_record.get('file_number') or filing_record.get('debtor_name'):
-                                    filings.append(filing_record)
-                                    print(f"   Row {i}: {filing_record}")
-                        except Exception as row_error:
-                            print(f"   ⚠️  Error processing row {i}: {str(row_error)}")
-                            continue
+                    for i, cells in enumerate(row_cells[1:], start=1):
+                        if cells:
+                            # Typically: File Number, Debtor, Filing Date, Status, etc.
+                            filing_record = dict(zip(
+                                ['file_number', 'debtor_name', 'filing_date', 'status'], cells
+                            ))
+
+                            if filing_record.get('file_number') or filing_record.get('debtor_name'):
+                                filings.append(filing_record)
+                                print(f"   Row {i}: {filing_record}")
 
                 print(f"\n✓ Extracted {len(filings)} filing records")
 
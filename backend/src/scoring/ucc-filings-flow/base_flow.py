@@ -2,6 +2,7 @@
 Base UCC Flow Class
 All state-specific UCC flows should inherit from this class
 """
+import os
 from typing import Dict, Any, Optional
 from playwright.async_api import Page
 from abc import ABC, abstractmethod
@@ -13,6 +14,8 @@ class BaseUCCFlow(ABC):
     def __init__(self, state_name: str, state_url: str):
         self.state_name = state_name
         self.state_url = state_url
+        # Screenshots are debugging aids - only captured when UCC_FLOW_DEBUG=1
+        self.debug = os.getenv("UCC_FLOW_DEBUG") == "1"
 
     @abstractmethod
     async def navigate_to_search(self, page: Page) -> bool:
@@ -116,17 +119,21 @@ class BaseUCCFlow(ABC):
             "filings": []
         }
 
-    async def take_screenshot(self, page: Page, filename: str) -> str:
+    async def take_screenshot(self, page: Page, filename: str) -> Optional[str]:
         """
-        Take a screenshot of the current page
+        Take a screenshot of the current page.
+        Skipped unless debugging is enabled (UCC_FLOW_DEBUG=1).
 
         Args:
             page: Playwright page object
             filename: Name for the screenshot file
 
         Returns:
-            str: Path to the saved screenshot
+            Optional[str]: Path to the saved screenshot, or None when skipped
         """
+        if not self.debug:
+            return None
+
         screenshot_path = f"/tmp/{filename}"
         await page.screenshot(path=screenshot_path, full_page=True)
         return screenshot_path
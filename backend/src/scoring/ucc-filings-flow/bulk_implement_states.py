@@ -5,61 +5,63 @@ using the Oregon pattern as a template.
 
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Optional, Tuple
 
-# State name to file name mapping
+# State name -> (file name, class name prefix), e.g. "New York" -> ("new_york", "NewYork")
 STATE_FILE_NAMES = {
-    "Alabama": "alabama",
-    "Alaska": "alaska",
-    "Arizona": "arizona",
-    "Arkansas": "arkansas",
-    "California": "california",
-    "Colorado": "colorado",
-    "Connecticut": "connecticut",
-    "Delaware": "delaware",
-    "District of Columbia": "district_of_columbia",
-    "Florida": "florida",
-    "Georgia": "georgia",
-    "Hawaii": "hawaii",
-    "Idaho": "idaho",
-    "Illinois": "illinois",
-    "Indiana": "indiana",
-    "Iowa": "iowa",
-    "Kansas": "kansas",
-    "Kentucky": "kentucky",
-    "Louisiana": "louisiana",
-    "Maine": "maine",
-    "Maryland": "maryland",
-    "Massachusetts": "massachusetts",
-    "Michigan": "michigan",
-    "Minnesota": "minnesota",
-    "Mississippi": "mississippi",
-    "Missouri": "missouri",
-    "Montana": "montana",
-    "Nebraska": "nebraska",
-    "Nevada": "nevada",
-    "New Hampshire": "new_hampshire",
-    "New Jersey": "new_jersey",
-    "New Mexico": "new_mexico",
-    "New York": "new_york",
-    "North Carolina": "north_carolina",
-    "North Dakota": "north_dakota",
-    "Ohio": "ohio",
-    "Oklahoma": "oklahoma",
-    "Oregon": "oregon",
-    "Pennsylvania": "pennsylvania",
-    "Rhode Island": "rhode_island",
-    "South Carolina": "south_carolina",
-    "South Dakota": "south_dakota",
-    "Tennessee": "tennessee",
-    "Texas": "texas",
-    "Utah": "utah",
-    "Vermont": "vermont",
-    "Virginia": "virginia",
-    "Washington": "washington",
-    "West Virginia": "west_virginia",
-    "Wisconsin": "wisconsin",
-    "Wyoming": "wyoming"
+    "Alabama": ("alabama", "Alabama"),
+    "Alaska": ("alaska", "Alaska"),
+    "Arizona": ("arizona", "Arizona"),
+    "Arkansas": ("arkansas", "Arkansas"),
+    "California": ("california", "California"),
+    "Colorado": ("colorado", "Colorado"),
+    "Connecticut": ("connecticut", "Connecticut"),
+    "Delaware": ("delaware", "Delaware"),
+    "District of Columbia": ("district_of_columbia", "DistrictofColumbia"),
+    "Florida": ("florida", "Florida"),
+    "Georgia": ("georgia", "Georgia"),
+    "Hawaii": ("hawaii", "Hawaii"),
+    "Idaho": ("idaho", "Idaho"),
+    "Illinois": ("illinois", "Illinois"),
+    "Indiana": ("indiana", "Indiana"),
+    "Iowa": ("iowa", "Iowa"),
+    "Kansas": ("kansas", "Kansas"),
+    "Kentucky": ("kentucky", "Kentucky"),
+    "Louisiana": ("louisiana", "Louisiana"),
+    "Maine": ("maine", "Maine"),
+    "Maryland": ("maryland", "Maryland"),
+    "Massachusetts": ("massachusetts", "Massachusetts"),
+    "Michigan": ("michigan", "Michigan"),
+    "Minnesota": ("minnesota", "Minnesota"),
+    "Mississippi": ("mississippi", "Mississippi"),
+    "Missouri": ("missouri", "Missouri"),
+    "Montana": ("montana", "Montana"),
+    "Nebraska": ("nebraska", "Nebraska"),
+    "Nevada": ("nevada", "Nevada"),
+    "New Hampshire": ("new_hampshire", "NewHampshire"),
+    "New Jersey": ("new_jersey", "NewJersey"),
+    "New Mexico": ("new_mexico", "NewMexico"),
+    "New York": ("new_york", "NewYork"),
+    "North Carolina": ("north_carolina", "NorthCarolina"),
+    "North Dakota": ("north_dakota", "NorthDakota"),
+    "Ohio": ("ohio", "Ohio"),
+    "Oklahoma": ("oklahoma", "Oklahoma"),
+    "Oregon": ("oregon", "Oregon"),
+    "Pennsylvania": ("pennsylvania", "Pennsylvania"),
+    "Rhode Island": ("rhode_island", "RhodeIsland"),
+    "South Carolina": ("south_carolina", "SouthCarolina"),
+    "South Dakota": ("south_dakota", "SouthDakota"),
+    "Tennessee": ("tennessee", "Tennessee"),
+    "Texas": ("texas", "Texas"),
+    "Utah": ("utah", "Utah"),
+    "Vermont": ("vermont", "Vermont"),
+    "Virginia": ("virginia", "Virginia"),
+    "Washington": ("washington", "Washington"),
+    "West Virginia": ("west_virginia", "WestVirginia"),
+    "Wisconsin": ("wisconsin", "Wisconsin"),
+    "Wyoming": ("wyoming", "Wyoming")
 }
 
 # States to skip (already implemented or functional)
@@ -67,23 +69,57 @@ SKIP_STATES = ["Oregon", "Idaho", "Colorado", "Kentucky", "Connecticut", "Iowa",
                "Kansas", "Louisiana", "Alabama"]
 
 
-def generate_state_flow(state_name: str, state_url: str, class_name: str) -> str:
-    """Generate UCC flow implementation for a state"""
-
-    template = f'''"""
+# Generated flow source - built once, filled in per state with format_map.
+# Placeholders: state_name, state_url, class_name, file_name; literal braces are doubled
+STATE_FLOW_TEMPLATE = '''"""
 {state_name} UCC Filing Flow
 State-specific implementation for {state_name}'s UCC filing system
 URL: {state_url}
 """
 
 from typing import Dict, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from base_flow import BaseUCCFlow
 
 
 class {class_name}Flow(BaseUCCFlow):
     """{state_name}-specific UCC filing flow"""
 
+    # Form selectors, joined once per tier. query_selector_all returns DOM
+    # order, so generic inputs/links sit in a later tier that is only tried
+    # when the earlier one has no visible match
+    _INPUT_SELECTORS = (
+        ", ".join((
+            'input[name*="organization"]',
+            'input[name*="Organization"]',
+            'input[id*="organization"]',
+            'input[id*="orgName"]',
+            'input[name*="debtor"]',
+            'input[name*="Debtor"]',
+            'input[id*="debtor"]',
+            'input[name*="name"]',
+            'input[name*="Name"]',
+            'input[placeholder*="Organization"]',
+            'input[placeholder*="Business"]',
+            'input[placeholder*="Debtor"]',
+            'input[placeholder*="Name"]',
+        )),
+        ", ".join((
+            'input[type="text"]',
+            'input[type="search"]',
+        )),
+    )
+    _BUTTON_SELECTORS = (
+        ", ".join((
+            'button[type="submit"]',
+            'input[type="submit"]',
+            'button:has-text("Search")',
+            'button:has-text("Submit")',
+            'input[value*="Search"]',
+        )),
+        'a:has-text("Search")',
+    )
+
     async def navigate_to_search(self, page: Page) -> bool:
         """Navigate to {state_name} UCC search page"""
         try:
@@ -114,32 +150,12 @@ class {class_name}Flow(BaseUCCFlow):
 
             # Step 1: Look for organization name input
             print("   Step 1: Looking for organization name input...")
-            input_selectors = [
-                'input[name*="organization"]',
-                'input[name*="Organization"]',
-                'input[id*="organization"]',
-                'input[id*="orgName"]',
-                'input[name*="debtor"]',
-                'input[name*="Debtor"]',
-                'input[id*="debtor"]',
-                'input[name*="name"]',
-                'input[name*="Name"]',
-                'input[placeholder*="Organization"]',
-                'input[placeholder*="Business"]',
-                'input[placeholder*="Debtor"]',
-                'input[placeholder*="Name"]',
-                'input[type="text"]',
-                'input[type="search"]'
-            ]
-
             input_found = False
-            for selector in input_selectors:
+            for selectors in self._INPUT_SELECTORS:
                 try:
-                    input_field = await page.query_selector(selector)
-                    if input_field:
-                        is_visible = await input_field.is_visible()
-                        if is_visible:
-                            print(f"   ✓ Found input field: {{selector}}")
+                    for input_field in await page.query_selector_all(selectors):
+                        if await input_field.is_visible():
+                            print("   ✓ Found input field")
                             await input_field.fill(search_query)
                             await page.wait_for_timeout(1000)
                             print(f"   ✓ Organization name entered: {{search_query}}")
@@ -147,52 +163,49 @@ class {class_name}Flow(BaseUCCFlow):
                             break
                 except:
                     continue
+                if input_found:
+                    break
 
             if not input_found:
                 print("   ⚠️  Could not find organization name input")
 
             # Step 2: Click the search button
             print("   Step 2: Clicking search button...")
-            button_selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button:has-text("Search")',
-                'button:has-text("Submit")',
-                'input[value*="Search"]',
-                'a:has-text("Search")'
-            ]
-
             button_found = False
-            for selector in button_selectors:
+            for selectors in self._BUTTON_SELECTORS:
                 try:
-                    button = await page.query_selector(selector)
-                    if button:
-                        is_visible = await button.is_visible()
-                        if is_visible:
-                            print(f"   ✓ Found search button: {{selector}}")
+                    for button in await page.query_selector_all(selectors):
+                        if await button.is_visible():
+                            print("   ✓ Found search button")
                             await button.click()
                             print("   ✓ Search button clicked")
                             button_found = True
                             break
                 except:
                     continue
+                if button_found:
+                    break
 
             if not button_found:
                 print("   ⚠️  Could not find search button")
 
-            # Step 3: Wait for results to load
+            # Step 3: Wait for results to load - returns as soon as the
+            # page goes quiet instead of always sleeping
             print("   Step 3: Waiting for results...")
-            await page.wait_for_timeout(3000)
-            print("   ✓ Results loaded")
+            try:
+                await page.wait_for_load_state("networkidle", timeout=15000)
+                print("   ✓ Results loaded")
+            except PlaywrightTimeoutError:
+                print("   ⚠️  Page still busy after 15s, continuing")
 
             # Take screenshot of results
-            await self.take_screenshot(page, f"{STATE_FILE_NAMES.get(state_name, state_name.lower())}_search_results.png")
+            await self.take_screenshot(page, f"{file_name}_search_results.png")
 
             print("✓ {state_name} search form completed successfully")
             return True
         except Exception as e:
             print(f"❌ {state_name} form fill error: {{str(e)}}")
-            await self.take_screenshot(page, f"{STATE_FILE_NAMES.get(state_name, state_name.lower())}_error.png")
+            await self.take_screenshot(page, f"{file_name}_error.png")
             return False
 
     async def extract_results(self, page: Page) -> Dict[str, Any]:
@@ -210,7 +223,7 @@ class {class_name}Flow(BaseUCCFlow):
             print(f"   Page URL: {{page_url}}")
 
             # Take screenshot of final results
-            await self.take_screenshot(page, f"{STATE_FILE_NAMES.get(state_name, state_name.lower())}_final_results.png")
+            await self.take_screenshot(page, f"{file_name}_final_results.png")
 
             # Extract data from tables
             filings = []
@@ -224,38 +237,23 @@ class {class_name}Flow(BaseUCCFlow):
 
                 if table_count > 0:
                     # Try to extract from the main results table
-                    rows = page.locator('table tr')
-                    row_count = await rows.count()
-                    print(f"   Found {{row_count}} rows in tables")
+                    # All rows' cell texts in one evaluate_all round-trip
+                    row_cells = await page.locator('table tr').evaluate_all(
+                        "rows => rows.map(row => Array.from(row.querySelectorAll('td'), cell => cell.innerText.trim()))"
+                    )
+                    print(f"   Found {{len(row_cells)}} rows in tables")
 
                     # Process each row (skip header)
-                    for i in range(1, row_count):
-                        row = rows.nth(i)
-                        try:
-                            # Extract all cells
-                            cells = row.locator('td')
-                            cell_count = await cells.count()
-
-                            if cell_count > 0:
-                                # Extract data from cells
-                                filing_record = {{}}
-
-                                # Typically: File Number, Debtor, Filing Date, Status, etc.
-                                if cell_count >= 1:
-                                    filing_record['file_number'] = (await cells.nth(0).inner_text()).strip()
-                                if cell_count >= 2:
-                                    filing_record['debtor_name'] = (await cells.nth(1).inner_text()).strip()
-                                if cell_count >= 3:
-                                    filing_record['filing_date'] = (await cells.nth(2).inner_text()).strip()
-                                if cell_count >= 4:
-                                    filing_record['status'] = (await cells.nth(3).inner_text()).strip()
-
-                                if filing_record.get('file_number') or filing_record.get('debtor_name'):
-                                    filings.append(filing_record)
-                                    print(f"   Row {{i}}: {{filing_record}}")
-                        except Exception as row_error:
-                            print(f"   ⚠️  Error processing row {{i}}: {{str(row_error)}}")
-                            continue
+                    for i, cells in enumerate(row_cells[1:], start=1):
+                        if cells:
+                            # Typically: File Number, Debtor, Filing Date, Status, etc.
+                            filing_record = dict(zip(
+                                ['file_number', 'debtor_name', 'filing_date', 'status'], cells
+                            ))
+
+                            if filing_record.get('file_number') or filing_record.get('debtor_name'):
+                                filings.append(filing_record)
+                                print(f"   Row {{i}}: {{filing_record}}")
 
                 print(f"\\n✓ Extracted {{len(filings)}} filing records")
 
@@ -276,7 +274,54 @@ class {class_name}Flow(BaseUCCFlow):
             print(f"❌ {state_name} extraction error: {{str(e)}}")
             return {{"filings": [], "total_count": 0, "error": str(e)}}
 '''
-    return template
+
+
+def generate_state_flow(state_name: str, state_url: str, class_name: str) -> str:
+    """Generate UCC flow implementation for a state"""
+    return STATE_FLOW_TEMPLATE.format_map({
+        "state_name": state_name,
+        "state_url": state_url,
+        "class_name": class_name,
+        "file_name": STATE_FILE_NAMES.get(state_name, (state_name.lower(),))[0],
+    })
+
+
+def _emit(state_data: dict, output_dir: Path) -> Tuple[Optional[str], str]:
+    """
+    Generate and write the flow file for one state entry.
+
+    Returns:
+        (status, message) - status is "implemented", "skipped", or None
+        when the entry is ignored
+    """
+    state_name = state_data.get("text", "")
+    state_url = state_data.get("value", "")
+
+    # Skip empty entries
+    if not state_name or not state_url or state_name == "Please select":
+        return None, ""
+
+    # Skip already implemented states
+    if state_name in SKIP_STATES:
+        return "skipped", f"⏭️  Skipping {state_name} (already implemented)"
+
+    # Get file and class names
+    names = STATE_FILE_NAMES.get(state_name)
+    if not names:
+        return None, f"⚠️  No file mapping for {state_name}"
+    file_name, class_name = names
+
+    # Generate the implementation
+    implementation = generate_state_flow(state_name, state_url, class_name)
+
+    # Write to a temp file and swap it in, so an interrupted run never
+    # leaves a half-written flow module behind
+    output_file = output_dir / f"{file_name}.py"
+    tmp_file = output_file.with_suffix(".py.tmp")
+    tmp_file.write_text(implementation)
+    os.replace(tmp_file, output_file)
+
+    return "implemented", f"✅ Generated {state_name} -> {file_name}.py"
 
 
 def main():
@@ -290,43 +335,22 @@ def main():
     # Get current directory
     current_dir = Path(__file__).parent
 
+    # States are independent, so generate and write them in parallel;
+    # map() keeps results in input order for the log below
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        results = list(executor.map(lambda state_data: _emit(state_data, current_dir), state_options))
+
     # Track implementation stats
     implemented = 0
     skipped = 0
 
-    for state_data in state_options:
-        state_name = state_data.get("text", "")
-        state_url = state_data.get("value", "")
-
-        # Skip empty entries
-        if not state_name or not state_url or state_name == "Please select":
-            continue
-
-        # Skip already implemented states
-        if state_name in SKIP_STATES:
-            print(f"⏭️  Skipping {state_name} (already implemented)")
+    for status, message in results:
+        if message:
+            print(message)
+        if status == "implemented":
+            implemented += 1
+        elif status == "skipped":
             skipped += 1
-            continue
-
-        # Get file name
-        file_name = STATE_FILE_NAMES.get(state_name)
-        if not file_name:
-            print(f"⚠️  No file mapping for {state_name}")
-            continue
-
-        # Generate class name (e.g., "New York" -> "NewYork")
-        class_name = state_name.replace(" ", "")
-
-        # Generate the implementation
-        implementation = generate_state_flow(state_name, state_url, class_name)
-
-        # Write to file
-        output_file = current_dir / f"{file_name}.py"
-        with open(output_file, 'w') as f:
-            f.write(implementation)
-
-        print(f"✅ Generated {state_name} -> {file_name}.py")
-        implemented += 1
 
     print(f"\n{'='*60}")
     print(f"Implementation complete!")
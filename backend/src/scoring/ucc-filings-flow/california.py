@@ -5,7 +5,7 @@ URL: https://bizfileonline.sos.ca.gov/search/ucc
 """
 
 from typing import Dict, Any
-from playwright.async_api import Page
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
 from base_flow import BaseUCCFlow
 
 
@@ -14,16 +14,24 @@ class CaliforniaFlow(BaseUCCFlow):
 
     SEARCH_URL = "https://bizfileonline.sos.ca.gov/search/ucc"
 
+    # Search finished: a result row or the "no results" message is visible.
+    # The empty results tbody is already in the DOM before the search returns,
+    # so waiting on the tbody alone can read the table too early
+    RESULTS_READY_SELECTOR = (
+        "tbody.div-table-body > tr.div-table-row, "
+        ':text-matches("no (results|records) found", "i")'
+    )
+
     async def navigate_to_search(self, page: Page) -> bool:
         """Navigate to California UCC search page"""
         try:
             print(f"📍 Navigating to California UCC search page...")
             print(f"   URL: {self.SEARCH_URL}")
 
+            # No fixed sleep - fill_search_form waits for the search input itself
             await page.goto(
                 self.SEARCH_URL, wait_until="domcontentloaded", timeout=30000
             )
-            await page.wait_for_timeout(3000)
 
             print("✓ Successfully navigated to California UCC search page")
             return True
@@ -36,8 +44,8 @@ class CaliforniaFlow(BaseUCCFlow):
         Fill California UCC search form
 
         Steps:
-        1. Find and fill the search input: //input[@placeholder="Search by name or file number"]
-        2. Click the advanced search button: //button[contains(@class,"advanced-search-button")]
+        1. Find and fill the search input: input[placeholder="Search by name or file number"]
+        2. Click the advanced search button: button[class*="search-button"]
         3. Wait for results
         """
         try:
@@ -47,7 +55,7 @@ class CaliforniaFlow(BaseUCCFlow):
             print("   Step 1: Looking for search input field...")
             try:
                 search_input = page.locator(
-                    '//input[@placeholder="Search by name or file number"]'
+                    'input[placeholder="Search by name or file number"]'
                 )
                 await search_input.wait_for(state="visible", timeout=100000)
                 print("   ✓ Found search input field")
@@ -64,9 +72,7 @@ class CaliforniaFlow(BaseUCCFlow):
             # Step 2: Click the advanced search button
             print("   Step 2: Clicking advanced search button...")
             try:
-                search_button = page.locator(
-                    '//button[contains(@class,"search-button")]'
-                )
+                search_button = page.locator('button[class*="search-button"]')
                 await search_button.wait_for(state="visible", timeout=100000)
                 print("   ✓ Found advanced search button")
 
@@ -78,10 +84,17 @@ class CaliforniaFlow(BaseUCCFlow):
                 await self.take_screenshot(page, f"california_button_error.png")
                 return False
 
-            # Step 3: Wait for results to load
+            # Step 3: Wait for a result row or the no-results message instead
+            # of a fixed sleep
             print("   Step 3: Waiting for results...")
-            await page.wait_for_timeout(5000)
-            print("   ✓ Results loaded")
+            try:
+                await page.wait_for_selector(
+                    self.RESULTS_READY_SELECTOR, state="visible", timeout=15000
+                )
+                print("   ✓ Results loaded")
+            except PlaywrightTimeoutError:
+                # extract_results still reads whatever rows are present
+                print("   ⚠️  No result rows or no-results message within 15s")
 
             # Take screenshot of results
             await self.take_screenshot(page, f"california_search_results.png")
@@ -118,66 +131,46 @@ class CaliforniaFlow(BaseUCCFlow):
             filings = []
 
             try:
-                # Find all rows in the table body using XPath
+                # Read every row's cell texts in one evaluate_all round-trip
+                # instead of a count() + inner_text() call per cell.
+                # Class selectors, so extra whitespace in class attributes is fine
                 print("   Looking for result table rows...")
-
-                # Use XPath to find tbody rows in the div-table
-                rows = page.locator(
-                    '//tbody[@class="div-table-body"]/tr[@class="div-table-row  "]'
+                rows = page.locator("tbody.div-table-body > tr.div-table-row")
+                row_cells = await rows.evaluate_all(
+                    """rows => rows.map(row => Array.from(
+                        row.querySelectorAll('td.div-table-cell.interactive'),
+                        cell => cell.innerText.trim()
+                    ))"""
                 )
-                row_count = await rows.count()
-                print(f"   Found {row_count} filing rows")
+                print(f"   Found {len(row_cells)} filing rows")
 
                 # Process each row
-                for i in range(row_count):
-                    try:
-                        row = rows.nth(i)
-
-                        # Extract all cell values (columns in order):
-                        # 0: UCC Type
-                        # 1: Debtor Information
-                        # 2: File Number
-                        # 3: Secured Party Info
-                        # 4: Status
-                        # 5: Filing Date
-                        # 6: Lapse Date
-
-                        # Get all td cells in the row
-                        cells = row.locator(
-                            'xpath=.//td[@class="div-table-cell  interactive"]'
+                for i, cells in enumerate(row_cells):
+                    # Cell values (columns in order):
+                    # 0: UCC Type
+                    # 1: Debtor Information
+                    # 2: File Number
+                    # 3: Secured Party Info
+                    # 4: Status
+                    # 5: Filing Date
+                    # 6: Lapse Date
+                    if len(cells) >= 7:
+                        filing_record = {
+                            "ucc_type": cells[0],
+                            "debtor_name": cells[1],
+                            "file_number": cells[2],
+                            "secured_party": cells[3],
+                            "status": cells[4],
+                            "filing_date": cells[5],
+                            "lapse_date": cells[6],
+                        }
+
+                        filings.append(filing_record)
+                        print(f"   Row {i + 1}: {filing_record}")
+                    else:
+                        print(
+                            f"   ⚠️  Row {i + 1} has only {len(cells)} cells, expected 7"
                         )
-                        cell_count = await cells.count()
-
-                        if cell_count >= 7:
-                            # Extract text from each cell (handles nested spans/divs)
-                            filing_record = {
-                                "ucc_type": (await cells.nth(0).inner_text()).strip(),
-                                "debtor_name": (
-                                    await cells.nth(1).inner_text()
-                                ).strip(),
-                                "file_number": (
-                                    await cells.nth(2).inner_text()
-                                ).strip(),
-                                "secured_party": (
-                                    await cells.nth(3).inner_text()
-                                ).strip(),
-                                "status": (await cells.nth(4).inner_text()).strip(),
-                                "filing_date": (
-                                    await cells.nth(5).inner_text()
-                                ).strip(),
-                                "lapse_date": (await cells.nth(6).inner_text()).strip(),
-                            }
-
-                            filings.append(filing_record)
-                            print(f"   Row {i + 1}: {filing_record}")
-                        else:
-                            print(
-                                f"   ⚠️  Row {i + 1} has only {cell_count} cells, expected 7"
-                            )
-
-                    except Exception as row_error:
-                        print(f"   ⚠️  Error processing row {i + 1}: {str(row_error)}")
-                        continue
 
                 print(f"\n✓ Extracted {len(filings)} filing records")
 
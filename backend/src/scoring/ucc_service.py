@@ -4,12 +4,99 @@ UCC Filing Verification Service using Browserbase
 
 import os
 import json
+import logging
 import asyncio
+import weakref
 import httpx
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from browserbase import Browserbase
 from playwright.async_api import async_playwright
+from src.common.rate_limit import AsyncTokenBucket
+
+logger = logging.getLogger(__name__)
+
+_BAR = "=" * 80
+_BAR_60 = "=" * 60
+
+# UCC verification runs started per second across the process, so concurrent
+# batches don't hammer state UCC sites
+UCC_RATE_LIMIT = AsyncTokenBucket(float(os.getenv("UCC_RATE_LIMIT", "20")))
+
+# States scraped at once per UCC run, each in its own tab of the session
+UCC_STATE_CONCURRENCY = max(1, int(os.getenv("UCC_STATE_CONCURRENCY", "3")))
+
+# Browserbase session creations in flight at once per event loop, so
+# concurrent runs stay under the project's quota instead of hitting 429s
+BROWSERBASE_MAX_CONCURRENCY = max(1, int(os.getenv("BROWSERBASE_MAX_CONCURRENCY", "5")))
+# One semaphore per loop: a semaphore is bound to the first loop that waits on
+# it, and verify_ucc_filings_sync runs every call on a new loop
+_browserbase_create_limits: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _browserbase_create_limit() -> asyncio.Semaphore:
+    """Return the session creation semaphore for the running event loop."""
+    loop = asyncio.get_running_loop()
+    limit = _browserbase_create_limits.get(loop)
+    if limit is None:
+        limit = _browserbase_create_limits[loop] = asyncio.Semaphore(
+            BROWSERBASE_MAX_CONCURRENCY
+        )
+    return limit
+
+# Fields copied from each normalized UCC filing for TrustScore, with defaults
+_UCC_FILING_DEFAULTS = {
+    "file_number": "Unknown",
+    "status": "Unknown",
+    "filing_date": "Unknown",
+    "lapse_date": "Unknown",
+    "lien_type": "Unknown",
+    "debtor": "Unknown",
+    "secured_party": None,
+    "collateral": None,
+}
+
+
+def _ucc_filing_record(filing: Dict[str, Any], state: str) -> Dict[str, Any]:
+    record = {key: filing.get(key, default) for key, default in _UCC_FILING_DEFAULTS.items()}
+    record["state"] = state
+    return record
+
+
+def extract_ucc_filings(ucc_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten normalized filings from every visited state into TrustScore input.
+
+    Args:
+        ucc_data: UCC verification result with "visited_states"
+
+    Returns:
+        List of filing dicts, each tagged with the state it was found in
+    """
+    return [
+        _ucc_filing_record(filing, state_result.get("state", "Unknown"))
+        for state_result in ucc_data.get("visited_states", [])
+        if state_result.get("flow_used") and state_result.get("flow_result")
+        for filing in state_result["flow_result"].get("normalized_filings", [])
+    ]
+
+
+async def create_browserbase_session(bb: Browserbase, **kwargs):
+    """
+    Create a Browserbase session without blocking the event loop.
+    Bounded by BROWSERBASE_MAX_CONCURRENCY per event loop.
+
+    Args:
+        bb: Browserbase client
+        **kwargs: Arguments for bb.sessions.create
+
+    Returns:
+        The created Browserbase session
+    """
+    async with _browserbase_create_limit():
+        return await asyncio.to_thread(bb.sessions.create, **kwargs)
 
 
 class UCCVerificationService:
@@ -24,9 +111,9 @@ class UCCVerificationService:
         self.browserbase_project_id = os.getenv("BROWSERBASE_PROJECT_ID")
 
         if not self.browserbase_api_key:
-            print("⚠️  WARNING: BROWSERBASE_API_KEY not set in environment")
+            logger.warning("⚠️  WARNING: BROWSERBASE_API_KEY not set in environment")
         if not self.browserbase_project_id:
-            print("⚠️  WARNING: BROWSERBASE_PROJECT_ID not set in environment")
+            logger.warning("⚠️  WARNING: BROWSERBASE_PROJECT_ID not set in environment")
 
     async def _retry_with_backoff(
         self,
@@ -56,24 +143,33 @@ class UCCVerificationService:
             try:
                 result = await func()
                 if attempt > 0:
-                    print(f"✓ {context} succeeded on attempt {attempt + 1}")
+                    logger.info("✓ %s succeeded on attempt %s", context, attempt + 1)
                 return result
             except Exception as error:
                 last_error = error
 
                 if attempt == max_retries:
-                    print(
-                        f"❌ {context} failed after {max_retries + 1} attempts: {str(error)}"
+                    logger.error(
+                        "❌ %s failed after %s attempts: %s",
+                        context,
+                        max_retries + 1,
+                        str(error),
                     )
                     raise error
 
                 # Calculate exponential backoff delay: initial_delay * 2^attempt
                 delay = initial_delay * (2**attempt)
-                print(
-                    f"⚠️  {context} failed (attempt {attempt + 1}/{max_retries + 1}): {str(error)}"
+                logger.warning(
+                    "⚠️  %s failed (attempt %s/%s): %s",
+                    context,
+                    attempt + 1,
+                    max_retries + 1,
+                    str(error),
                 )
-                print(
-                    f"   Retrying in {delay:.1f}s... ({max_retries - attempt} attempts remaining)"
+                logger.info(
+                    "   Retrying in %.1fs... (%s attempts remaining)",
+                    delay,
+                    max_retries - attempt,
                 )
 
                 await asyncio.sleep(delay)
@@ -91,11 +187,22 @@ class UCCVerificationService:
             with open(data_path, "r") as f:
                 return json.load(f)
         except Exception as e:
-            print(f"⚠️  Warning: Could not load UCC state options: {e}")
+            logger.warning("⚠️  Warning: Could not load UCC state options: %s", e)
             return []
 
-    def _extract_state_from_result(self, result: Dict[str, Any]) -> Optional[str]:
-        """Extract state name from a search result"""
+    def _extract_state_from_result(self, result: Any) -> Optional[str]:
+        """
+        Extract state name from an NTSB result.
+
+        Accepts a parsed NTSBIncident (uses its ``state`` attribute), a parsed
+        incident dict (uses its ``state`` key) or a raw NTSB result dict with
+        a ``Fields`` array.
+        """
+        if not isinstance(result, dict):
+            return getattr(result, "state", None)
+        if "Fields" not in result:
+            return result.get("state")
+
         fields = result.get("Fields", [])
         for field in fields:
             if field.get("FieldName") == "State":
@@ -161,14 +268,14 @@ class UCCVerificationService:
         Returns:
             Dictionary containing state verification result
         """
-        print(f"📍 Processing {state_name}...")
-        print(f"   URL: {ucc_url}")
+        logger.info("📍 Processing %s...", state_name)
+        logger.debug("   URL: %s", ucc_url)
 
         # Try to get state-specific flow
         flow = self._get_flow_for_state(state_name, ucc_url)
 
         if flow:
-            print(f"✓ Using custom flow for {state_name}")
+            logger.info("✓ Using custom flow for %s", state_name)
             # Run the state-specific flow
             flow_result = await flow.run_flow(page, operator_name)
 
@@ -185,10 +292,10 @@ class UCCVerificationService:
             }
 
         else:
-            print(f"⚠️  No custom flow found for {state_name}, using basic scraping")
+            logger.warning("⚠️  No custom flow found for %s, using basic scraping", state_name)
             # Fallback to basic page scraping
             await page.goto(ucc_url, wait_until="domcontentloaded", timeout=30000)
-            print(f"✓ Navigated to {state_name} UCC page")
+            logger.info("✓ Navigated to %s UCC page", state_name)
 
             # Wait a bit for visibility
             await page.wait_for_timeout(2000)
@@ -205,11 +312,11 @@ class UCCVerificationService:
             }"""
             )
 
-            print(f"✓ Page title: {page_info['title']}")
-            print(f"✓ Page heading: {page_info['heading']}")
+            logger.info("✓ Page title: %s", page_info['title'])
+            logger.info("✓ Page heading: %s", page_info['heading'])
 
             # Scroll down to show content
-            print("📜 Scrolling page to show content...")
+            logger.info("📜 Scrolling page to show content...")
             await page.evaluate("window.scrollTo(0, 300)")
             await page.wait_for_timeout(1000)
 
@@ -224,7 +331,7 @@ class UCCVerificationService:
             screenshot_path = f"/tmp/ucc_search_{state_name}_{session_id}.png"
             with open(screenshot_path, "wb") as f:
                 f.write(screenshot_bytes)
-            print(f"✓ Screenshot saved: {screenshot_path}")
+            logger.info("✓ Screenshot saved: %s", screenshot_path)
 
             return {
                 "state": state_name,
@@ -234,6 +341,106 @@ class UCCVerificationService:
                 "screenshot_path": screenshot_path,
             }
 
+    async def _process_states(
+        self,
+        context,
+        page,
+        states_to_process: List[str],
+        state_options: List[Dict[str, str]],
+        operator_name: str,
+        session_id: str,
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Process every state concurrently, up to UCC_STATE_CONCURRENCY at once.
+        Each state runs in its own tab of the session's browser context; the
+        first state reuses the session's existing page.
+
+        Args:
+            context: Playwright browser context of the Browserbase session
+            page: Existing page of the session
+            states_to_process: State names to verify, in order
+            state_options: UCC state options (name, abbreviation, URL)
+            operator_name: Name of the operator to search for
+            session_id: Browserbase session ID for screenshots
+
+        Returns:
+            Tuple of (visited states, page info summaries), in state order
+        """
+        semaphore = asyncio.Semaphore(UCC_STATE_CONCURRENCY)
+
+        async def run_state(idx: int, state_name: str) -> Optional[Dict[str, Any]]:
+            if not state_name:
+                logger.warning("⚠️  Invalid state in list")
+                return None
+
+            # Get UCC URL for this state
+            ucc_url = self._get_ucc_url_for_state(state_name, state_options)
+
+            if not ucc_url:
+                logger.warning("⚠️  No UCC URL found for state: %s", state_name)
+                return None
+
+            async with semaphore:
+                logger.debug("\n%s", _BAR_60)
+                logger.info(
+                    "Processing state %s/%s: %s",
+                    idx + 1,
+                    len(states_to_process),
+                    state_name,
+                )
+                logger.debug("%s", _BAR_60)
+
+                state_page = page
+                if idx:
+                    state_page = await context.new_page()
+                    await state_page.set_viewport_size({"width": 1920, "height": 1080})
+                try:
+                    # Process state with retry logic (default 5 retries)
+                    return await self._retry_with_backoff(
+                        lambda: self._process_single_state(
+                            state_page, state_name, ucc_url, operator_name, session_id
+                        ),
+                        max_retries=5,
+                        initial_delay=1.0,
+                        context=f"State verification for {state_name}",
+                    )
+                except Exception as e:
+                    logger.error("❌ Error processing %s after all retries: %s", state_name, str(e))
+                    # Add failed state to results
+                    return {
+                        "state": state_name,
+                        "url": ucc_url,
+                        "error": str(e),
+                        "status": "failed_after_retries",
+                    }
+                finally:
+                    if state_page is not page:
+                        await state_page.close()
+
+        results = await asyncio.gather(
+            *[run_state(idx, state_name) for idx, state_name in enumerate(states_to_process)]
+        )
+
+        visited_states = []
+        all_page_info = []
+        for state_result in results:
+            if state_result is None:
+                continue
+            visited_states.append(state_result)
+
+            # Extract page info for summary (failed states have none)
+            if state_result.get("flow_used"):
+                all_page_info.append(state_result["page_info"])
+            elif state_result.get("status") != "failed_after_retries":
+                all_page_info.append(
+                    {
+                        "state": state_result["state"],
+                        **state_result.get("page_info", {}),
+                    }
+                )
+
+        return visited_states, all_page_info
+
     def _get_flow_for_state(self, state_name: str, state_url: str):
         """
         Dynamically import and get the flow class for a specific state
@@ -299,13 +506,13 @@ class UCCVerificationService:
             return flow_class(state_name, state_url)
 
         except Exception as e:
-            print(f"⚠️  Could not load flow for {state_name}: {str(e)}")
+            logger.warning("⚠️  Could not load flow for %s: %s", state_name, str(e))
             return None
 
     async def verify_ucc_filings(
         self,
         operator_name: str,
-        ntsb_results: List[Dict[str, Any]],
+        ntsb_results: List[Any],
         faa_state: str,
         state: Optional[str] = None,
         ucc_ready_states: Optional[List[str]] = None,
@@ -315,7 +522,7 @@ class UCCVerificationService:
 
         Args:
             operator_name: Name of the operator to verify
-            ntsb_results: NTSB results from previous NTSB check (required)
+            ntsb_results: Parsed NTSB incidents (or raw NTSB results) from previous NTSB check
             faa_state: FAA state code (2-letter abbreviation) - used as fallback if no filings found in NTSB states
             state: Optional state code for targeted search
             ucc_ready_states: List of state abbreviations with UCC scrapers ready (e.g., ["CA", "FL"])
@@ -323,13 +530,13 @@ class UCCVerificationService:
         Returns:
             Dictionary containing UCC verification results
         """
-        print(f"\n{'=' * 80}")
-        print(f"VERIFYING UCC FILINGS FOR: {operator_name}")
+        logger.debug("\n%s", _BAR)
+        logger.info("VERIFYING UCC FILINGS FOR: %s", operator_name)
         if state:
-            print(f"State: {state}")
+            logger.info("State: %s", state)
         else:
-            print("State: Will be determined from NTSB results")
-        print(f"{'=' * 80}\n")
+            logger.info("State: Will be determined from NTSB results")
+        logger.debug("%s\n", _BAR)
 
         if not self.browserbase_api_key or not self.browserbase_project_id:
             return self._create_error_response(
@@ -341,7 +548,8 @@ class UCCVerificationService:
             bb = Browserbase(api_key=self.browserbase_api_key)
 
             # Create a new session with live view enabled and US proxy
-            session = bb.sessions.create(
+            session = await create_browserbase_session(
+                bb,
                 project_id=self.browserbase_project_id,
                 proxies=True,  # Enable proxies with US location
             )
@@ -354,32 +562,31 @@ class UCCVerificationService:
             # For live view, we'll use the debug URL since /live requires auth
             live_view_url = debug_url
 
-            print(f"✓ Browserbase session created: {session_id}")
-            print(f"✓ Connect URL: {connect_url}")
-            print(f"✓ Debug URL: {debug_url}")
-            print(f"\n🎥 Open this URL to watch: {debug_url}\n")
+            logger.info("✓ Browserbase session created: %s", session_id)
+            logger.debug("✓ Connect URL: %s", connect_url)
+            logger.debug("✓ Debug URL: %s", debug_url)
+            logger.debug("\n🎥 Open this URL to watch: %s\n", debug_url)
 
             # Use NTSB results from previous step and load state options
-            print(
-                f"✓ Using NTSB results from previous step ({len(ntsb_results)} incidents)"
-            )
+            logger.info("✓ Using NTSB results from previous step (%s incidents)", len(ntsb_results))
             search_results = ntsb_results
             state_options = self._load_ucc_state_options()
 
-            if not search_results:
-                print(
+            # Only meaningful when NTSB incidents actually pick the states
+            if not search_results and not state and not ucc_ready_states:
+                logger.warning(
                     "⚠️  No NTSB incidents found for this operator - will use FAA state only"
                 )
 
             if not state_options:
-                print("⚠️  No state options found")
+                logger.warning("⚠️  No state options found")
                 return self._create_error_response(
                     operator_name, "No state options found"
                 )
 
             if search_results:
-                print(f"✓ Found {len(search_results)} NTSB incidents from API")
-            print(f"✓ Loaded {len(state_options)} state options")
+                logger.info("✓ Found %s NTSB incidents from API", len(search_results))
+            logger.info("✓ Loaded %s state options", len(state_options))
 
             # Use Playwright to connect to the Browserbase session
             async with async_playwright() as p:
@@ -389,16 +596,12 @@ class UCCVerificationService:
 
                 # Set viewport to a larger size for better preview visibility
                 await page.set_viewport_size({"width": 1920, "height": 1080})
-                print("✓ Connected to Browserbase browser (viewport: 1920x1080)")
-
-                # Process each search result
-                visited_states = []
-                all_page_info = []
+                logger.info("✓ Connected to Browserbase browser (viewport: 1920x1080)")
 
                 # Determine states to process
                 if state:
                     states_to_process = [state]
-                    print(f"📍 Processing specified state: {state}")
+                    logger.info("📍 Processing specified state: %s", state)
                 else:
                     # Extract states from NTSB results
                     states_to_process = [
@@ -425,11 +628,13 @@ class UCCVerificationService:
                             # Only add if not already in the list
                             if faa_state_full_name not in states_to_process:
                                 states_to_process.append(faa_state_full_name)
-                                print(
-                                    f"📍 Adding FAA state to queue: {faa_state_full_name} ({faa_state})"
+                                logger.info(
+                                    "📍 Adding FAA state to queue: %s (%s)",
+                                    faa_state_full_name,
+                                    faa_state,
                                 )
 
-                    print(f"📍 Processing states: {states_to_process}")
+                    logger.info("📍 Processing states: %s", states_to_process)
 
                 # Use UCC ready states list if provided
                 if ucc_ready_states:
@@ -442,77 +647,19 @@ class UCCVerificationService:
 
                     # Use ready states as the processing list (ignore other states)
                     if ready_full_names:
-                        print(f"📍 Using UCC ready states: {ready_full_names}")
+                        logger.info("📍 Using UCC ready states: %s", ready_full_names)
                         states_to_process = ready_full_names
 
-                for idx, state_name in enumerate(states_to_process):
-                    if not state_name:
-                        print(f"⚠️  Invalid state in list")
-                        continue
+                visited_states, all_page_info = await self._process_states(
+                    context, page, states_to_process, state_options, operator_name, session_id
+                )
 
-                    print(f"\n{'=' * 60}")
-                    print(
-                        f"Processing state {idx + 1}/{len(states_to_process)}: {state_name}"
-                    )
-                    print(f"{'=' * 60}")
-
-                    # Get UCC URL for this state
-                    ucc_url = self._get_ucc_url_for_state(state_name, state_options)
-
-                    if not ucc_url:
-                        print(f"⚠️  No UCC URL found for state: {state_name}")
-                        continue
-
-                    try:
-                        # Process state with retry logic (default 5 retries)
-                        state_result = await self._retry_with_backoff(
-                            lambda: self._process_single_state(
-                                page, state_name, ucc_url, operator_name, session_id
-                            ),
-                            max_retries=5,
-                            initial_delay=1.0,
-                            context=f"State verification for {state_name}",
-                        )
-
-                        # Add to visited states
-                        visited_states.append(state_result)
-
-                        # Extract page info for summary
-                        if state_result.get("flow_used"):
-                            all_page_info.append(state_result["page_info"])
-                        else:
-                            all_page_info.append(
-                                {
-                                    "state": state_name,
-                                    **state_result.get("page_info", {}),
-                                }
-                            )
-
-                        # Wait a bit before moving to next state
-                        print("⏱️  Waiting 3 seconds before next state...")
-                        await page.wait_for_timeout(3000)
-
-                    except Exception as e:
-                        print(
-                            f"❌ Error processing {state_name} after all retries: {str(e)}"
-                        )
-                        # Add failed state to results
-                        visited_states.append(
-                            {
-                                "state": state_name,
-                                "url": ucc_url,
-                                "error": str(e),
-                                "status": "failed_after_retries",
-                            }
-                        )
-                        continue
-
-                print(f"\n{'=' * 60}")
-                print(f"✓ Processed {len(visited_states)} states successfully")
-                print(f"{'=' * 60}\n")
+                logger.debug("\n%s", _BAR_60)
+                logger.info("✓ Processed %s states successfully", len(visited_states))
+                logger.debug("%s\n", _BAR_60)
 
                 await browser.close()
-                print("✓ Browser session closed")
+                logger.info("✓ Browser session closed")
 
                 # Create result
                 result = {
@@ -530,20 +677,20 @@ class UCCVerificationService:
                     "browserbase_live_view_url": live_view_url,
                 }
 
-                print(f"\n✓ UCC verification completed")
-                print(f"Session debug URL: {debug_url}")
-                print(f"{'=' * 80}\n")
+                logger.info("\n✓ UCC verification completed")
+                logger.debug("Session debug URL: %s", debug_url)
+                logger.debug("%s\n", _BAR)
 
                 return result
 
         except Exception as error:
-            print(f"❌ UCC verification error: {str(error)}")
+            logger.error("❌ UCC verification error: %s", str(error))
             return self._create_error_response(operator_name, str(error))
 
     async def verify_ucc_filings_with_session(
         self,
         operator_name: str,
-        ntsb_results: List[Dict[str, Any]],
+        ntsb_results: List[Any],
         faa_state: str,
         state: Optional[str] = None,
         existing_session_id: Optional[str] = None,
@@ -555,14 +702,15 @@ class UCCVerificationService:
 
         Args:
             operator_name: Name of the operator to verify
-            ntsb_results: NTSB results from previous NTSB check (required)
+            ntsb_results: Parsed NTSB incidents (or raw NTSB results) from previous NTSB check
             faa_state: FAA state code (2-letter abbreviation) - used as fallback if no filings found
             state: Optional state code for targeted search
             existing_session_id: Optional existing Browserbase session ID
             ucc_ready_states: List of state abbreviations with UCC scrapers ready (e.g., ["CA", "FL"])
         """
+        await UCC_RATE_LIMIT.acquire()
         if existing_session_id:
-            print(f"Using existing Browserbase session: {existing_session_id}")
+            logger.info("Using existing Browserbase session: %s", existing_session_id)
             return await self._run_ucc_automation(
                 operator_name, ntsb_results, faa_state, state, existing_session_id, ucc_ready_states
             )
@@ -575,7 +723,7 @@ class UCCVerificationService:
     async def _run_ucc_automation(
         self,
         operator_name: str,
-        ntsb_results: List[Dict[str, Any]],
+        ntsb_results: List[Any],
         faa_state: str,
         state: Optional[str],
         session_id: str,
@@ -586,7 +734,7 @@ class UCCVerificationService:
 
         Args:
             operator_name: Name of the operator to verify
-            ntsb_results: NTSB results from previous NTSB check (required)
+            ntsb_results: Parsed NTSB incidents (or raw NTSB results) from previous NTSB check
             faa_state: FAA state code (2-letter abbreviation) - used as fallback if no filings found
             state: Optional state code for targeted search
             session_id: Browserbase session ID
@@ -595,39 +743,38 @@ class UCCVerificationService:
         try:
             # Get session info
             bb = Browserbase(api_key=self.browserbase_api_key)
-            session = bb.sessions.retrieve(session_id)
+            session = await asyncio.to_thread(bb.sessions.retrieve, session_id)
             connect_url = session.connect_url
 
             debug_url = f"https://www.browserbase.com/sessions/{session_id}"
             live_view_url = debug_url
 
-            print(f"✓ Connected to existing session: {session_id}")
+            logger.info("✓ Connected to existing session: %s", session_id)
             if state:
-                print(f"State: {state}")
+                logger.info("State: %s", state)
             else:
-                print("State: Will be determined from NTSB results")
+                logger.info("State: Will be determined from NTSB results")
 
             # Use NTSB results from previous step and load state options
-            print(
-                f"✓ Using NTSB results from previous step ({len(ntsb_results)} incidents)"
-            )
+            logger.info("✓ Using NTSB results from previous step (%s incidents)", len(ntsb_results))
             search_results = ntsb_results
             state_options = self._load_ucc_state_options()
 
-            if not search_results:
-                print(
+            # Only meaningful when NTSB incidents actually pick the states
+            if not search_results and not state and not ucc_ready_states:
+                logger.warning(
                     "⚠️  No NTSB incidents found for this operator - will use FAA state only"
                 )
 
             if not state_options:
-                print("⚠️  No state options found")
+                logger.warning("⚠️  No state options found")
                 return self._create_error_response(
                     operator_name, "No state options found"
                 )
 
             if search_results:
-                print(f"✓ Found {len(search_results)} NTSB incidents from API")
-            print(f"✓ Loaded {len(state_options)} state options")
+                logger.info("✓ Found %s NTSB incidents from API", len(search_results))
+            logger.info("✓ Loaded %s state options", len(state_options))
 
             # Use Playwright to connect to the Browserbase session
             async with async_playwright() as p:
@@ -637,16 +784,12 @@ class UCCVerificationService:
 
                 # Set viewport to a larger size for better preview visibility
                 await page.set_viewport_size({"width": 1920, "height": 1080})
-                print("✓ Connected to Browserbase browser (viewport: 1920x1080)")
-
-                # Process each search result
-                visited_states = []
-                all_page_info = []
+                logger.info("✓ Connected to Browserbase browser (viewport: 1920x1080)")
 
                 # Determine states to process
                 if state:
                     states_to_process = [state]
-                    print(f"📍 Processing specified state: {state}")
+                    logger.info("📍 Processing specified state: %s", state)
                 else:
                     # Extract states from NTSB results
                     states_to_process = [
@@ -673,11 +816,13 @@ class UCCVerificationService:
                             # Only add if not already in the list
                             if faa_state_full_name not in states_to_process:
                                 states_to_process.append(faa_state_full_name)
-                                print(
-                                    f"📍 Adding FAA state to queue: {faa_state_full_name} ({faa_state})"
+                                logger.info(
+                                    "📍 Adding FAA state to queue: %s (%s)",
+                                    faa_state_full_name,
+                                    faa_state,
                                 )
 
-                    print(f"📍 Processing states: {states_to_process}")
+                    logger.info("📍 Processing states: %s", states_to_process)
 
                 # Use UCC ready states list if provided
                 if ucc_ready_states:
@@ -690,77 +835,19 @@ class UCCVerificationService:
 
                     # Use ready states as the processing list (ignore other states)
                     if ready_full_names:
-                        print(f"📍 Using UCC ready states: {ready_full_names}")
+                        logger.info("📍 Using UCC ready states: %s", ready_full_names)
                         states_to_process = ready_full_names
 
-                for idx, state_name in enumerate(states_to_process):
-                    if not state_name:
-                        print(f"⚠️  Invalid state in list")
-                        continue
+                visited_states, all_page_info = await self._process_states(
+                    context, page, states_to_process, state_options, operator_name, session_id
+                )
 
-                    print(f"\n{'=' * 60}")
-                    print(
-                        f"Processing state {idx + 1}/{len(states_to_process)}: {state_name}"
-                    )
-                    print(f"{'=' * 60}")
-
-                    # Get UCC URL for this state
-                    ucc_url = self._get_ucc_url_for_state(state_name, state_options)
-
-                    if not ucc_url:
-                        print(f"⚠️  No UCC URL found for state: {state_name}")
-                        continue
-
-                    try:
-                        # Process state with retry logic (default 5 retries)
-                        state_result = await self._retry_with_backoff(
-                            lambda: self._process_single_state(
-                                page, state_name, ucc_url, operator_name, session_id
-                            ),
-                            max_retries=5,
-                            initial_delay=1.0,
-                            context=f"State verification for {state_name}",
-                        )
-
-                        # Add to visited states
-                        visited_states.append(state_result)
-
-                        # Extract page info for summary
-                        if state_result.get("flow_used"):
-                            all_page_info.append(state_result["page_info"])
-                        else:
-                            all_page_info.append(
-                                {
-                                    "state": state_name,
-                                    **state_result.get("page_info", {}),
-                                }
-                            )
-
-                        # Wait a bit before moving to next state
-                        print("⏱️  Waiting 3 seconds before next state...")
-                        await page.wait_for_timeout(3000)
-
-                    except Exception as e:
-                        print(
-                            f"❌ Error processing {state_name} after all retries: {str(e)}"
-                        )
-                        # Add failed state to results
-                        visited_states.append(
-                            {
-                                "state": state_name,
-                                "url": ucc_url,
-                                "error": str(e),
-                                "status": "failed_after_retries",
-                            }
-                        )
-                        continue
-
-                print(f"\n{'=' * 60}")
-                print(f"✓ Processed {len(visited_states)} states successfully")
-                print(f"{'=' * 60}\n")
+                logger.debug("\n%s", _BAR_60)
+                logger.info("✓ Processed %s states successfully", len(visited_states))
+                logger.debug("%s\n", _BAR_60)
 
                 await browser.close()
-                print("✓ Browser session closed")
+                logger.info("✓ Browser session closed")
 
                 # Create result
                 result = {
@@ -778,14 +865,14 @@ class UCCVerificationService:
                     "browserbase_live_view_url": live_view_url,
                 }
 
-                print(f"\n✓ UCC verification completed")
-                print(f"Session debug URL: {debug_url}")
-                print(f"{'=' * 80}\n")
+                logger.info("\n✓ UCC verification completed")
+                logger.debug("Session debug URL: %s", debug_url)
+                logger.debug("%s\n", _BAR)
 
                 return result
 
         except Exception as error:
-            print(f"❌ UCC verification error: {str(error)}")
+            logger.error("❌ UCC verification error: %s", str(error))
             return self._create_error_response(operator_name, str(error))
 
     def _create_error_response(
@@ -802,6 +889,94 @@ class UCCVerificationService:
         }
 
 
+class BrowserbaseSessionPool:
+    """
+    Pool of keep-alive Browserbase sessions shared across a batch run.
+
+    Each session serves one UCC run at a time and is handed back afterwards,
+    so a batch creates at most `size` sessions instead of one per operator.
+    A session is released and replaced once it has processed
+    `max_states_per_session` states or a UCC run on it errored.
+    """
+
+    def __init__(self, size: int, max_states_per_session: int = 50):
+        self.browserbase_api_key = os.getenv("BROWSERBASE_API_KEY")
+        self.browserbase_project_id = os.getenv("BROWSERBASE_PROJECT_ID")
+        self._bb = Browserbase(api_key=self.browserbase_api_key)
+        self._size = size
+        self._max_states = max_states_per_session
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._states_processed: Dict[str, int] = {}
+        # Sessions being created right now - they count towards size
+        self._creating = 0
+
+    async def acquire(self) -> str:
+        """
+        Check out a session, creating one if the pool is not yet full.
+
+        Returns:
+            Browserbase session ID
+        """
+        if (
+            self._idle.empty()
+            and len(self._states_processed) + self._creating < self._size
+        ):
+            # Reserve the slot before awaiting, otherwise concurrent acquires
+            # all see a free slot and create more than size sessions
+            self._creating += 1
+            try:
+                session = await create_browserbase_session(
+                    self._bb,
+                    project_id=self.browserbase_project_id,
+                    proxies=True,
+                    keep_alive=True,
+                )
+            finally:
+                self._creating -= 1
+            self._states_processed[session.id] = 0
+            logger.info("✓ Browserbase session created for batch: %s", session.id)
+            return session.id
+        return await self._idle.get()
+
+    async def release(
+        self, session_id: str, ucc_result: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """
+        Return a session to the pool, rotating it if it is worn out or broken.
+
+        Args:
+            session_id: Session previously returned by acquire()
+            ucc_result: UCC verification result produced on the session, if any
+        """
+        if ucc_result is None or ucc_result.get("status") == "error":
+            await self._end(session_id)
+            return
+
+        self._states_processed[session_id] += ucc_result.get("states_processed", 0)
+        if self._states_processed[session_id] >= self._max_states:
+            await self._end(session_id)
+        else:
+            self._idle.put_nowait(session_id)
+
+    async def close(self) -> None:
+        """Release every session created by the pool."""
+        for session_id in list(self._states_processed):
+            await self._end(session_id)
+
+    async def _end(self, session_id: str) -> None:
+        self._states_processed.pop(session_id, None)
+        try:
+            await asyncio.to_thread(
+                self._bb.sessions.update,
+                session_id,
+                project_id=self.browserbase_project_id,
+                status="REQUEST_RELEASE",
+            )
+            logger.info("✓ Browserbase session released: %s", session_id)
+        except Exception as e:
+            logger.warning("⚠️  Could not release Browserbase session %s: %s", session_id, e)
+
+
 # Synchronous wrapper for FastAPI
 def verify_ucc_filings_sync(
     operator_name: str,
@@ -18,7 +18,9 @@ NOTE: CSF uses INVERSE scoring - better certifications have LOWER values
   - None = 10 points (worst, maximum penalty)
 """
 
+import functools
 import math
+import os
 from datetime import datetime, timedelta, timezone
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
@@ -794,3 +796,23 @@ Be direct, professional, and focus on actionable business intelligence."""
         except Exception as e:
             print(f"⚠️  Error generating overall insights: {e}")
             return None
+
+
+@functools.cache
+def get_shared_calculator() -> TrustScoreCalculator:
+    """
+    Process-wide TrustScoreCalculator shared by the API and batch workers.
+
+    The calculator keeps no per-call state and the LLM client wraps an async
+    OpenAI client, so one instance is safe for concurrent use. The LLM client
+    is only attached when an OpenRouter key is configured.
+    """
+    from src.trustscore.llm_client import LLMClient, LLMProvider
+
+    llm_client = None
+    if os.getenv("OPENROUTER_API_KEY"):
+        try:
+            llm_client = LLMClient(provider=LLMProvider.OPENROUTER)
+        except Exception as e:
+            print(f"⚠️  LLM client unavailable, continuing without AI insights: {e}")
+    return TrustScoreCalculator(llm_client=llm_client)
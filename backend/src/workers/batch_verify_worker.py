@@ -7,13 +7,18 @@ Run this worker in a separate terminal to process batch verification jobs:
 Requires HATCHET_CLIENT_TOKEN environment variable.
 """
 
+from src.common.log import start_logging, stop_logging
 from src.hatchet_client import hatchet
 from src.workflows.batch_verify_workflow import batch_verify_workflow
 
 
 def main():
-    worker = hatchet.worker("batch-verify-worker", workflows=[batch_verify_workflow])
-    worker.start()
+    start_logging()
+    try:
+        worker = hatchet.worker("batch-verify-worker", workflows=[batch_verify_workflow])
+        worker.start()
+    finally:
+        stop_logging()
 
 
 if __name__ == "__main__":
@@ -1,28 +1,65 @@
 import os
-import json
+import asyncio
+import logging
 from pydantic import BaseModel
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 from datetime import datetime, timedelta
-from decimal import Decimal
+from sqlalchemy import insert, select, update
 
 from src.hatchet_client import hatchet
+from src.common.utils import DEC_100, ensure_dir, safe_name, to_decimal, write_json_gz
 from hatchet_sdk import Context
 
+logger = logging.getLogger(__name__)
+
+# Banner separators used in log output
+_BAR = "=" * 80
+_BAR_60 = "=" * 60
+
 # Directory for storing verification results
 VERIFICATION_RESULTS_DIR = os.path.join(os.path.dirname(__file__), "../../data/temp")
 os.makedirs(VERIFICATION_RESULTS_DIR, exist_ok=True)
 
-# States with UCC scraper ready
-UCC_READY_STATES = ["CA"]
-
 # Test filter for batch verification
 BATCH_TEST_OPERATORS = None
 
+# Operators verified at once; each does NTSB + UCC + TrustScore I/O
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+
+# Number of trust score results accumulated before a bulk database write
+SUPABASE_SAVE_BATCH_SIZE = 50
+
+# Max seconds a queued trust score waits for its batch to fill before it is written
+SUPABASE_SAVE_MAX_DELAY = 5.0
+
+# Max bulk trust score writes running at once while the batch continues
+SUPABASE_MAX_INFLIGHT_WRITES = 2
+
+# Max operator names per IN query when prefetching operator metadata
+OPERATOR_META_CHUNK_SIZE = 1000
+
+# States a pooled Browserbase session may process before it is rotated
+BROWSERBASE_SESSION_MAX_STATES = 50
+
 
 class BatchVerifyInput(BaseModel):
     session_id: Optional[str] = None
     null_trust_score_only: bool = False
     operator_id: Optional[str] = None
+    operator_ids: Optional[List[str]] = None
+
+    def requested_operator_ids(self) -> List[str]:
+        """
+        Merge operator_ids and the single operator_id kept for older callers.
+
+        Returns:
+            Operator IDs in request order with duplicates removed; empty when
+            neither field is set
+        """
+        return list(dict.fromkeys(
+            (self.operator_ids or [])
+            + ([self.operator_id] if self.operator_id else [])
+        ))
 
 
 class BatchVerifyOutput(BaseModel):
@@ -35,109 +72,273 @@ class BatchVerifyOutput(BaseModel):
     results: List[dict]
 
 
-def save_trust_score_to_supabase(
-    operator_name: str,
+def build_trust_score_factors(
     trust_score_result: dict,
     ntsb_result: dict,
     ucc_result: dict,
     argus_rating: str = None,
-    wyvern_rating: str = None,
-    max_retries: int = 3
-) -> bool:
+    wyvern_rating: str = None
+) -> dict:
     """
-    Save trust score results to Supabase database.
-    Updates gtj.operators and creates record in gtj.trust_scores.
-    Includes retry logic for transient connection errors.
+    Build the comprehensive factors JSON stored on a gtj.trust_scores row.
+    Shared by the bulk save here and the single-operator save in the scoring router.
+
+    Returns:
+        Factors dict with NTSB, UCC, score, breakdown and certification details
     """
-    import time
-    from src.common.config import SessionLocal
-    from src.common.models import Operator, TrustScore
+    overall_score = trust_score_result.get('trust_score', 0)
+    fleet_score = trust_score_result.get('fleet_score', overall_score)
+    tail_score = trust_score_result.get('tail_score', 100)
+    operator_score = trust_score_result.get('operator_score', 100)
+    fleet_breakdown = trust_score_result.get('fleet_breakdown', {})
 
-    for attempt in range(max_retries):
-        db = SessionLocal()
-        try:
-            operator = db.query(Operator).filter(Operator.name == operator_name).first()
+    return {
+        "ntsb": {
+            "score": ntsb_result.get('score', 100),
+            "total_incidents": ntsb_result.get('total_incidents', 0),
+            "incidents": ntsb_result.get('incidents', [])
+        },
+        "ucc": {
+            "status": ucc_result.get('status', 'unknown'),
+            "states_processed": ucc_result.get('states_processed', 0),
+            "visited_states": ucc_result.get('visited_states', [])
+        },
+        "scores": {
+            "fleet_score": fleet_score,
+            "tail_score": tail_score,
+            "operator_score": operator_score,
+            "raw_combined_score": trust_score_result.get('raw_combined_score', 0),
+            "score_tier": trust_score_result.get('score_tier', 'Unknown')
+        },
+        "fleet_breakdown": fleet_breakdown,
+        "tail_breakdown": trust_score_result.get('tail_breakdown', {}),
+        "certifications": {
+            "argus_rating": argus_rating,
+            "wyvern_rating": wyvern_rating
+        },
+        "ai_insights": trust_score_result.get('ai_insights', None)
+    }
 
-            if not operator:
-                print(f"  ⚠️  Operator '{operator_name}' not found in gtj.operators table")
-                return False
 
-            # Extract scores from trust_score_result
-            overall_score = trust_score_result.get('trust_score', 0)
-            fleet_score = trust_score_result.get('fleet_score', overall_score)
-            tail_score = trust_score_result.get('tail_score', 100)
-            operator_score = trust_score_result.get('operator_score', 100)
-            confidence_score = trust_score_result.get('confidence_score', 0.8)
+def build_trust_score_record(
+    operator_id,
+    trust_score_result: dict,
+    ntsb_result: dict,
+    ucc_result: dict,
+    argus_rating: str = None,
+    wyvern_rating: str = None
+) -> Tuple[dict, dict]:
+    """
+    Build the gtj.operators update and gtj.trust_scores row for one operator.
+    Does not touch the database.
 
-            # Extract financial score from fleet_breakdown final_score
-            fleet_breakdown = trust_score_result.get('fleet_breakdown', {})
-            financial_score = fleet_breakdown.get('final_score', 100)
+    Returns:
+        Tuple of (operator update mapping keyed by operator_id, gtj.trust_scores row)
+    """
+    # Extract scores from trust_score_result
+    overall_score = trust_score_result.get('trust_score', 0)
+    fleet_score = trust_score_result.get('fleet_score', overall_score)
+    operator_score = trust_score_result.get('operator_score', 100)
+    confidence_score = trust_score_result.get('confidence_score', 0.8)
+
+    overall_score_dec = to_decimal(overall_score)
+
+    # Extract financial score from fleet_breakdown final_score
+    fleet_breakdown = trust_score_result.get('fleet_breakdown', {})
+    financial_score = fleet_breakdown.get('final_score', 100)
+
+    # Operator's trust_score update
+    operator_update = {
+        "operator_id": operator_id,
+        "trust_score": overall_score_dec,
+        "trust_score_updated_at": datetime.utcnow(),
+    }
 
-            # Update operator's trust_score
-            operator.trust_score = Decimal(str(overall_score))
-            operator.trust_score_updated_at = datetime.utcnow()
+    factors = build_trust_score_factors(
+        trust_score_result, ntsb_result, ucc_result, argus_rating, wyvern_rating
+    )
 
-            # Build comprehensive factors JSON
-            factors = {
-                "ntsb": {
-                    "score": ntsb_result.get('score', 100),
-                    "total_incidents": ntsb_result.get('total_incidents', 0),
-                    "incidents": ntsb_result.get('incidents', [])
-                },
-                "ucc": {
-                    "status": ucc_result.get('status', 'unknown'),
-                    "states_processed": ucc_result.get('states_processed', 0),
-                    "visited_states": ucc_result.get('visited_states', [])
-                },
-                "scores": {
-                    "fleet_score": fleet_score,
-                    "tail_score": tail_score,
-                    "operator_score": operator_score,
-                    "raw_combined_score": trust_score_result.get('raw_combined_score', 0),
-                    "score_tier": trust_score_result.get('score_tier', 'Unknown')
-                },
-                "fleet_breakdown": fleet_breakdown,
-                "tail_breakdown": trust_score_result.get('tail_breakdown', {}),
-                "certifications": {
-                    "argus_rating": argus_rating,
-                    "wyvern_rating": wyvern_rating
-                },
-                "ai_insights": trust_score_result.get('ai_insights', None)
-            }
+    # Create trust_scores record with enriched data
+    trust_score_record = {
+        "operator_id": operator_id,
+        "overall_score": overall_score_dec,
+        "safety_score": to_decimal(fleet_score),
+        "financial_score": to_decimal(financial_score),
+        "regulatory_score": to_decimal(operator_score),
+        "aog_score": DEC_100,  # Default, no AOG data yet
+        "factors": factors,
+        "version": "3.0",  # Algorithm v3
+        "expires_at": datetime.utcnow() + timedelta(days=30),
+        "confidence_level": to_decimal(confidence_score),
+    }
 
-            # Create trust_scores record with enriched data
-            trust_score_record = TrustScore(
-                operator_id=operator.operator_id,
-                overall_score=Decimal(str(overall_score)),
-                safety_score=Decimal(str(fleet_score)),
-                financial_score=Decimal(str(financial_score)),
-                regulatory_score=Decimal(str(operator_score)),
-                aog_score=Decimal(str(100)),  # Default, no AOG data yet
-                factors=factors,
-                version="3.0",  # Algorithm v3
-                expires_at=datetime.utcnow() + timedelta(days=30),
-                confidence_level=Decimal(str(confidence_score))
-            )
+    return operator_update, trust_score_record
 
-            db.add(trust_score_record)
-            db.commit()
 
-            print(f"  ✓ Saved trust score {overall_score} for {operator_name} to gtj.operators and gtj.trust_scores")
-            return True
+async def save_trust_scores_bulk(
+    pending_saves: List[dict],
+    max_retries: int = 3
+) -> Set[str]:
+    """
+    Save a batch of trust score results to Supabase in a single transaction.
+    Updates gtj.operators and creates records in gtj.trust_scores.
+    Includes retry logic for transient connection errors.
+
+    Args:
+        pending_saves: List of dicts with the keyword arguments of
+            build_trust_score_record plus "operator_name"; "operator_id" may
+            be given to skip the id lookup for that operator
+
+    Returns:
+        Set of operator names that were saved
+    """
+    from src.common.config import AsyncSessionLocal
+    from src.common.models import Operator, TrustScore
+
+    if not pending_saves:
+        return set()
+
+    # Only look up ids the caller did not already resolve
+    operator_ids = {
+        entry["operator_name"]: entry["operator_id"]
+        for entry in pending_saves
+        if entry.get("operator_id")
+    }
+    missing_names = {
+        entry["operator_name"] for entry in pending_saves
+    } - operator_ids.keys()
+
+    for attempt in range(max_retries):
+        try:
+            async with AsyncSessionLocal() as db:
+                async with db.begin():
+                    if missing_names:
+                        rows = (
+                            await db.execute(
+                                select(Operator.name, Operator.operator_id).where(
+                                    Operator.name.in_(missing_names)
+                                )
+                            )
+                        ).all()
+                        operator_ids.update(
+                            {row.name: row.operator_id for row in rows}
+                        )
+
+                    operator_updates = []
+                    trust_score_records = []
+                    saved_names = set()
+                    for entry in pending_saves:
+                        operator_name = entry["operator_name"]
+                        operator_id = operator_ids.get(operator_name)
+                        if operator_id is None:
+                            logger.warning(
+                                "  ⚠️  Operator '%s' not found in gtj.operators table",
+                                operator_name,
+                            )
+                            continue
+
+                        operator_update, trust_score_record = build_trust_score_record(
+                            operator_id=operator_id,
+                            trust_score_result=entry["trust_score_result"],
+                            ntsb_result=entry["ntsb_result"],
+                            ucc_result=entry["ucc_result"],
+                            argus_rating=entry.get("argus_rating"),
+                            wyvern_rating=entry.get("wyvern_rating"),
+                        )
+                        operator_updates.append(operator_update)
+                        trust_score_records.append(trust_score_record)
+                        saved_names.add(operator_name)
+
+                    # Core executemany - one multi-row INSERT, no ORM unit of work
+                    if trust_score_records:
+                        await db.execute(insert(TrustScore), trust_score_records)
+                    if operator_updates:
+                        await db.execute(update(Operator), operator_updates)
+
+            logger.info(
+                "  ✓ Saved %s trust score(s) to gtj.operators and gtj.trust_scores",
+                len(saved_names),
+            )
+            return saved_names
 
         except Exception as e:
-            db.rollback()
             if attempt < max_retries - 1:
                 wait_time = (attempt + 1) * 2  # 2, 4, 6 seconds
-                print(f"  ⚠️  DB error (attempt {attempt + 1}/{max_retries}): {e}")
-                print(f"  → Retrying in {wait_time}s...")
-                time.sleep(wait_time)
+                logger.warning("  ⚠️  DB error (attempt %s/%s): %s", attempt + 1, max_retries, e)
+                logger.info("  → Retrying in %ss...", wait_time)
+                await asyncio.sleep(wait_time)
             else:
-                print(f"  ❌ Error saving to Supabase for {operator_name} after {max_retries} attempts: {e}")
-                return False
-        finally:
-            db.close()
-    return False
+                logger.error(
+                    "  ❌ Error saving %s trust score(s) to Supabase after %s attempts: %s",
+                    len(pending_saves),
+                    max_retries,
+                    e,
+                )
+                return set()
+    return set()
+
+
+class TrustScoreSaveQueue:
+    """
+    Buffers trust score saves and writes them with save_trust_scores_bulk in
+    background tasks while the batch keeps verifying. A batch is written once
+    batch_size saves are queued, or max_delay seconds after the oldest queued
+    save - even if no further results arrive. At most max_inflight writes run
+    at once.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = SUPABASE_SAVE_BATCH_SIZE,
+        max_delay: float = SUPABASE_SAVE_MAX_DELAY,
+        max_inflight: int = SUPABASE_MAX_INFLIGHT_WRITES,
+    ):
+        self._batch_size = batch_size
+        self._max_delay = max_delay
+        self._semaphore = asyncio.Semaphore(max_inflight)
+        self._pending: List[dict] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._write_tasks: List[asyncio.Task] = []
+
+    def add(self, pending_save: dict) -> None:
+        """Queue one save (keyword arguments of save_trust_scores_bulk entries)."""
+        self._pending.append(pending_save)
+        if len(self._pending) >= self._batch_size:
+            self.flush()
+        elif self._timer is None:
+            # Timer-driven, so slow batches still persist steadily
+            self._timer = asyncio.get_running_loop().call_later(
+                self._max_delay, self.flush
+            )
+
+    def flush(self) -> None:
+        """Start writing everything queued so far in a background task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending:
+            self._write_tasks.append(asyncio.create_task(self._write(self._pending[:])))
+            self._pending.clear()
+
+    async def drain(self) -> Set[str]:
+        """
+        Flush the remaining saves and wait for every write.
+
+        Returns:
+            Set of operator names that were saved
+        """
+        self.flush()
+        saved_names = set()
+        for saved in await asyncio.gather(*self._write_tasks, return_exceptions=True):
+            if isinstance(saved, BaseException):
+                logger.error("  ❌ Error saving trust scores to Supabase: %s", saved)
+            else:
+                saved_names |= saved
+        return saved_names
+
+    async def _write(self, batch: List[dict]) -> Set[str]:
+        async with self._semaphore:
+            return await save_trust_scores_bulk(batch)
 
 
 batch_verify_workflow = hatchet.workflow(name="batch-verify-operators")
@@ -152,17 +353,15 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
     """
     Main task that processes all operators for batch verification.
     """
-    from src.operator.charter_service import get_charter_operators, get_charter_operator_by_id
-    from src.scoring.service import NTSBService
-    from src.scoring.ucc_service import UCCVerificationService
-    from src.trustscore.calculator import (
-        TrustScoreCalculator,
-        FleetScoreData,
-        TailScoreData,
+    from src.operator.charter_service import list_charter_operator_refs
+    from src.scoring.steps import (
+        ntsb_score_for,
+        run_ntsb_and_ucc_steps,
+        run_trust_score_step,
     )
-    from src.trustscore.llm_client import LLMClient, LLMProvider
+    from src.scoring.ucc_service import BrowserbaseSessionPool
     from src.common.models import Operator as OperatorModel
-    from src.common.config import SessionLocal
+    from src.common.config import AsyncSessionLocal
 
     # Parse workflow input - handle both dict and Pydantic model cases
     if hasattr(workflow_input, 'model_dump'):
@@ -177,30 +376,33 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
     input_data = BatchVerifyInput.model_validate(raw_input)
     session_id = input_data.session_id
     null_trust_score_only = input_data.null_trust_score_only
-    operator_id = input_data.operator_id
+    # A single operator_id is kept for older callers; both feed one IN query
+    operator_ids = input_data.requested_operator_ids()
 
     states = None
 
-    print(f"\n{'='*80}")
-    if operator_id:
-        print(f"BATCH VERIFICATION FOR OPERATOR ID: {operator_id}")
+    logger.debug("\n%s", _BAR)
+    if operator_ids:
+        logger.info("BATCH VERIFICATION FOR OPERATOR IDS: %s", ', '.join(operator_ids))
     else:
-        print(f"BATCH VERIFICATION FOR STATES: {states if states else 'ALL'}")
-    print(f"{'='*80}\n")
+        logger.info("BATCH VERIFICATION FOR STATES: %s", states if states else 'ALL')
+    logger.debug("%s\n", _BAR)
 
     # Step 1: Get operators from database
-    print("Step 1: Fetching operators from database...")
-
-    if operator_id:
-        print(f"📍 Fetching specific operator by ID: {operator_id}")
-        operator = await get_charter_operator_by_id(operator_id)
-        if operator:
-            filtered_operators = [operator]
-            print(f"✓ Found operator: {operator.company}")
+    logger.info("Step 1: Fetching operators from database...")
+
+    if operator_ids:
+        logger.info("📍 Fetching %s operator(s) by ID", len(operator_ids))
+        filtered_operators = await list_charter_operator_refs(operator_ids)
+        if filtered_operators:
+            logger.info(
+                "✓ Found operator(s): %s",
+                ', '.join(op.company for op in filtered_operators),
+            )
         else:
             return {
                 "status": "failed",
-                "message": f"Operator with ID {operator_id} not found",
+                "message": f"No operators found with ID(s) {', '.join(operator_ids)}",
                 "total_operators": 0,
                 "successful": 0,
                 "failed": 0,
@@ -208,239 +410,183 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
                 "results": [],
             }
     elif BATCH_TEST_OPERATORS:
-        print(f"📍 Test filter active - querying only: {BATCH_TEST_OPERATORS}")
-        filtered_operators = []
-        for operator_name in BATCH_TEST_OPERATORS:
-            operators_response = await get_charter_operators(
-                skip=0, limit=None, search=operator_name
-            )
-            for op in operators_response.data:
-                if op.company == operator_name:
-                    filtered_operators.append(op)
-        print(f"✓ Found {len(filtered_operators)} operator(s) matching test filter")
+        logger.info("📍 Test filter active - querying only: %s", BATCH_TEST_OPERATORS)
+        # One fetch + set filter instead of a search RPC per test operator
+        test_operator_names = set(BATCH_TEST_OPERATORS)
+        filtered_operators = [
+            op for op in await list_charter_operator_refs()
+            if op.company in test_operator_names
+        ]
+        logger.info("✓ Found %s operator(s) matching test filter", len(filtered_operators))
     else:
-        operators_response = await get_charter_operators(
-            skip=0, limit=None, search=None
-        )
-        all_operators = operators_response.data
-        print(f"✓ Found {len(all_operators)} total operators in database")
+        # Only name + faa_state are needed, so skip full operator payloads
+        all_operators = await list_charter_operator_refs()
+        logger.info("✓ Found %s total operators in database", len(all_operators))
 
         if states:
             filtered_operators = [op for op in all_operators if op.faa_state in states]
-            print(f"✓ Filtered to {len(filtered_operators)} operators with faa_state in {states}")
+            logger.info(
+                "✓ Filtered to %s operators with faa_state in %s",
+                len(filtered_operators),
+                states,
+            )
         else:
             filtered_operators = all_operators
-            print(f"✓ Processing all {len(filtered_operators)} operators (no state filter)")
-
-    # Filter to only operators with null trust_score if requested
-    if null_trust_score_only:
-        print("📍 Filtering to operators with NULL trust_score...")
-        db = SessionLocal()
-        try:
-            null_trust_score_operators = db.query(OperatorModel.name).filter(
+            logger.info("✓ Processing all %s operators (no state filter)", len(filtered_operators))
+
+    # Read-only lookups (NULL trust_score filter, metadata prefetch) share one session
+    async with AsyncSessionLocal() as db:
+        # Filter to only operators with null trust_score if requested
+        if null_trust_score_only:
+            logger.info("📍 Filtering to operators with NULL trust_score...")
+            null_trust_score_query = select(OperatorModel.name).where(
                 OperatorModel.trust_score.is_(None)
-            ).all()
-            null_trust_score_names = {op.name for op in null_trust_score_operators}
+            )
+            if BATCH_TEST_OPERATORS and not operator_ids:
+                null_trust_score_query = null_trust_score_query.where(
+                    OperatorModel.name.in_(BATCH_TEST_OPERATORS)
+                )
+            null_trust_score_names = set(
+                (await db.execute(null_trust_score_query)).scalars().all()
+            )
 
             filtered_operators = [
                 op for op in filtered_operators
                 if op.company in null_trust_score_names
             ]
-            print(f"✓ Filtered to {len(filtered_operators)} operators with NULL trust_score")
-        finally:
-            db.close()
-
-    if not filtered_operators:
-        return {
-            "status": "completed",
-            "message": f"No operators found with faa_state in {states}",
-            "total_operators": 0,
-            "successful": 0,
-            "failed": 0,
-            "saved_to_supabase": 0,
-            "results": [],
-        }
-
-    # Step 3: Run verification for each operator
-    results = []
-    successful = 0
-    failed = 0
-    saved_to_supabase_count = 0
+            logger.info("✓ Filtered to %s operators with NULL trust_score", len(filtered_operators))
 
-    for idx, operator in enumerate(filtered_operators, 1):
-        print(f"\n{'='*60}")
-        print(f"Processing operator {idx}/{len(filtered_operators)}: {operator.company}")
-        print(f"FAA State: {operator.faa_state}")
-        print(f"{'='*60}")
+        if not filtered_operators:
+            return {
+                "status": "completed",
+                "message": f"No operators found with faa_state in {states}",
+                "total_operators": 0,
+                "successful": 0,
+                "failed": 0,
+                "saved_to_supabase": 0,
+                "results": [],
+            }
 
+        # Step 2: Prefetch operator metadata used by TrustScore in bulk
+        # (one IN query per chunk instead of one SELECT per operator)
+        operator_meta = {}
+        operator_names = list({op.company for op in filtered_operators})
         try:
-            # Run NTSB query
-            print(f"  → Querying NTSB for {operator.company}...")
-            ntsb_error = None
-            try:
-                ntsb_data = await NTSBService.query_ntsb_incidents(operator.company)
-                incidents = NTSBService.parse_ntsb_response(ntsb_data)
-                total_incidents = len(incidents)
-                ntsb_score = max(0, 100 - (total_incidents * 5))
-                print(f"  ✓ NTSB: {total_incidents} incidents, score: {ntsb_score}")
-            except Exception as e:
-                ntsb_error = str(e)
-                print(f"  ⚠️  NTSB failed: {ntsb_error}")
-                print("  → Continuing with default values")
-                ntsb_data = {"Results": []}
-                incidents = []
-                total_incidents = 0
-                ntsb_score = 100.0
-
-            # Run UCC verification
-            print(f"  → Verifying UCC filings...")
-            ucc_error = None
-            try:
-                ucc_service = UCCVerificationService()
-                ntsb_results = ntsb_data.get("Results", [])
-                ucc_data = await ucc_service.verify_ucc_filings_with_session(
-                    operator.company,
-                    ntsb_results,
-                    operator.faa_state,
-                    None,
-                    session_id,
-                    UCC_READY_STATES,
-                )
-                print(f"  ✓ UCC: {ucc_data.get('status')}")
-            except Exception as e:
-                ucc_error = str(e)
-                print(f"  ⚠️  UCC failed: {ucc_error}")
-                print("  → Continuing with default values")
-                ucc_data = {
-                    "status": "failed",
-                    "error": ucc_error,
-                    "visited_states": [],
-                    "states_processed": 0,
-                }
-
-            # Calculate TrustScore
-            print(f"  → Calculating TrustScore...")
-            trust_score_error = None
-
-            try:
-                ucc_filings = []
-                visited_states = ucc_data.get("visited_states", [])
-                for state_result in visited_states:
-                    if state_result.get("flow_used") and state_result.get("flow_result"):
-                        flow_result = state_result["flow_result"]
-                        normalized_filings = flow_result.get("normalized_filings", [])
-                        for filing in normalized_filings:
-                            ucc_filings.append({
-                                "file_number": filing.get("file_number", "Unknown"),
-                                "status": filing.get("status", "Unknown"),
-                                "filing_date": filing.get("filing_date", "Unknown"),
-                                "lapse_date": filing.get("lapse_date", "Unknown"),
-                                "lien_type": filing.get("lien_type", "Unknown"),
-                                "debtor": filing.get("debtor", "Unknown"),
-                                "secured_party": filing.get("secured_party", None),
-                                "collateral": filing.get("collateral", None),
-                                "state": state_result.get("state", "Unknown"),
-                            })
-
-                fleet_events = [incident.dict() for incident in incidents]
-
-                operator_age_years = 10.0
-                fleet_size = 1
-                argus_rating = None
-                wyvern_rating = None
-
-                try:
-                    db = SessionLocal()
-                    db_operator = (
-                        db.query(OperatorModel)
-                        .filter(OperatorModel.name == operator.company)
-                        .first()
+            for start in range(0, len(operator_names), OPERATOR_META_CHUNK_SIZE):
+                rows = (
+                    await db.execute(
+                        select(
+                            OperatorModel.name,
+                            OperatorModel.operator_id,
+                            OperatorModel.business_started_date,
+                            OperatorModel.argus_rating,
+                            OperatorModel.wyvern_rating,
+                        ).where(
+                            OperatorModel.name.in_(
+                                operator_names[start:start + OPERATOR_META_CHUNK_SIZE]
+                            )
+                        )
                     )
+                ).all()
+                for row in rows:
+                    operator_meta.setdefault(row.name, row)
+            logger.info("✓ Loaded gtj.operators metadata for %s operator(s)", len(operator_meta))
+        except Exception as e:
+            logger.warning("⚠️  Could not fetch operator data from gtj.operators: %s", e)
+
+    # Operator ages in years, computed in one pass against a single "now"
+    now = datetime.now()
+    operator_ages = {
+        name: round((now - row.business_started_date).days / 365.25, 1)
+        for name, row in operator_meta.items()
+        if row.business_started_date
+    }
 
-                    if db_operator and db_operator.business_started_date:
-                        years_diff = (
-                            datetime.now() - db_operator.business_started_date
-                        ).days / 365.25
-                        operator_age_years = round(years_diff, 1)
-
-                    if db_operator:
-                        argus_rating = db_operator.argus_rating
-                        wyvern_rating = db_operator.wyvern_rating
-
-                    db.close()
-                except Exception as e:
-                    print(f"  ⚠️  Could not fetch operator data from gtj.operators: {e}")
-
-                fleet_data = FleetScoreData(
-                    operator_name=operator.company,
-                    operator_age_years=operator_age_years,
-                    fleet_size=fleet_size,
-                    fleet_events=fleet_events,
-                    ucc_filings=ucc_filings,
-                    argus_rating=argus_rating,
-                    wyvern_rating=wyvern_rating,
-                    bankruptcy_history=None,
-                )
+    # Results for the whole batch land in one date folder, created up front
+    date_dir = ensure_dir(os.path.join(VERIFICATION_RESULTS_DIR, now.strftime("%Y%m%d")))
+
+    # Step 3: Run verification for operators concurrently
+    # Clamp to [1, operators]: 0 would deadlock, more than N only wastes slots
+    concurrency = max(1, min(BATCH_CONCURRENCY, len(filtered_operators)))
+    semaphore = asyncio.Semaphore(concurrency)
+    # An existing Browserbase session exposes a single page, so UCC runs on it
+    # must not overlap. Without a session each UCC run creates its own.
+    ucc_session_lock = asyncio.Lock() if session_id else None
+    # Without a caller-provided session, share a small pool of Browserbase
+    # sessions (one per concurrent worker) instead of creating one per operator
+    session_pool = None
+    if (
+        not session_id
+        and os.getenv("BROWSERBASE_API_KEY")
+        and os.getenv("BROWSERBASE_PROJECT_ID")
+    ):
+        session_pool = BrowserbaseSessionPool(
+            size=concurrency,
+            max_states_per_session=BROWSERBASE_SESSION_MAX_STATES,
+        )
 
-                tail_data = TailScoreData(
-                    aircraft_age_years=5.0,
-                    operator_name=operator.company,
-                    registered_owner=operator.company,
-                    fractional_owner=False,
-                    tail_events=fleet_events,
-                )
+    async def verify_one(idx: int, operator) -> Tuple[dict, Optional[dict]]:
+        """
+        Run NTSB, UCC and TrustScore for one operator.
 
-                try:
-                    llm_client = LLMClient(provider=LLMProvider.OPENROUTER)
-                    calculator = TrustScoreCalculator(llm_client=llm_client)
-                except Exception:
-                    calculator = TrustScoreCalculator(llm_client=None)
+        Returns:
+            Tuple of (per-operator result, pending Supabase save or None)
+        """
+        logger.debug("\n%s", _BAR_60)
+        logger.info("Processing operator %s/%s: %s", idx, len(filtered_operators), operator.company)
+        logger.info("FAA State: %s", operator.faa_state)
+        logger.debug("%s", _BAR_60)
 
-                trust_score_result = await calculator.calculate_trust_score(
-                    fleet_data, tail_data
-                )
-                print(f"  ✓ TrustScore: {trust_score_result['trust_score']}")
-
-            except Exception as e:
-                trust_score_error = str(e)
-                print(f"  ⚠️  TrustScore calculation failed: {trust_score_error}")
-                print(f"  → Using fallback calculation based on NTSB score: {ntsb_score}")
-                fleet_events = (
-                    [incident.dict() for incident in incidents] if incidents else []
+        try:
+            # NTSB and UCC - concurrently unless UCC needs the NTSB incident states
+            ntsb_data, fleet_events, ntsb_error, ucc_data, ucc_error = (
+                await run_ntsb_and_ucc_steps(
+                    operator.company,
+                    operator.faa_state,
+                    None,
+                    session_id,
+                    session_pool=session_pool,
+                    session_lock=ucc_session_lock,
                 )
-                argus_rating = None
-                wyvern_rating = None
-                fallback_score = ntsb_score if ntsb_score is not None else 50.0
-                trust_score_result = {
-                    "trust_score": fallback_score,
-                    "fleet_score": fallback_score,
-                    "tail_score": fallback_score,
-                    "error": trust_score_error,
-                    "fallback": True,
-                }
-
-            # Save result
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            safe_operator_name = "".join(
-                c if c.isalnum() else "_" for c in operator.company
             )
-            date_only = datetime.now().strftime("%Y%m%d")
-            folder_name = f"{date_only}/{safe_operator_name}"
-            operator_folder = os.path.join(VERIFICATION_RESULTS_DIR, folder_name)
-            os.makedirs(operator_folder, exist_ok=True)
+            ntsb_score = ntsb_score_for(fleet_events, ntsb_error)
+            total_incidents = len(fleet_events)
+
+            db_operator = operator_meta.get(operator.company)
+            argus_rating = getattr(db_operator, "argus_rating", None)
+            wyvern_rating = getattr(db_operator, "wyvern_rating", None)
+
+            trust_score_result, trust_score_error = await run_trust_score_step(
+                operator.company,
+                fleet_events,
+                ucc_data,
+                ntsb_score,
+                operator_ages.get(operator.company, 10.0),
+                argus_rating,
+                wyvern_rating,
+            )
+
+            # Save result - one clock read drives file names and verification_date
+            verified_at = datetime.now()
+            timestamp = verified_at.strftime("%Y%m%d_%H%M%S")
+            safe_operator_name = safe_name(operator.company)
+            operator_folder = ensure_dir(os.path.join(date_dir, safe_operator_name))
 
-            has_errors = any([ntsb_error, ucc_error, trust_score_error])
+            # Raw NTSB payload goes to a compressed sibling file, not the result JSON
+            raw_filename = f"verification_result_{safe_operator_name}_{timestamp}.ntsb.json.gz"
+
+            has_errors = bool(ntsb_error or ucc_error or trust_score_error)
             operator_status = "completed_with_errors" if has_errors else "completed"
 
             result_data = {
                 "operator_name": operator.company,
                 "faa_state": operator.faa_state,
-                "verification_date": datetime.now().isoformat(),
+                "verification_date": verified_at.isoformat(),
                 "ntsb": {
                     "score": ntsb_score,
                     "total_incidents": total_incidents,
                     "incidents": fleet_events,
-                    "raw_response": ntsb_data,
+                    "raw_response_file": raw_filename,
                     "error": ntsb_error,
                 },
                 "ucc": ucc_data,
@@ -456,29 +602,35 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
                 },
             }
 
-            filename = f"verification_result_{safe_operator_name}_{timestamp}.json"
+            filename = f"verification_result_{safe_operator_name}_{timestamp}.json.gz"
             filepath = os.path.join(operator_folder, filename)
 
-            with open(filepath, "w") as f:
-                json.dump(result_data, f, indent=2, default=str)
+            # Both files are written in worker threads so other operators keep running
+            await asyncio.gather(
+                asyncio.to_thread(
+                    write_json_gz, os.path.join(operator_folder, raw_filename), ntsb_data
+                ),
+                asyncio.to_thread(write_json_gz, filepath, result_data),
+            )
 
-            print(f"  ✓ Saved JSON: {filename}")
+            logger.info("  ✓ Saved JSON: %s", filename)
 
-            # Save to Supabase database (gtj.operators and gtj.trust_scores)
-            saved_to_db = save_trust_score_to_supabase(
-                operator_name=operator.company,
-                trust_score_result=trust_score_result,
-                ntsb_result={
+            # Queue for the bulk Supabase write (gtj.operators and gtj.trust_scores)
+            pending_save = {
+                "operator_name": operator.company,
+                "operator_id": getattr(db_operator, "operator_id", None),
+                "trust_score_result": trust_score_result,
+                "ntsb_result": {
                     "score": ntsb_score,
                     "total_incidents": total_incidents,
                     "incidents": fleet_events
                 },
-                ucc_result=ucc_data,
-                argus_rating=argus_rating,
-                wyvern_rating=wyvern_rating
-            )
+                "ucc_result": ucc_data,
+                "argus_rating": argus_rating,
+                "wyvern_rating": wyvern_rating,
+            }
 
-            results.append({
+            result_entry = {
                 "operator_name": operator.company,
                 "faa_state": operator.faa_state,
                 "status": operator_status,
@@ -487,7 +639,7 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
                 "total_incidents": total_incidents,
                 "ucc_states_processed": ucc_data.get("states_processed", 0),
                 "saved_file": filename,
-                "saved_to_supabase": saved_to_db,
+                "saved_to_supabase": False,
                 "live_view_url": ucc_data.get("live_view_url"),
                 "session_id": ucc_data.get("session_id"),
                 "errors": {
@@ -495,33 +647,101 @@ async def verify_operators_task(workflow_input, ctx: Context) -> dict:
                     "ucc": ucc_error,
                     "trust_score": trust_score_error,
                 },
-            })
+            }
 
-            successful += 1
-            if saved_to_db:
-                saved_to_supabase_count += 1
             if has_errors:
-                print(f"  ✓ Verified {operator.company} (with errors in some steps)")
+                logger.info("  ✓ Verified %s (with errors in some steps)", operator.company)
             else:
-                print(f"  ✓ Successfully verified {operator.company}")
+                logger.info("  ✓ Successfully verified %s", operator.company)
+            return result_entry, pending_save
 
         except Exception as e:
-            print(f"  ❌ Error verifying {operator.company}: {str(e)}")
-            results.append({
+            logger.exception("  ❌ Error verifying %s: %s", operator.company, str(e))
+            return {
                 "operator_name": operator.company,
                 "faa_state": operator.faa_state,
                 "status": "failed",
                 "error": str(e),
-            })
+            }, None
+
+    # Supabase writes are pipelined: every SUPABASE_SAVE_BATCH_SIZE results (or
+    # SUPABASE_SAVE_MAX_DELAY seconds after the oldest queued one) are written
+    # in a background task, bounded to a few in-flight writes
+    save_queue = TrustScoreSaveQueue()
+
+    async def run_pipeline(idx: int, operator) -> Tuple[dict, Optional[dict]]:
+        async with semaphore:
+            outcome = await verify_one(idx, operator)
+        # Queue the Supabase write and let it run while other operators verify
+        if outcome[1]:
+            save_queue.add(outcome[1])
+        return outcome
+
+    # Duplicate (company, faa_state) entries in a batch share a single pipeline
+    # run, so NTSB, UCC and the TrustScore save only happen once per operator
+    pipeline_cache: Dict[Tuple[str, str], asyncio.Task] = {}
+
+    def process_one(idx: int, operator) -> asyncio.Task:
+        key = (operator.company, operator.faa_state)
+        task = pipeline_cache.get(key)
+        if task is None:
+            task = asyncio.create_task(run_pipeline(idx, operator))
+            pipeline_cache[key] = task
+        return task
+
+    logger.info("📍 Verifying %s operators (concurrency: %s)", len(filtered_operators), concurrency)
+    try:
+        outcomes = await asyncio.gather(
+            *[
+                process_one(idx, operator)
+                for idx, operator in enumerate(filtered_operators, 1)
+            ],
+            return_exceptions=True,
+        )
+    finally:
+        if session_pool:
+            await session_pool.close()
+
+    results = []
+    successful = 0
+    failed = 0
+
+    for operator, outcome in zip(filtered_operators, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("  ❌ Error verifying %s: %s", operator.company, str(outcome))
+            outcome = ({
+                "operator_name": operator.company,
+                "faa_state": operator.faa_state,
+                "status": "failed",
+                "error": str(outcome),
+            }, None)
+
+        result_entry, _ = outcome
+        results.append(result_entry)
+        if result_entry["status"] == "failed":
             failed += 1
+        else:
+            successful += 1
+
+    # Flush remaining trust scores, wait for in-flight writes, mark saved operators
+    saved_names = await save_queue.drain()
+    saved_to_supabase_count = 0
+    for result in results:
+        if result.get("operator_name") in saved_names and result["status"] != "failed":
+            result["saved_to_supabase"] = True
+            saved_to_supabase_count += 1
 
     # Summary
-    print(f"\n{'='*80}")
-    print(f"BATCH VERIFICATION COMPLETED")
-    print(
-        f"Total: {len(filtered_operators)}, Successful: {successful}, Failed: {failed}, Saved to Supabase: {saved_to_supabase_count}"
+    logger.debug("\n%s", _BAR)
+    logger.info("BATCH VERIFICATION COMPLETED")
+    logger.info(
+        "Total: %s, Successful: %s, Failed: %s, Saved to Supabase: %s",
+        len(filtered_operators),
+        successful,
+        failed,
+        saved_to_supabase_count,
     )
-    print(f"{'='*80}\n")
+    logger.debug("%s\n", _BAR)
 
     return {
         "status": "completed",
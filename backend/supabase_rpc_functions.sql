@@ -238,14 +238,45 @@ BEGIN
 END;
 $$;
 
+-- 5. List operator names and FAA states only (lightweight projection for batch jobs)
+CREATE OR REPLACE FUNCTION public.list_charter_operator_states()
+RETURNS JSON
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    SELECT COALESCE(
+        json_agg(json_build_object('company', name, 'faa_state', faa_state)),
+        '[]'::json
+    )
+    FROM gtj.operators;
+$$;
+
+-- 6. Name and FAA state for a set of operator IDs (single IN query for batch jobs)
+CREATE OR REPLACE FUNCTION public.list_charter_operator_states_by_ids(p_operator_ids UUID[])
+RETURNS JSON
+LANGUAGE sql
+SECURITY DEFINER
+AS $$
+    SELECT COALESCE(
+        json_agg(json_build_object('company', name, 'faa_state', faa_state)),
+        '[]'::json
+    )
+    FROM gtj.operators
+    WHERE operator_id = ANY(p_operator_ids);
+$$;
+
 -- Grant execute permissions
 GRANT EXECUTE ON FUNCTION public.get_charter_operators(INT, INT, TEXT) TO anon, authenticated;
 GRANT EXECUTE ON FUNCTION public.get_charter_operator(UUID) TO anon, authenticated;
 GRANT EXECUTE ON FUNCTION public.create_charter_operator(TEXT, JSONB, TEXT, TEXT, INT, JSONB, JSONB) TO authenticated;
 GRANT EXECUTE ON FUNCTION public.filter_charter_operators(TEXT, INT) TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.list_charter_operator_states() TO anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.list_charter_operator_states_by_ids(UUID[]) TO anon, authenticated;
 
 -- Add comments
 COMMENT ON FUNCTION public.get_charter_operators IS 'Get charter operators from gtj schema with pagination and search';
 COMMENT ON FUNCTION public.get_charter_operator IS 'Get a single charter operator by ID';
 COMMENT ON FUNCTION public.create_charter_operator IS 'Create a new charter operator';
 COMMENT ON FUNCTION public.filter_charter_operators IS 'Filter charter operators by certification type and minimum score';
+COMMENT ON FUNCTION public.list_charter_operator_states IS 'List charter operator names and FAA states only';
+COMMENT ON FUNCTION public.list_charter_operator_states_by_ids IS 'List charter operator names and FAA states for the given operator IDs';
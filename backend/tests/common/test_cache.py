@@ -0,0 +1,103 @@
+# tests/common/test_cache.py
+import asyncio
+from src.common.cache import KeyedLocks, TTLCache
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 1000.0
+
+	def __call__(self):
+		return self.now
+
+def test_ttl_cache_miss_returns_none():
+	cache = TTLCache(maxsize=4)
+	assert cache.get("missing") is None
+
+def test_ttl_cache_hit_before_expiry():
+	clock = FakeClock()
+	cache = TTLCache(maxsize=4, timer=clock)
+	cache.set("a", 1, ttl=10)
+	clock.now += 9
+	assert cache.get("a") == 1
+
+def test_ttl_cache_expired_entry_is_dropped():
+	clock = FakeClock()
+	cache = TTLCache(maxsize=4, timer=clock)
+	cache.set("a", 1, ttl=10)
+	clock.now += 10
+	assert cache.get("a") is None
+	assert len(cache) == 0
+
+def test_ttl_cache_evicts_least_recently_used():
+	cache = TTLCache(maxsize=2)
+	cache.set("a", 1, ttl=60)
+	cache.set("b", 2, ttl=60)
+	# Reading "a" makes "b" the least recently used entry
+	assert cache.get("a") == 1
+	cache.set("c", 3, ttl=60)
+	assert len(cache) == 2
+	assert cache.get("b") is None
+	assert cache.get("a") == 1
+	assert cache.get("c") == 3
+
+def test_ttl_cache_set_overwrites_value_and_ttl():
+	clock = FakeClock()
+	cache = TTLCache(maxsize=4, timer=clock)
+	cache.set("a", 1, ttl=5)
+	cache.set("a", 2, ttl=50)
+	clock.now += 10
+	assert cache.get("a") == 2
+	assert len(cache) == 1
+
+def test_keyed_locks_serialize_same_key_and_are_removed():
+	locks = KeyedLocks()
+	active = []
+	max_active = []
+
+	async def worker():
+		async with locks.hold("k"):
+			active.append(1)
+			max_active.append(len(active))
+			await asyncio.sleep(0.01)
+			active.pop()
+
+	async def main():
+		await asyncio.gather(*(worker() for _ in range(5)))
+
+	asyncio.run(main())
+	assert max(max_active) == 1
+	assert len(locks) == 0
+
+def test_keyed_locks_do_not_block_other_keys():
+	locks = KeyedLocks()
+	order = []
+
+	async def slow():
+		async with locks.hold("a"):
+			await asyncio.sleep(0.05)
+			order.append("a")
+
+	async def fast():
+		async with locks.hold("b"):
+			order.append("b")
+
+	async def main():
+		await asyncio.gather(slow(), fast())
+
+	asyncio.run(main())
+	assert order == ["b", "a"]
+	assert len(locks) == 0
+
+def test_keyed_locks_removed_after_exception():
+	locks = KeyedLocks()
+
+	async def main():
+		try:
+			async with locks.hold("k"):
+				raise ValueError("boom")
+		except ValueError:
+			pass
+
+	asyncio.run(main())
+	assert len(locks) == 0
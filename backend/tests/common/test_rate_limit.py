@@ -0,0 +1,94 @@
+# tests/common/test_rate_limit.py
+import asyncio
+import pytest
+from src.common import rate_limit
+from src.common.rate_limit import AsyncTokenBucket
+
+_real_sleep = asyncio.sleep
+
+
+class FakeTime:
+	"""
+	Clock that only moves when the limiter sleeps. Rates below are powers of
+	two so token intervals are exact floats and refills add up exactly.
+	"""
+
+	def __init__(self):
+		self.now = 0.0
+		self.sleeps = []
+
+	def monotonic(self):
+		return self.now
+
+	async def sleep(self, seconds):
+		self.sleeps.append(seconds)
+		self.now += seconds
+		await _real_sleep(0)
+
+@pytest.fixture
+def clock(monkeypatch):
+	clock = FakeTime()
+	monkeypatch.setattr(rate_limit, "time", clock)
+	monkeypatch.setattr(rate_limit.asyncio, "sleep", clock.sleep)
+	return clock
+
+def acquire_n(bucket, n):
+	async def main():
+		for _ in range(n):
+			await bucket.acquire()
+
+	asyncio.run(main())
+
+def test_burst_up_to_capacity_does_not_wait(clock):
+	bucket = AsyncTokenBucket(4)
+	acquire_n(bucket, 4)
+	assert clock.sleeps == []
+
+def test_acquire_past_capacity_waits_for_one_token(clock):
+	bucket = AsyncTokenBucket(4)
+	acquire_n(bucket, 5)
+	assert clock.sleeps == [0.25]
+
+def test_tokens_refill_over_period(clock):
+	bucket = AsyncTokenBucket(8, period=2.0)
+	acquire_n(bucket, 8)
+	clock.now += 1.0
+	acquire_n(bucket, 4)
+	assert clock.sleeps == []
+	acquire_n(bucket, 1)
+	assert clock.sleeps == [0.25]
+
+def test_refill_is_capped_at_capacity(clock):
+	bucket = AsyncTokenBucket(4)
+	acquire_n(bucket, 4)
+	clock.now += 60.0
+	acquire_n(bucket, 4)
+	assert clock.sleeps == []
+	acquire_n(bucket, 1)
+	assert clock.sleeps == [0.25]
+
+def test_concurrent_acquirers_share_the_rate(clock):
+	bucket = AsyncTokenBucket(4)
+	acquired_at = []
+
+	async def worker():
+		async with bucket:
+			acquired_at.append(clock.now)
+
+	async def main():
+		await asyncio.gather(*(worker() for _ in range(12)))
+
+	asyncio.run(main())
+	# 4 burst tokens, then 8 more at 4 per second, one every 0.25s
+	assert acquired_at == [0.0] * 4 + [0.25 * i for i in range(1, 9)]
+
+def test_contended_bucket_works_across_event_loops(clock):
+	bucket = AsyncTokenBucket(1)
+
+	async def contend():
+		# The third acquirer waits on the lock while the second sleeps
+		await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+
+	asyncio.run(contend())
+	asyncio.run(contend())
+	assert clock.now == 5.0
@@ -0,0 +1,39 @@
+# tests/common/test_utils.py
+import gzip
+import orjson
+from decimal import Decimal
+from src.common.utils import ensure_dir, safe_name, to_decimal, write_json_gz
+
+
+def test_safe_name_replaces_non_alphanumerics():
+	assert safe_name("GO FLY LLC.") == "GO_FLY_LLC_"
+	assert safe_name("A&B Air/Charter") == "A_B_Air_Charter"
+
+def test_safe_name_matches_isalnum():
+	name = "Jet_Co-1 ÄÖ"
+	expected = "".join(c if c.isalnum() else "_" for c in name)
+	assert safe_name(name) == expected
+
+def test_to_decimal_passes_decimals_through():
+	value = Decimal("87.5")
+	assert to_decimal(value) is value
+
+def test_to_decimal_int():
+	assert to_decimal(85) == Decimal(85)
+
+def test_to_decimal_float_uses_shortest_repr():
+	assert to_decimal(0.1) == Decimal("0.1")
+	assert to_decimal(87.25) == Decimal("87.25")
+
+def test_write_json_gz_round_trip(tmp_path):
+	filepath = tmp_path / "nested" / "result.json.gz"
+	write_json_gz(str(filepath), {"score": 90, 1: "non-str key"})
+	with gzip.open(filepath, "rb") as f:
+		assert orjson.loads(f.read()) == {"score": 90, "1": "non-str key"}
+
+def test_ensure_dir_recreates_removed_directory(tmp_path):
+	path = str(tmp_path / "results")
+	assert ensure_dir(path) == path
+	(tmp_path / "results").rmdir()
+	ensure_dir(path)
+	assert (tmp_path / "results").is_dir()
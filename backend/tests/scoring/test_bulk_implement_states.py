@@ -0,0 +1,61 @@
+# tests/scoring/test_bulk_implement_states.py
+import importlib.util
+from pathlib import Path
+import pytest
+
+# The flow directory name has hyphens, so load the script by path
+_SCRIPT = (
+	Path(__file__).resolve().parents[2]
+	/ "src/scoring/ucc-filings-flow/bulk_implement_states.py"
+)
+_spec = importlib.util.spec_from_file_location("bulk_implement_states", _SCRIPT)
+bulk = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(bulk)
+
+
+def test_generated_flow_compiles():
+	source = bulk.generate_state_flow("New York", "https://example.com/ucc", "NewYork")
+	compile(source, "new_york.py", "exec")
+	assert "class NewYorkFlow(BaseUCCFlow):" in source
+	assert "https://example.com/ucc" in source
+
+def test_emit_writes_flow_atomically(tmp_path):
+	status, message = bulk._emit(
+		{"text": "New York", "value": "https://example.com/ucc"}, tmp_path
+	)
+	assert status == "implemented"
+	assert sorted(p.name for p in tmp_path.iterdir()) == ["new_york.py"]
+	assert (tmp_path / "new_york.py").read_text() == bulk.generate_state_flow(
+		"New York", "https://example.com/ucc", "NewYork"
+	)
+
+def test_emit_replaces_existing_flow(tmp_path):
+	(tmp_path / "new_york.py").write_text("stale")
+	bulk._emit({"text": "New York", "value": "https://example.com/ucc"}, tmp_path)
+	assert (tmp_path / "new_york.py").read_text() != "stale"
+	assert not (tmp_path / "new_york.py.tmp").exists()
+
+def test_emit_failed_write_keeps_existing_flow(tmp_path, monkeypatch):
+	(tmp_path / "new_york.py").write_text("existing")
+
+	def failing_replace(src, dst):
+		raise OSError("disk full")
+
+	monkeypatch.setattr(bulk.os, "replace", failing_replace)
+	with pytest.raises(OSError):
+		bulk._emit({"text": "New York", "value": "https://example.com/ucc"}, tmp_path)
+	assert (tmp_path / "new_york.py").read_text() == "existing"
+
+@pytest.mark.parametrize("state_data", [
+	{"text": "", "value": ""},
+	{"text": "Please select", "value": "x"},
+	{"text": "New York", "value": ""},
+])
+def test_emit_ignores_empty_entries(tmp_path, state_data):
+	assert bulk._emit(state_data, tmp_path) == (None, "")
+	assert list(tmp_path.iterdir()) == []
+
+def test_emit_skips_hand_written_states(tmp_path):
+	status, _ = bulk._emit({"text": "Oregon", "value": "https://example.com"}, tmp_path)
+	assert status == "skipped"
+	assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,106 @@
+# tests/scoring/test_ntsb_cache.py
+import asyncio
+import orjson
+import pytest
+from src.common.cache import TTLCache
+from src.common.rate_limit import AsyncTokenBucket
+from src.scoring import service
+from src.scoring.service import NTSBService
+
+
+class FakeClock:
+	def __init__(self):
+		self.now = 1000.0
+
+	def __call__(self):
+		return self.now
+
+class FakeResponse:
+	status_code = 200
+	headers = {}
+
+	def __init__(self, payload):
+		self.content = orjson.dumps(payload)
+
+	def raise_for_status(self):
+		pass
+
+class FakeClient:
+	def __init__(self, payload):
+		self.payload = payload
+		self.calls = 0
+
+	async def post(self, url, **kwargs):
+		self.calls += 1
+		await asyncio.sleep(0)
+		return FakeResponse(self.payload)
+
+@pytest.fixture
+def ntsb(monkeypatch):
+	clock = FakeClock()
+	client = FakeClient({"Results": [{"Fields": []}]})
+
+	async def no_downloads(raw_data, operator_name):
+		return None
+
+	monkeypatch.setattr(service, "_ntsb_cache", TTLCache(maxsize=8, timer=clock))
+	monkeypatch.setattr(service, "NTSB_RATE_LIMIT", AsyncTokenBucket(1000))
+	monkeypatch.setattr(service, "get_ntsb_http_client", lambda: client)
+	monkeypatch.setattr(NTSBService, "_download_incident_pdfs", staticmethod(no_downloads))
+	return clock, client
+
+def test_query_miss_then_hit(ntsb):
+	clock, client = ntsb
+	assert NTSBService.cache_status("Acme Air") == "miss"
+	first = asyncio.run(NTSBService.query_ntsb_incidents("Acme Air"))
+	second = asyncio.run(NTSBService.query_ntsb_incidents("ACME AIR"))
+	assert client.calls == 1
+	assert second is first
+	assert NTSBService.cache_status("acme air") == "hit"
+
+def test_query_after_expiry_refetches(ntsb):
+	clock, client = ntsb
+	asyncio.run(NTSBService.query_ntsb_incidents("Acme Air"))
+	clock.now += service.NTSB_CACHE_TTL
+	assert NTSBService.cache_status("Acme Air") == "miss"
+	asyncio.run(NTSBService.query_ntsb_incidents("Acme Air"))
+	assert client.calls == 2
+
+def test_empty_results_use_negative_ttl(ntsb):
+	clock, client = ntsb
+	client.payload = {"Results": []}
+	asyncio.run(NTSBService.query_ntsb_incidents("Nobody Air"))
+	clock.now += service.NTSB_CACHE_TTL
+	assert NTSBService.cache_status("Nobody Air") == "neg"
+
+def test_force_refresh_bypasses_cache(ntsb):
+	clock, client = ntsb
+	asyncio.run(NTSBService.query_ntsb_incidents("Acme Air"))
+	asyncio.run(NTSBService.query_ntsb_incidents("Acme Air", force_refresh=True))
+	assert client.calls == 2
+
+def test_concurrent_misses_share_one_query(ntsb):
+	clock, client = ntsb
+
+	async def main():
+		await asyncio.gather(
+			*(NTSBService.query_ntsb_incidents("Acme Air") for _ in range(5))
+		)
+
+	asyncio.run(main())
+	assert client.calls == 1
+	assert len(service._ntsb_locks) == 0
+
+def test_cache_is_bounded(ntsb, monkeypatch):
+	clock, client = ntsb
+	monkeypatch.setattr(service, "_ntsb_cache", TTLCache(maxsize=2, timer=clock))
+	for name in ("A Air", "B Air", "C Air"):
+		asyncio.run(NTSBService.query_ntsb_incidents(name))
+	assert len(service._ntsb_cache) == 2
+	# The oldest operator was evicted and is queried again
+	assert NTSBService.cache_status("A Air") == "miss"
+	asyncio.run(NTSBService.query_ntsb_incidents("A Air"))
+	assert client.calls == 4
+
+def test_default_cache_bound():
+	assert service._ntsb_cache.maxsize == service.NTSB_CACHE_MAXSIZE
@@ -0,0 +1,64 @@
+# tests/scoring/test_ntsb_pdf_download.py
+import io
+import os
+from urllib3.exceptions import ProtocolError
+from src.scoring import service
+from src.scoring.service import NTSBService
+
+
+class FailingRaw(io.RawIOBase):
+	"""Yields one chunk, then drops the connection."""
+
+	def __init__(self):
+		self.sent = False
+		self.decode_content = False
+
+	def readable(self):
+		return True
+
+	def readinto(self, buffer):
+		if self.sent:
+			raise ProtocolError("Connection broken: connection reset")
+		self.sent = True
+		buffer[:4] = b"%PDF"
+		return 4
+
+class FakeStreamResponse:
+	def __init__(self, raw):
+		self.raw = raw
+		self.headers = {}
+
+	def raise_for_status(self):
+		pass
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, *exc):
+		return False
+
+class FakeSession:
+	def __init__(self, raw):
+		self.raw = raw
+
+	def get(self, url, **kwargs):
+		return FakeStreamResponse(self.raw)
+
+def test_download_success_leaves_only_report(tmp_path, monkeypatch):
+	monkeypatch.setattr(service, "get_ntsb_pdf_session", lambda: FakeSession(io.BytesIO(b"%PDF-1.7")))
+	assert NTSBService.download_ntsb_pdf("ERA22LA001", str(tmp_path), "Acme Air")
+	assert os.listdir(tmp_path) == ["ntsb_report_ERA22LA001.pdf"]
+
+def test_failed_download_removes_partial_file(tmp_path, monkeypatch):
+	monkeypatch.setattr(service, "get_ntsb_pdf_session", lambda: FakeSession(FailingRaw()))
+	assert not NTSBService.download_ntsb_pdf("ERA22LA001", str(tmp_path), "Acme Air")
+	assert os.listdir(tmp_path) == []
+
+def test_download_logs_progress(tmp_path, monkeypatch, caplog):
+	body = b"x" * (3 * service.NTSB_PDF_PROGRESS_STEP)
+	monkeypatch.setattr(service, "get_ntsb_pdf_session", lambda: FakeSession(io.BytesIO(body)))
+	with caplog.at_level("DEBUG", logger=service.__name__):
+		assert NTSBService.download_ntsb_pdf("ERA22LA001", str(tmp_path), "Acme Air")
+	progress = [r for r in caplog.records if "bytes" in r.getMessage() and "NTSB report" in r.getMessage()]
+	assert len(progress) == 3
+	assert (tmp_path / "ntsb_report_ERA22LA001.pdf").stat().st_size == len(body)
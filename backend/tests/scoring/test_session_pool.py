@@ -0,0 +1,100 @@
+# tests/scoring/test_session_pool.py
+import asyncio
+import pytest
+from types import SimpleNamespace
+from src.scoring import ucc_service
+from src.scoring.ucc_service import BrowserbaseSessionPool
+
+
+class FakeSessions:
+	def __init__(self):
+		self.released = []
+
+	def update(self, session_id, **kwargs):
+		self.released.append(session_id)
+
+class FakeBrowserbase:
+	def __init__(self, api_key=None):
+		self.sessions = FakeSessions()
+
+@pytest.fixture
+def created(monkeypatch):
+	created = []
+
+	async def fake_create(bb, **kwargs):
+		# Yield so concurrent acquires interleave while creating
+		await asyncio.sleep(0.01)
+		session = SimpleNamespace(id=f"session-{len(created)}")
+		created.append(session.id)
+		return session
+
+	monkeypatch.setattr(ucc_service, "Browserbase", FakeBrowserbase)
+	monkeypatch.setattr(ucc_service, "create_browserbase_session", fake_create)
+	return created
+
+def test_concurrent_acquires_create_at_most_size_sessions(created):
+	async def main():
+		pool = BrowserbaseSessionPool(size=2)
+
+		async def use():
+			session_id = await pool.acquire()
+			await asyncio.sleep(0)
+			await pool.release(session_id, {"status": "success", "states_processed": 1})
+			return session_id
+
+		return await asyncio.gather(*(use() for _ in range(8)))
+
+	used = asyncio.run(main())
+	assert len(created) == 2
+	assert set(used) == set(created)
+
+def test_failed_create_frees_the_slot(created, monkeypatch):
+	real_create = ucc_service.create_browserbase_session
+	attempts = []
+
+	async def flaky_create(bb, **kwargs):
+		attempts.append(1)
+		if len(attempts) == 1:
+			raise RuntimeError("Browserbase unavailable")
+		return await real_create(bb, **kwargs)
+
+	monkeypatch.setattr(ucc_service, "create_browserbase_session", flaky_create)
+
+	async def main():
+		pool = BrowserbaseSessionPool(size=1)
+		with pytest.raises(RuntimeError):
+			await pool.acquire()
+		return await pool.acquire()
+
+	assert asyncio.run(main()) == "session-0"
+	assert created == ["session-0"]
+
+def test_errored_session_is_released(created):
+	async def main():
+		pool = BrowserbaseSessionPool(size=1)
+		session_id = await pool.acquire()
+		await pool.release(session_id, {"status": "error"})
+		return pool, session_id
+
+	pool, session_id = asyncio.run(main())
+	assert pool._bb.sessions.released == [session_id]
+
+def test_session_creation_limit_works_across_event_loops(monkeypatch):
+	monkeypatch.setattr(ucc_service, "BROWSERBASE_MAX_CONCURRENCY", 1)
+
+	class CreateOnlySessions:
+		def create(self, **kwargs):
+			return SimpleNamespace(id="session")
+
+	bb = SimpleNamespace(sessions=CreateOnlySessions())
+
+	async def contend():
+		# The second creation waits on the semaphore while the first runs
+		return await asyncio.gather(
+			ucc_service.create_browserbase_session(bb),
+			ucc_service.create_browserbase_session(bb),
+		)
+
+	# verify_ucc_filings_sync runs every call on a new event loop
+	assert len(asyncio.run(contend())) == 2
+	assert len(asyncio.run(contend())) == 2
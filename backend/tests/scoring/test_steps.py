@@ -0,0 +1,60 @@
+# tests/scoring/test_steps.py
+import asyncio
+from src.scoring import steps
+
+
+class BrokenCalculator:
+	llm_client = None
+
+	async def calculate_trust_score(self, fleet_data, tail_data):
+		raise RuntimeError("calculator down")
+
+def test_ntsb_score_for_counts_incidents():
+	assert steps.ntsb_score_for([], None) == 100
+	assert steps.ntsb_score_for([{}] * 3, None) == 85
+	assert steps.ntsb_score_for([{}] * 40, None) == 0
+
+def test_ntsb_score_for_failed_query():
+	assert steps.ntsb_score_for([], "timeout") == 100.0
+
+def test_trust_score_falls_back_to_ntsb_score(monkeypatch):
+	monkeypatch.setattr(steps, "get_shared_calculator", lambda: BrokenCalculator())
+	result, error = asyncio.run(
+		steps.run_trust_score_step("Acme Air", [], {}, 85, 10.0, "GOLD", None)
+	)
+	assert error == "calculator down"
+	assert result["fallback"] is True
+	assert result["trust_score"] == result["fleet_score"] == result["tail_score"] == 85
+
+def test_ucc_needs_incidents_only_without_state_sources(monkeypatch):
+	monkeypatch.setattr(steps, "UCC_READY_STATES", ["CA"])
+	assert not steps.ucc_needs_ntsb_incidents(None)
+	monkeypatch.setattr(steps, "UCC_READY_STATES", [])
+	assert steps.ucc_needs_ntsb_incidents(None)
+	assert not steps.ucc_needs_ntsb_incidents("Oregon")
+
+def run_both_steps(monkeypatch, ready_states):
+	monkeypatch.setattr(steps, "UCC_READY_STATES", ready_states)
+	ucc_incidents = []
+
+	async def fake_ntsb(operator_name, force_refresh=False):
+		return {"Results": []}, [{"state": "Texas"}], None
+
+	async def fake_ucc(operator_name, incidents, *args):
+		ucc_incidents.append(incidents)
+		return {"status": "success"}, None
+
+	monkeypatch.setattr(steps, "run_ntsb_step", fake_ntsb)
+	monkeypatch.setattr(steps, "run_ucc_step", fake_ucc)
+	outcome = asyncio.run(steps.run_ntsb_and_ucc_steps("Acme Air", "TX", None, None))
+	return outcome, ucc_incidents
+
+def test_ucc_gets_incidents_when_they_pick_states(monkeypatch):
+	outcome, ucc_incidents = run_both_steps(monkeypatch, [])
+	assert ucc_incidents == [[{"state": "Texas"}]]
+	assert outcome[1] == [{"state": "Texas"}]
+
+def test_ucc_runs_without_incidents_for_ready_states(monkeypatch):
+	outcome, ucc_incidents = run_both_steps(monkeypatch, ["CA"])
+	assert ucc_incidents == [[]]
+	assert outcome[3] == {"status": "success"}
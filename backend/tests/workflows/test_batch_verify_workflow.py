@@ -0,0 +1,181 @@
+# tests/workflows/test_batch_verify_workflow.py
+import asyncio
+import pytest
+from types import SimpleNamespace
+from src.common import config
+from src.workflows import batch_verify_workflow as workflow
+from src.workflows.batch_verify_workflow import BatchVerifyInput, save_trust_scores_bulk
+
+
+class FakeResult:
+	def __init__(self, rows):
+		self.rows = rows
+
+	def all(self):
+		return self.rows
+
+class FakeTransaction:
+	async def __aenter__(self):
+		return self
+
+	async def __aexit__(self, *exc):
+		return False
+
+class FakeSession:
+	"""Records executed statements; lookups return the configured operator rows."""
+
+	def __init__(self, db):
+		self.db = db
+
+	async def __aenter__(self):
+		if self.db.failures:
+			self.db.failures -= 1
+			raise ConnectionError("connection reset")
+		return self
+
+	async def __aexit__(self, *exc):
+		return False
+
+	def begin(self):
+		return FakeTransaction()
+
+	async def execute(self, statement, params=None):
+		self.db.executed.append((statement, params))
+		return FakeResult(self.db.rows)
+
+class FakeDatabase:
+	def __init__(self, rows=(), failures=0):
+		self.rows = list(rows)
+		self.failures = failures
+		self.executed = []
+		self.sessions = 0
+
+	def __call__(self):
+		self.sessions += 1
+		return FakeSession(self)
+
+@pytest.fixture
+def db(monkeypatch):
+	db = FakeDatabase()
+	monkeypatch.setattr(config, "AsyncSessionLocal", db)
+
+	async def no_sleep(seconds):
+		return None
+
+	monkeypatch.setattr(workflow.asyncio, "sleep", no_sleep)
+	return db
+
+def pending_save(operator_name, operator_id=None):
+	return {
+		"operator_name": operator_name,
+		"operator_id": operator_id,
+		"trust_score_result": {"trust_score": 80, "fleet_score": 75},
+		"ntsb_result": {"score": 90, "total_incidents": 2, "incidents": []},
+		"ucc_result": {"status": "success", "states_processed": 1},
+	}
+
+
+def test_requested_operator_ids_empty():
+	assert BatchVerifyInput().requested_operator_ids() == []
+
+def test_requested_operator_ids_single_id():
+	input_data = BatchVerifyInput(operator_id="a")
+	assert input_data.requested_operator_ids() == ["a"]
+
+def test_requested_operator_ids_list_only():
+	input_data = BatchVerifyInput(operator_ids=["a", "b"])
+	assert input_data.requested_operator_ids() == ["a", "b"]
+
+def test_requested_operator_ids_merges_single_and_list():
+	input_data = BatchVerifyInput(operator_id="c", operator_ids=["a", "b"])
+	assert input_data.requested_operator_ids() == ["a", "b", "c"]
+
+def test_requested_operator_ids_deduplicates():
+	input_data = BatchVerifyInput(operator_id="a", operator_ids=["a", "b", "b"])
+	assert input_data.requested_operator_ids() == ["a", "b"]
+
+def test_save_trust_scores_bulk_empty(db):
+	assert asyncio.run(save_trust_scores_bulk([])) == set()
+	assert db.sessions == 0
+
+def test_save_trust_scores_bulk_known_ids_skip_lookup(db):
+	saved = asyncio.run(save_trust_scores_bulk([
+		pending_save("Acme Air", "id-1"),
+		pending_save("Beta Jets", "id-2"),
+	]))
+	assert saved == {"Acme Air", "Beta Jets"}
+	# One multi-row INSERT and one bulk UPDATE, no id lookup
+	assert len(db.executed) == 2
+	trust_score_records = db.executed[0][1]
+	operator_updates = db.executed[1][1]
+	assert [r["operator_id"] for r in trust_score_records] == ["id-1", "id-2"]
+	assert [u["operator_id"] for u in operator_updates] == ["id-1", "id-2"]
+
+def test_save_trust_scores_bulk_looks_up_missing_ids(db):
+	db.rows = [SimpleNamespace(name="Beta Jets", operator_id="id-2")]
+	saved = asyncio.run(save_trust_scores_bulk([
+		pending_save("Acme Air", "id-1"),
+		pending_save("Beta Jets"),
+		pending_save("Unknown Air"),
+	]))
+	assert saved == {"Acme Air", "Beta Jets"}
+	assert len(db.executed) == 3
+	assert [r["operator_id"] for r in db.executed[1][1]] == ["id-1", "id-2"]
+
+def test_save_trust_scores_bulk_retries_transient_errors(db):
+	db.failures = 2
+	saved = asyncio.run(save_trust_scores_bulk([pending_save("Acme Air", "id-1")]))
+	assert saved == {"Acme Air"}
+	assert db.sessions == 3
+
+def test_save_trust_scores_bulk_gives_up_after_max_retries(db):
+	db.failures = 3
+	saved = asyncio.run(
+		save_trust_scores_bulk([pending_save("Acme Air", "id-1")], max_retries=3)
+	)
+	assert saved == set()
+	assert db.sessions == 3
+
+@pytest.fixture
+def written(monkeypatch):
+	written = []
+
+	async def fake_save(batch, max_retries=3):
+		written.append([entry["operator_name"] for entry in batch])
+		return {entry["operator_name"] for entry in batch}
+
+	monkeypatch.setattr(workflow, "save_trust_scores_bulk", fake_save)
+	return written
+
+def test_save_queue_writes_single_save_after_delay(written):
+	async def main():
+		queue = workflow.TrustScoreSaveQueue(batch_size=10, max_delay=0.05)
+		queue.add(pending_save("Acme Air"))
+		await asyncio.sleep(0.01)
+		assert written == []
+		# No further results arrive - the timer alone flushes the save
+		await asyncio.sleep(0.1)
+		assert written == [["Acme Air"]]
+		return await queue.drain()
+
+	assert asyncio.run(main()) == {"Acme Air"}
+
+def test_save_queue_writes_full_batch_immediately(written):
+	async def main():
+		queue = workflow.TrustScoreSaveQueue(batch_size=2, max_delay=60)
+		queue.add(pending_save("Acme Air"))
+		queue.add(pending_save("Beta Jets"))
+		await asyncio.sleep(0)
+		assert written == [["Acme Air", "Beta Jets"]]
+		return await queue.drain()
+
+	assert asyncio.run(main()) == {"Acme Air", "Beta Jets"}
+
+def test_save_queue_drain_writes_remaining_saves(written):
+	async def main():
+		queue = workflow.TrustScoreSaveQueue(batch_size=10, max_delay=60)
+		queue.add(pending_save("Acme Air"))
+		return await queue.drain()
+
+	assert asyncio.run(main()) == {"Acme Air"}
+	assert written == [["Acme Air"]]